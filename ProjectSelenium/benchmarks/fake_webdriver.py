@@ -0,0 +1,158 @@
+# benchmarks/fake_webdriver.py
+import struct
+import time
+import zlib
+
+
+def make_png(width=1920, height=1080, shade=0xF0):
+    """PNG RGB valid (warna rata) tanpa Pillow, dipakai sebagai hasil screenshot palsu."""
+    def chunk(kind, data):
+        body = kind + data
+        return struct.pack(">I", len(data)) + body + struct.pack(">I", zlib.crc32(body) & 0xFFFFFFFF)
+
+    row = b"\x00" + bytes([shade, shade, shade]) * width
+    raw = zlib.compress(row * height, 6)
+    header = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    return b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", header) + chunk(b"IDAT", raw) + chunk(b"IEND", b"")
+
+
+class Latency:
+    """
+    Latency palsu per jenis command (detik). Default 0 = murni overhead framework.
+    find: find_element, action: click/send_keys/clear/execute, navigate: get(),
+    screenshot: get_screenshot_as_png / element.screenshot_as_png
+    """
+
+    def __init__(self, find=0.0, action=0.0, navigate=0.0, screenshot=0.0):
+        self.find = find
+        self.action = action
+        self.navigate = navigate
+        self.screenshot = screenshot
+
+    @staticmethod
+    def sleep(seconds):
+        if seconds:
+            time.sleep(seconds)
+
+
+class FakeElement:
+    """Elemen palsu: selalu tampil + enabled, text tetap (untuk keyword assert)."""
+
+    def __init__(self, driver, by, value):
+        self._driver = driver
+        self.id = f"fake-{by}-{value}"
+        self.tag_name = "input"
+        self.text = driver.element_text
+        self.rect = {"x": 10, "y": 10, "width": 200, "height": 40}
+
+    def is_displayed(self):
+        return True
+
+    def is_enabled(self):
+        return True
+
+    def is_selected(self):
+        return False
+
+    def get_attribute(self, name):
+        return None
+
+    get_dom_attribute = get_attribute
+    get_property = get_attribute
+
+    def click(self):
+        self._driver.counts["click"] += 1
+        Latency.sleep(self._driver.latency.action)
+
+    def clear(self):
+        Latency.sleep(self._driver.latency.action)
+
+    def send_keys(self, *values):
+        self._driver.counts["send_keys"] += 1
+        Latency.sleep(self._driver.latency.action)
+
+    def find_elements(self, by=None, value=None):
+        return [FakeElement(self._driver, by, value)]
+
+    @property
+    def screenshot_as_png(self):
+        self._driver.counts["screenshot"] += 1
+        Latency.sleep(self._driver.latency.screenshot)
+        return self._driver.element_png
+
+
+class FakeWebDriver:
+    """
+    WebDriver in-process tanpa browser, cukup untuk semua keyword GenericKeywords
+    (navigate/click/type/assert/hover/js_click/drag_drop/upload_file) dan capture.
+    """
+
+    def __init__(self, latency=None, element_text="OK", screenshot_size=(1920, 1080)):
+        self.latency = latency or Latency()
+        self.element_text = element_text
+        self.current_url = "about:blank"
+        self.window_handles = ["main"]
+        self.cookies = []
+        self.page_png = make_png(*screenshot_size)
+        self.element_png = make_png(200, 40, 0xC0)
+        self.counts = {"find": 0, "click": 0, "send_keys": 0, "get": 0, "screenshot": 0, "script": 0}
+
+    # --- navigasi & lookup ---
+    def get(self, url):
+        self.counts["get"] += 1
+        Latency.sleep(self.latency.navigate)
+        self.current_url = url
+
+    def refresh(self):
+        self.get(self.current_url)
+
+    def find_element(self, by=None, value=None):
+        self.counts["find"] += 1
+        Latency.sleep(self.latency.find)
+        return FakeElement(self, by, value)
+
+    def find_elements(self, by=None, value=None):
+        return [self.find_element(by, value)]
+
+    # --- script / actions ---
+    def execute_script(self, script, *args):
+        self.counts["script"] += 1
+        Latency.sleep(self.latency.action)
+        if "getBoundingClientRect" in script:
+            return [10, 10, 200, 40, 1]
+        if "localStorage" in script and not args:
+            return ["about:blank", {}, {}]
+        return None
+
+    def execute(self, command, params=None):
+        # dipakai ActionChains (W3C actions)
+        Latency.sleep(self.latency.action)
+        return {"value": None}
+
+    # --- capture ---
+    def get_screenshot_as_png(self):
+        self.counts["screenshot"] += 1
+        Latency.sleep(self.latency.screenshot)
+        return self.page_png
+
+    def save_screenshot(self, path):
+        with open(path, "wb") as f:
+            f.write(self.get_screenshot_as_png())
+        return True
+
+    # --- cookies (SessionStore login_once / restore_session) ---
+    def get_cookies(self):
+        return list(self.cookies)
+
+    def add_cookie(self, cookie):
+        self.cookies.append(dict(cookie))
+
+    # --- lifecycle (kompatibel DriverPool) ---
+    def implicitly_wait(self, seconds):
+        pass
+
+    def delete_all_cookies(self):
+        self.cookies.clear()
+
+    def quit(self):
+        pass
@@ -0,0 +1,88 @@
+# benchmarks/heavy_site.py
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from benchmarks.fake_webdriver import make_png
+
+
+class HeavySite:
+    """
+    HTTP server lokal (127.0.0.1, port acak) yang meniru halaman berat:
+    banyak gambar besar, font, script "analytics" dan "iklan", masing-masing dengan delay.
+    Dipakai untuk mengukur efek GlobalData.Network (blocklist / throttle) tanpa internet.
+
+        with HeavySite(images=20, asset_delay=0.2) as site:
+            driver.get(site.url)
+    """
+
+    def __init__(self, images=20, image_size=(1600, 1200), asset_delay=0.2):
+        self.images = images
+        self.asset_delay = asset_delay
+        self.png = make_png(*image_size)
+        self.font = b"\0" * 200 * 1024
+        self.hits = {}
+        self._server = None
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def page(self):
+        images = "\n".join(f'<img src="/img/{i}.png" width="160">' for i in range(self.images))
+        return f"""<!doctype html>
+<html><head>
+<title>Heavy</title>
+<style>@font-face {{font-family: Heavy; src: url(/fonts/heavy.woff2);}} body {{font-family: Heavy;}}</style>
+<script src="/analytics/track.js"></script>
+</head><body>
+<h1 id="title">Heavy page</h1>
+<script src="/ads/banner.js"></script>
+{images}
+</body></html>""".encode()
+
+    def _route(self, path):
+        """path -> (content-type, body, delay)"""
+        if path == "/":
+            return "text/html", self.page(), 0
+        if path.startswith("/img/"):
+            return "image/png", self.png, self.asset_delay
+        if path.startswith("/fonts/"):
+            return "font/woff2", self.font, self.asset_delay
+        if path.startswith(("/analytics/", "/ads/")):
+            return "application/javascript", b"window.__tracked = true;", self.asset_delay
+        return None
+
+    def __enter__(self):
+        site = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                site.hits[self.path] = site.hits.get(self.path, 0) + 1
+                route = site._route(self.path)
+                if route is None:
+                    self.send_error(404)
+                    return
+                content_type, body, delay = route
+                if delay:
+                    time.sleep(delay)
+                self.send_response(200)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.send_header("Cache-Control", "no-store")
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._thread = threading.Thread(target=self._server.serve_forever, name="heavy-site", daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._server.shutdown()
+        self._server.server_close()
@@ -0,0 +1,438 @@
+# benchmarks/run_benchmarks.py
+"""
+Benchmark overhead framework (tanpa browser) pakai FakeWebDriver.
+
+Jalankan dari folder ProjectSelenium:
+    python -m benchmarks.run_benchmarks                      # semua benchmark, ukuran default
+    python -m benchmarks.run_benchmarks --only keywords,loader --sizes 1000
+    python -m benchmarks.run_benchmarks --out bench_new.json --compare bench_old.json
+    python -m benchmarks.run_benchmarks --only network --network-profiles none,fast-3g
+
+Benchmark:
+- keywords : execute_testcase per step/case (screenshot never vs every-step)
+- feature  : load CSV + compile + execute + event log + merge untuk feature 1k/10k case
+- loader   : throughput DataLoader YAML/CSV/XLSX (cold parse vs DataCache warm)
+- pdf      : waktu build PDF dari snapshot
+- network  : (opt-in, butuh Chrome/Edge asli) driver.get halaman berat di server lokal
+             tanpa / dengan GlobalData.Network blocklist dan profil throttle
+
+Hasil JSON: {"meta": {...}, "results": {"<nama>": {"<metrik>": angka}}}.
+Metrik berakhiran _s / _ms / _us = waktu (lebih kecil lebih baik), _per_s = throughput.
+"""
+import argparse
+import contextlib
+import csv
+import io
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+import yaml
+
+from benchmarks.fake_webdriver import FakeWebDriver, Latency, make_png
+from benchmarks.heavy_site import HeavySite
+from core.config_registry import ConfigRegistry
+from core.data_cache import DataCache
+from core.data_loader import DataLoader
+from core.event_log import EventLog
+from core.generic_keywords import GenericKeywords
+from core.result_tracker import ResultTracker
+from core.screenshot_writer import ScreenshotWriter
+
+BENCH_LOCATORS = {
+    "field": {"LocatorType": "id", "LocatorValue": "email", "Description": "input"},
+    "button": {"LocatorType": "css", "LocatorValue": "button.submit", "Description": "tombol"},
+    "label": {"LocatorType": "xpath", "LocatorValue": "//p[@id='msg']", "Description": "pesan"},
+}
+CSV_COLUMNS = ("CaseID", "CaseTitle", "ScenarioType", "Run", "StepTitle", "Description",
+               "Action", "Locator", "TestData", "Expected")
+
+
+# -------------------- Data sintetis --------------------
+def build_case(index, steps=5, screenshot=None):
+    """1 case: navigate lalu siklus type -> click -> assert (semua lolos di FakeWebDriver)."""
+    cycle = (
+        ("type", "field", f"user{index}@mail.test", None),
+        ("click", "button", None, None),
+        ("assert", "label", None, "OK"),
+    )
+    test_steps = [{"Title": "Open page", "Description": "buka halaman", "Action": "navigate",
+                   "Locator": None, "TestData": f"http://fake.local/{index}", "Expected": None}]
+    for n in range(1, steps):
+        action, locator, data, expected = cycle[(n - 1) % len(cycle)]
+        test_steps.append({"Title": f"Step {n} {action}", "Description": f"{action} {locator}",
+                           "Action": action, "Locator": locator, "TestData": data, "Expected": expected})
+    case = {"CaseID": f"TC{index:06d}", "Title": f"Case {index}", "ScenarioType": "Positive",
+            "Run": True, "TestSteps": test_steps}
+    if screenshot:
+        case["Screenshot"] = screenshot
+    return case
+
+
+def write_feature(folder, cases, fmt):
+    """Tulis testcases.<fmt> + locators.yaml ke folder."""
+    os.makedirs(folder, exist_ok=True)
+    with open(os.path.join(folder, "locators.yaml"), "w", encoding="utf-8") as f:
+        yaml.safe_dump({"locators": BENCH_LOCATORS}, f)
+
+    rows = (
+        (c["CaseID"], c["Title"], c["ScenarioType"], "TRUE", s["Title"], s["Description"],
+         s["Action"], s["Locator"] or "", s["TestData"] or "", s["Expected"] or "")
+        for c in cases for s in c["TestSteps"]
+    )
+    path = os.path.join(folder, f"testcases.{fmt}")
+    if fmt == "yaml":
+        with open(path, "w", encoding="utf-8") as f:
+            yaml.safe_dump({"test_cases": cases}, f, sort_keys=False)
+    elif fmt == "csv":
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(CSV_COLUMNS)
+            writer.writerows(rows)
+    elif fmt == "xlsx":
+        import openpyxl
+        wb = openpyxl.Workbook(write_only=True)
+        ws = wb.create_sheet()
+        ws.append(CSV_COLUMNS)
+        for row in rows:
+            ws.append(row)
+        wb.save(path)
+    return path
+
+
+# -------------------- Helper --------------------
+@contextlib.contextmanager
+def quiet():
+    """Matikan print [TRACKER]/[ACTION] selama pengukuran (tetap dihitung sebagai overhead)."""
+    with contextlib.redirect_stdout(io.StringIO()) as buf:
+        yield buf
+
+
+def best_of(repeat, fn):
+    """Jalankan fn() beberapa kali, return (waktu tercepat, hasil terakhir)."""
+    best, result = None, None
+    for _ in range(max(1, repeat)):
+        started = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def run_cases(cases, run_dir, latency=None, event_log=None, screenshot_size=(1920, 1080)):
+    """Execute semua case di 1 FakeWebDriver, return jumlah step."""
+    tracker = ResultTracker()
+    keywords = GenericKeywords(FakeWebDriver(latency=latency, screenshot_size=screenshot_size))
+    steps = 0
+    with quiet():
+        tracker.reset()
+        if event_log is not None:
+            tracker.attach_event_log(event_log)
+        for case in cases:
+            plan = keywords.compile_testcase(case, BENCH_LOCATORS)
+            keywords.execute_testcase(plan, BENCH_LOCATORS, run_dir)
+            steps += len(plan.steps)
+        ScreenshotWriter().flush()
+        tracker.close_event_log()
+    return steps
+
+
+# -------------------- Benchmark --------------------
+def bench_keywords(workdir, args):
+    results = {}
+    for mode in ("never", "every-step"):
+        cases = [build_case(i, args.steps, screenshot=mode) for i in range(args.keyword_cases)]
+        run_dir = os.path.join(workdir, f"keywords_{mode}")
+
+        def run():
+            shutil.rmtree(run_dir, ignore_errors=True)
+            return run_cases(cases, run_dir, args.latency, screenshot_size=args.screenshot_size)
+
+        elapsed, steps = best_of(args.repeat, run)
+        results[f"keywords_{mode}"] = {
+            "cases": len(cases),
+            "steps": steps,
+            "total_s": elapsed,
+            "per_step_us": elapsed / steps * 1e6,
+            "per_case_ms": elapsed / len(cases) * 1e3,
+        }
+    return results
+
+
+def bench_feature(workdir, args):
+    results = {}
+    for size in args.sizes:
+        folder = os.path.join(workdir, f"feature_{size}")
+        write_feature(folder, [build_case(i, args.steps) for i in range(size)], "csv")
+        run_root = os.path.join(folder, "run")
+        os.makedirs(run_root, exist_ok=True)
+
+        with quiet():
+            started = time.perf_counter()
+            cases = DataLoader.load_testcases(folder)["test_cases"]
+            load_s = time.perf_counter() - started
+        for case in cases:
+            case["Screenshot"] = args.feature_screenshot   # CSV tidak punya kolom Screenshot per case
+
+        started = time.perf_counter()
+        steps = run_cases(cases, run_root, args.latency, EventLog.for_process(run_root), args.screenshot_size)
+        execute_s = time.perf_counter() - started
+
+        from reports.result_merge import merge_run
+        with quiet():
+            started = time.perf_counter()
+            merged = merge_run(run_root)
+            merged_cases = sum(1 for _ in merged["cases"])
+            merge_s = time.perf_counter() - started
+
+        total = load_s + execute_s + merge_s
+        results[f"feature_{size}"] = {
+            "cases": len(cases),
+            "steps": steps,
+            "merged_cases": merged_cases,
+            "load_s": load_s,
+            "execute_s": execute_s,
+            "merge_s": merge_s,
+            "total_s": total,
+            "per_case_ms": total / len(cases) * 1e3,
+            "per_step_us": execute_s / steps * 1e6,
+        }
+    return results
+
+
+def bench_loader(workdir, args):
+    results = {}
+    cases = [build_case(i, args.steps) for i in range(args.loader_cases)]
+    rows = sum(len(c["TestSteps"]) for c in cases)
+    for fmt in ("yaml", "csv", "xlsx"):
+        folder = os.path.join(workdir, f"loader_{fmt}")
+        try:
+            write_feature(folder, cases, fmt)
+        except ImportError as e:
+            results[f"loader_{fmt}"] = {"skipped": str(e)}
+            continue
+
+        with quiet():
+            DataCache.enabled = False
+            cold_s, _ = best_of(args.repeat, lambda: DataLoader.load_testcases(folder))
+            DataCache.enabled = True
+            DataLoader.load_testcases(folder)   # isi cache
+            warm_s, _ = best_of(args.repeat, lambda: DataLoader.load_testcases(folder))
+
+        results[f"loader_{fmt}"] = {
+            "cases": len(cases),
+            "rows": rows,
+            "cold_s": cold_s,
+            "warm_s": warm_s,
+            "cold_rows_per_s": rows / cold_s,
+            "warm_rows_per_s": rows / warm_s,
+        }
+    return results
+
+
+def bench_pdf(workdir, args):
+    try:
+        from reports.pdf_report import generate_pdf_report
+    except ImportError as e:
+        return {"pdf": {"skipped": str(e)}}
+
+    image = os.path.join(workdir, "shot.png")
+    with open(image, "wb") as f:
+        f.write(make_png(*args.screenshot_size))
+    cases = []
+    for i in range(args.pdf_cases):
+        case = build_case(i, args.steps)
+        cases.append({
+            "case_id": case["CaseID"], "title": case["Title"], "scenario_type": case["ScenarioType"],
+            "steps": [{"step_id": n, "title": s["Title"], "description": s["Description"], "image": image,
+                       "status": "passed", "duration": 0.0, "timings": None}
+                      for n, s in enumerate(case["TestSteps"], start=1)],
+        })
+    steps = sum(len(c["steps"]) for c in cases)
+    snapshot = {
+        "meta": {"project_name": "Bench", "website": "http://fake.local", "author": "bench", "tools": "Selenium"},
+        "cases": cases,
+        "totals": {"passed": steps, "failed": 0, "warning": 0, "done": steps, "total": steps},
+    }
+    output = os.path.join(workdir, "pdf", "bench.pdf")
+    with quiet():
+        elapsed, _ = best_of(args.repeat, lambda: generate_pdf_report(output, snapshot))
+    return {"pdf": {
+        "cases": len(cases),
+        "steps": steps,
+        "build_s": elapsed,
+        "per_step_ms": elapsed / steps * 1e3,
+        "size_kb": os.path.getsize(output) / 1024,
+    }}
+
+
+def bench_network(workdir, args):
+    """
+    Browser asli (GlobalData.Browser, headless) membuka halaman berat dari HeavySite:
+    baseline vs blocklist (image/font + analytics/ads) vs tiap --network-profiles.
+    """
+    from core.driver_factory import DriverFactory
+
+    block = {"Patterns": ["*/analytics/*", "*/ads/*"], "ResourceTypes": ["image", "font"]}
+    variants = [("baseline", {}), ("block", {"Block": block})]
+    variants += [(f"profile_{name}", {"Profile": name}) for name in args.network_profiles if name != "none"]
+
+    results = {}
+    with HeavySite(images=args.network_images, asset_delay=args.network_delay_ms / 1000) as site:
+        for name, network in variants:
+            globaldata = dict(ConfigRegistry.global_data(), Headless=True, Network=network)
+            try:
+                with quiet():
+                    driver = DriverFactory.create(globaldata)
+            except Exception as e:
+                return {"network": {"skipped": f"browser tidak bisa dibuat: {str(e).splitlines()[0]}"}}
+            try:
+                site.hits.clear()
+                elapsed, _ = best_of(args.repeat, lambda: driver.get(site.url))
+                results[f"network_{name}"] = {
+                    "load_s": elapsed,
+                    "requests_per_load": sum(site.hits.values()) / max(1, args.repeat),
+                }
+            finally:
+                driver.quit()
+    return results
+
+
+BENCHMARKS = {
+    "keywords": bench_keywords,
+    "feature": bench_feature,
+    "loader": bench_loader,
+    "pdf": bench_pdf,
+    "network": bench_network,
+}
+# butuh browser asli, cuma jalan kalau disebut di --only
+OPT_IN = ("network",)
+
+
+# -------------------- Output --------------------
+def _git_revision():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True, timeout=10).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def print_summary(results, stream=sys.stderr):
+    for name, metrics in results.items():
+        parts = [f"{k}={v:.3f}" if isinstance(v, float) else f"{k}={v}" for k, v in metrics.items()]
+        print(f"[BENCH] {name}: " + " ".join(parts), file=stream)
+
+
+def compare(results, baseline, threshold):
+    """
+    Bandingkan metrik waktu dengan baseline. Return jumlah regresi (lebih lambat > threshold).
+    """
+    regressions = 0
+    for name, metrics in results.items():
+        for key, value in metrics.items():
+            old = baseline.get(name, {}).get(key)
+            if not isinstance(value, (int, float)) or not isinstance(old, (int, float)) or not old:
+                continue
+            if key.endswith(("_s", "_ms", "_us")):
+                ratio = value / old             # > 1 = lebih lambat
+            elif key.endswith("_per_s"):
+                ratio = old / value if value else float("inf")
+            else:
+                continue
+            flag = "REGRESI" if ratio > 1 + threshold else "ok"
+            regressions += flag == "REGRESI"
+            print(f"[COMPARE] {name}.{key}: {old:.4g} -> {value:.4g} (x{ratio:.2f}) {flag}", file=sys.stderr)
+    return regressions
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark overhead ProjectSelenium dengan FakeWebDriver")
+    parser.add_argument("--only", default=",".join(b for b in BENCHMARKS if b not in OPT_IN),
+                        help="daftar benchmark, pisah koma (network harus disebut eksplisit)")
+    parser.add_argument("--sizes", default="1000,10000", help="jumlah case untuk benchmark feature")
+    parser.add_argument("--steps", type=int, default=5, help="step per case")
+    parser.add_argument("--keyword-cases", type=int, default=200)
+    parser.add_argument("--loader-cases", type=int, default=2000)
+    parser.add_argument("--pdf-cases", type=int, default=50)
+    parser.add_argument("--feature-screenshot", default="never", help="Screenshot mode untuk benchmark feature")
+    parser.add_argument("--screenshot-size", default="1920x1080")
+    parser.add_argument("--latency-ms", default="0,0,0,0",
+                        help="latency FakeWebDriver find,action,navigate,screenshot (ms); 0 = murni overhead")
+    parser.add_argument("--network-profiles", default="none,fast-3g",
+                        help="profil GlobalData.Network yang diukur benchmark network")
+    parser.add_argument("--network-images", type=int, default=20, help="jumlah gambar di halaman berat")
+    parser.add_argument("--network-delay-ms", type=float, default=200, help="delay server per asset")
+    parser.add_argument("--repeat", type=int, default=3, help="ambil waktu tercepat dari N kali")
+    parser.add_argument("--out", help="tulis hasil JSON ke file (default: stdout)")
+    parser.add_argument("--compare", help="file JSON hasil sebelumnya untuk dibandingkan")
+    parser.add_argument("--threshold", type=float, default=0.10, help="batas regresi (0.10 = 10%% lebih lambat)")
+    parser.add_argument("--keep", action="store_true", help="jangan hapus folder kerja sementara")
+    args = parser.parse_args(argv)
+    args.only = [b.strip() for b in args.only.split(",") if b.strip()]
+    args.sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+    args.network_profiles = [p.strip() for p in args.network_profiles.split(",") if p.strip()]
+    args.screenshot_size = tuple(int(v) for v in args.screenshot_size.lower().split("x"))
+    find, action, navigate, screenshot = (float(v) / 1000 for v in args.latency_ms.split(","))
+    args.latency = Latency(find, action, navigate, screenshot)
+    unknown = set(args.only) - set(BENCHMARKS)
+    if unknown:
+        parser.error(f"benchmark tidak dikenal: {', '.join(sorted(unknown))}")
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    workdir = tempfile.mkdtemp(prefix="ps_bench_")
+    # cache DataCache benchmark dipisah, .cache/datatest milik user tidak disentuh
+    DataCache.CACHE_DIR = os.path.join(workdir, "cache")
+    cache_enabled = DataCache.enabled
+
+    results = {}
+    try:
+        for name in args.only:
+            print(f"[BENCH] {name} ...", file=sys.stderr)
+            results.update(BENCHMARKS[name](workdir, args))
+    finally:
+        DataCache.enabled = cache_enabled
+        if args.keep:
+            print(f"[BENCH] Folder kerja: {workdir}", file=sys.stderr)
+        else:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "git": _git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "args": {k: v for k, v in vars(args).items() if k not in ("out", "compare", "latency")},
+        },
+        "results": results,
+    }
+    print_summary(results)
+
+    text = json.dumps(report, indent=2)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+        print(f"[BENCH] Hasil disimpan: {args.out}", file=sys.stderr)
+    else:
+        print(text)
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f).get("results", {})
+        if compare(results, baseline, args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
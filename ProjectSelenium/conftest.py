@@ -1,14 +1,28 @@
-import pytest, os, datetime, webbrowser   # [UPDATE-1] tambah import webbrowser
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service as ChromeService
-from selenium.webdriver.firefox.service import Service as FirefoxService   # [UPDATE-2] firefox support
-from selenium.webdriver.edge.service import Service as EdgeService         # [UPDATE-3] edge support
-from webdriver_manager.chrome import ChromeDriverManager
-from webdriver_manager.firefox import GeckoDriverManager                   # [UPDATE-4]
-from webdriver_manager.microsoft import EdgeChromiumDriverManager          # [UPDATE-5]
-from core.yaml_reader import YAMLReader
+import pytest, os, datetime
+from core.driver_factory import DriverFactory, DriverPool
+from core.driver_resolver import DriverResolver
+from core.config_registry import ConfigRegistry
+from core.data_loader import DataLoader
+from core.data_cache import DataCache
+from core.preflight import Preflight
+from core.screenshot_writer import ScreenshotWriter
+from core.result_tracker import ResultTracker
+from core.event_log import EventLog
+from core.history_store import HistoryRecorder
+from core.profiler import SessionProfiler
+from core.run_info import RunInfo
+from core.case_scheduler import CaseDurations, make_duration_scheduler, case_id_of
+from core.rerun_plan import RerunPlan
+from core.step_plan import resolve_ready
+from selenium.webdriver.support.ui import WebDriverWait
 
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+# error parse data (baris CSV pendek, kolom hilang, YAML rusak) -> gagal per feature, bukan INTERNALERROR
+LOAD_ERRORS = (ValueError, AttributeError, KeyError, TypeError)
 RUN_ROOT_KEY = pytest.StashKey[str]()   # [FIX] stash key buat run_root
+PROFILER_KEY = pytest.StashKey[SessionProfiler]()
+RERUN_KEY = pytest.StashKey[RerunPlan]()
+REPORTS_DIR = os.path.join(BASE_DIR, "reports", "capture")
 
 def pytest_addoption(parser):
     """
@@ -21,9 +35,77 @@ def pytest_addoption(parser):
         default=None,
         help="Nama feature yang akan dijalankan (misalnya: login, request, leave, dll.)"
     )
+    parser.addoption(
+        "--no_data_cache",
+        action="store_true",
+        default=False,
+        help="Jangan pakai cache hasil parse testcases/locators (.cache/datatest), selalu baca file sumber"
+    )
+    parser.addoption(
+        "--preflight",
+        action="store",
+        default="case",
+        choices=("case", "strict", "only", "off"),
+        help="Validasi data tanpa browser: case = case rusak langsung FAIL sebelum driver dibuat (default), "
+             "strict = batalkan run kalau ada case rusak, only = validasi saja lalu keluar, off = nonaktif"
+    )
+    parser.addoption(
+        "--profile",
+        action="store",
+        nargs="?",
+        const="cprofile",
+        default=None,
+        choices=SessionProfiler.MODES,
+        help="Profiling tiap worker (+ master): cprofile (default kalau tanpa nilai) atau sample "
+             "(collapsed stack untuk flamegraph). Hasil di run_*/profile_*"
+    )
+    parser.addoption(
+        "--profile_top",
+        action="store",
+        type=int,
+        default=30,
+        help="Jumlah fungsi teratas yang dicetak saat merge profile"
+    )
+    parser.addoption(
+        "--profile_interval",
+        action="store",
+        type=float,
+        default=5.0,
+        help="Interval sampling (ms) untuk --profile=sample"
+    )
+    parser.addoption(
+        "--schedule",
+        action="store",
+        default="duration",
+        choices=("duration", "load"),
+        help="Pembagian case ke worker xdist (--dist=load): duration = terlama dulu (LPT) berdasarkan "
+             "durasi run sebelumnya (default), load = scheduler bawaan xdist"
+    )
+    parser.addoption(
+        "--schedule_runs",
+        action="store",
+        type=int,
+        default=5,
+        help="Jumlah run terakhir feature yang sama untuk rata-rata durasi case"
+    )
+    parser.addoption(
+        "--rerun_failed", "--rerun-failed",
+        action="store_true",
+        default=False,
+        help="Jalankan ulang case failed + yang belum selesai dari run terakhir feature ini "
+             "(atau run di --resume). Hasil digabung ke report run tersebut"
+    )
+    parser.addoption(
+        "--resume",
+        action="store",
+        default=None,
+        metavar="RUN_DIR",
+        help="Lanjutkan run yang terhenti: cuma case yang belum selesai. RUN_DIR = path atau nama run_* "
+             "di reports/capture; --feature_name boleh kosong (diambil dari run_info.json)"
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def feature_name(request):
     """
     Fixture untuk ambil nilai feature_name dari CLI.
@@ -31,88 +113,193 @@ def feature_name(request):
     return request.config.getoption("--feature_name")
 
 
+def _feature_folder(feature_name):
+    return os.path.join(BASE_DIR, "datatest", feature_name)
+
+
+# ============================================================
+# Collection: 1 CaseID = 1 pytest item
+# ============================================================
+def pytest_generate_tests(metafunc):
+    """
+    Pecah testcases satu feature jadi satu pytest item per CaseID.
+    Node ID-nya stabil (launcher.py::test_feature[TC001]) jadi xdist bisa
+    bagi-bagi case ke semua worker, bukan satu worker ngerjain satu feature.
+    """
+    if "testcase" not in metafunc.fixturenames:
+        return
+
+    feature_name = metafunc.config.getoption("--feature_name")
+    if not feature_name:
+        metafunc.parametrize("testcase", [pytest.param(None, id="no_feature", marks=pytest.mark.skip(
+            reason="[SKIPPED] Argumen --feature_name wajib diisi, contoh: pytest launcher.py --feature_name=login -s"
+        ))])
+        return
+
+    try:
+        testcases = DataLoader.load_testcases(_feature_folder(feature_name))
+    except FileNotFoundError as e:
+        metafunc.parametrize("testcase", [pytest.param(None, id="no_testcases", marks=pytest.mark.skip(
+            reason=f"[SKIPPED] {str(e)}"
+        ))])
+        return
+    except LOAD_ERRORS as e:
+        message = f"[ERROR] Gagal load testcases feature {feature_name}: {type(e).__name__}: {e}"
+        metafunc.parametrize("testcase", [pytest.param(None, id="load_error", marks=pytest.mark.preflight_failed(
+            message
+        ))])
+        return
+
+    # preflight per case: case dengan data rusak ditandai, gagal di setup sebelum browser dibuat
+    preflight_locators = None
+    locator_error = None
+    if metafunc.config.getoption("--preflight") != "off":
+        try:
+            preflight_locators = DataLoader.load_locators(_feature_folder(feature_name))
+        except FileNotFoundError:
+            preflight_locators = None
+        except LOAD_ERRORS as e:
+            # semua case butuh locators: tiap case gagal dengan pesan yang sama
+            locator_error = f"[ERROR] Gagal load locators feature {feature_name}: {type(e).__name__}: {e}"
+
+    params = []
+    seen = {}
+    for testcase in (testcases or {}).get("test_cases", []):
+        case_id = str(testcase.get("CaseID"))
+        # CaseID dobel dikasih suffix supaya node id tetap unik & urutannya stabil;
+        # suffix ikut ke CaseID testcase supaya tracker / merge / history tidak bentrok
+        seen[case_id] = seen.get(case_id, 0) + 1
+        node_id = case_id if seen[case_id] == 1 else f"{case_id}#{seen[case_id]}"
+        if node_id != case_id:
+            testcase = dict(testcase, CaseID=node_id)
+
+        marks = []
+        if not testcase.get("Run", True):
+            marks.append(pytest.mark.skip(reason=f"[SKIPPED] {node_id} - {testcase.get('Title', '')}"))
+        elif locator_error:
+            marks.append(pytest.mark.preflight_failed(locator_error))
+        elif preflight_locators is not None:
+            issues = Preflight.validate_testcase(testcase, preflight_locators)
+            if issues:
+                marks.append(pytest.mark.preflight_failed(Preflight.format_issues(node_id, issues)))
+        params.append(pytest.param(testcase, id=node_id, marks=marks))
+
+    metafunc.parametrize("testcase", params)
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item):
+    """
+    Case yang gagal preflight langsung FAIL di sini, sebelum fixture driver start browser.
+    Test pertama di proses ini juga membuka event log run_*/events_<pid>_<token>.jsonl
+    dan HistoryRecorder kalau GlobalData.History.Enabled
+    (master xdist tidak pernah lewat sini, jadi cuma proses yang menjalankan test).
+    """
+    tracker = ResultTracker()
+    run_root = item.config._store.get(RUN_ROOT_KEY, None)
+    if tracker.event_log is None and run_root:
+        tracker.attach_event_log(EventLog.for_process(run_root))
+        recorder = HistoryRecorder.for_run(ConfigRegistry.global_data(), run_root)
+        if recorder:
+            tracker.attach_history(recorder)
+
+    marker = item.get_closest_marker("preflight_failed")
+    if marker:
+        pytest.fail(marker.args[0], pytrace=False)
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_sessionstart(session):
+    """
+    --preflight=strict/only: validasi seluruh feature di master sebelum worker/browser dibuat.
+    """
+    config = session.config
+    mode = config.getoption("--preflight")
+    feature_name = config.getoption("--feature_name")
+    if hasattr(config, "workerinput") or mode not in ("strict", "only") or not feature_name:
+        return
+
+    try:
+        report = Preflight.validate_feature(_feature_folder(feature_name))
+    except FileNotFoundError as e:
+        print(f"[WARN] Preflight dilewati: {e}")
+        return
+    except LOAD_ERRORS as e:
+        pytest.exit(f"[PREFLIGHT] Gagal load data feature {feature_name}: {type(e).__name__}: {e}", returncode=1)
+
+    for case_id, issues in report.items():
+        print(Preflight.format_issues(case_id, issues))
+    if report:
+        pytest.exit(f"[PREFLIGHT] {len(report)} case bermasalah di feature {feature_name}", returncode=1)
+    if mode == "only":
+        pytest.exit(f"[PREFLIGHT] OK: feature {feature_name}", returncode=0)
+
+
+@pytest.fixture(scope="session")
+def locators(feature_name):
+    """
+    Locator feature dimuat sekali per worker, dipakai semua case di worker itu.
+    """
+    if not feature_name:
+        pytest.skip("[SKIPPED] Argumen --feature_name wajib diisi")
+    folder = _feature_folder(feature_name)
+    try:
+        data = DataLoader.load_locators(folder)
+    except FileNotFoundError as e:
+        pytest.skip(f"[SKIPPED] {str(e)}")
+    except LOAD_ERRORS as e:
+        pytest.fail(f"[ERROR] Gagal load locators {folder}: {type(e).__name__}: {e}")
+    if not data:
+        pytest.skip(f"[SKIPPED] File locators tidak lengkap di {folder}")
+    return data
+
+
 # ============================================================
 # Selenium Driver
 # ==========================================================
+@pytest.fixture(scope="session")
+def driver_pool():
+    """
+    Pool browser per worker. GlobalData.DriverPool.Enabled=false -> 1 browser per test (perilaku lama).
+    """
+    globaldata = ConfigRegistry.global_data()
+    pool_config = globaldata.get("DriverPool") or {}
+    max_uses = pool_config.get("MaxUses", 20) if pool_config.get("Enabled", False) else 1
+    pool = DriverPool(lambda: DriverFactory.create(ConfigRegistry.global_data()), max_uses=max_uses)
+    yield pool
+    pool.close_all()
+
+
 @pytest.fixture
-def driver():
-    # [UPDATE-6] Deteksi browser default user    
-    BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-    globaldata = YAMLReader.read(os.path.join(BASE_DIR, "datatest", "global_data.yaml"))["GlobalData"]
-    config_browser = globaldata.get("Browser", "").lower()
-    try:
-        default_browser = webbrowser.get().name.lower()
-    except Exception:
-        default_browser = ""
-    if config_browser:
-        default_browser = config_browser
-    print(f"[INFO] Default browser terdeteksi: {default_browser}")
-
-    headless = globaldata.get("Headless")
+def driver(driver_pool):
+    globaldata = ConfigRegistry.global_data()
     base_url = globaldata.get("baseURL")
+    driver = driver_pool.acquire()
 
-    driver = None
-    print(f"[INFO] Menggunakan Headless: {headless}")
+    try:
+        # --- navigate ke baseURL dari config ---
+        driver.get(base_url)
+        print(f"[INFO] Navigasi ke {base_url}")
 
-    if "chrome" in default_browser:
-        service = ChromeService(ChromeDriverManager().install())
-        options = webdriver.ChromeOptions()
-        if headless:
-            options.add_argument("--headless=new")
-            options.add_argument(f"--window-size={globaldata.get('WindowSize','1920,1080')}")
-        else:
-            options.add_argument("--start-maximized")
-        driver = webdriver.Chrome(service=service, options=options)
-        print("[INFO] Menggunakan Chrome WebDriver")
-
-    elif "firefox" in default_browser or "mozilla" in default_browser:
-        service = FirefoxService(GeckoDriverManager().install())
-        options = webdriver.FirefoxOptions()
-        if headless:
-            options.add_argument("--headless")
-            w, h = globaldata.get("WindowSize","1920,1080").split(",")
-            options.add_argument(f"--width={w}")
-            options.add_argument(f"--height={h}")
-        else:
-            options.add_argument("--width=1920")
-            options.add_argument("--height=1080")
-        driver = webdriver.Firefox(service=service, options=options)
-        print("[INFO] Menggunakan Firefox WebDriver")
-
-    elif "edge" in default_browser:
-        service = EdgeService(EdgeChromiumDriverManager().install())
-        options = webdriver.EdgeOptions()
-        if headless:
-            options.add_argument("--headless=new")
-        else:
-            options.add_argument("--start-maximized")
-        driver = webdriver.Edge(service=service, options=options)
-        
-        print("[INFO] Menggunakan Edge WebDriver")
+        # --- PageLoad.Strategy eager/none: tunggu kondisi siap dari GlobalData.PageLoad ---
+        ready, error = resolve_ready(None, {}, globaldata, ConfigRegistry.global_locators())
+        if error:
+            raise ValueError(error)
+        if ready is not None:
+            WebDriverWait(driver, globaldata.get("Timeout")).until(
+                ready, f"[ERROR] {base_url} belum siap ({ready.describe()})")
 
-    else:
-        # [UPDATE-7] fallback ke Chrome jika browser tidak dikenali
-        print("[WARNING] Browser default tidak dikenali, fallback ke Chrome")
-        service = ChromeService(ChromeDriverManager().install())
-        options = webdriver.ChromeOptions()
-        options.add_argument("--start-maximized")
-        driver = webdriver.Chrome(service=service, options=options)
-
-    # --- setting umum ---
-    driver.implicitly_wait(globaldata.get("Timeout"))
-
-    # --- navigate ke baseURL dari config ---
-    driver.get(base_url)
-    print(f"[INFO] Navigasi ke {base_url}")
-
-    # --- assert basic cek ---
-    assert base_url.split("//")[1].split("/")[0] in driver.current_url, \
-        f"[ERROR] Base URL salah, expected {base_url}, got {driver.current_url}"
+        # --- assert basic cek ---
+        assert base_url.split("//")[1].split("/")[0] in driver.current_url, \
+            f"[ERROR] Base URL salah, expected {base_url}, got {driver.current_url}"
+    except BaseException:
+        driver_pool.discard(driver)
+        raise
     
     yield driver   # ini yang dikembalikan ke test
 
-    # Teardown
-    driver.quit()
+    # Teardown: balikin ke pool (reset state / recycle / quit)
+    driver_pool.release(driver)
 
 # ============================================================
 # Fixture: run_dir (Single Folder untuk semua worker)
@@ -137,69 +324,181 @@ def pytest_configure(config):
     - Jika master (tidak ada config.workerinput) => buat run_root dan simpan di config._store
     - Jika worker => baca run_root dari config.workerinput dan simpan ke config._store
     """
+    config.addinivalue_line("markers", "preflight_failed(message): data testcase gagal validasi preflight")
+    if config.getoption("--no_data_cache"):
+        DataCache.enabled = False
+
     # Worker proses: ambil run_root dari workerinput (set oleh pytest_configure_node)
     if not hasattr(config, "workerinput"):  # Master only
-        project_root = os.path.dirname(os.path.abspath(__file__))
-        reports_dir = os.path.join(project_root, "reports", "capture")
-        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-        run_root = os.path.join(reports_dir, f"run_{timestamp}")
-        os.makedirs(run_root, exist_ok=True)
-
-        config._store[RUN_ROOT_KEY] = run_root
-        print(f"[DEBUG] (master) created run_root: {run_root}")
+        if config.getoption("--rerun_failed") or config.getoption("--resume"):
+            run_root = _configure_rerun(config)
+        elif config.getoption("--feature_name"):
+            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+            run_root = os.path.join(REPORTS_DIR, f"run_{timestamp}")
+            os.makedirs(run_root, exist_ok=True)
+            RunInfo.write(run_root, feature=config.getoption("--feature_name"))
+            print(f"[DEBUG] (master) created run_root: {run_root}")
+        else:
+            run_root = None   # tanpa feature (mis. unit test di tests/): tidak ada run_* dan report
+
+        if run_root:
+            config._store[RUN_ROOT_KEY] = run_root
     else:
         run_root = config.workerinput.get("run_root")
         if run_root:
             config._store[RUN_ROOT_KEY] = run_root
             print(f"[DEBUG] (worker) using run_root: {run_root}")
+        rerun = config.workerinput.get("rerun")
+        if rerun and run_root:
+            config._store[RERUN_KEY] = RerunPlan(run_root, rerun["mode"], set(rerun["done"]))
+            # --resume tanpa --feature_name: worker parse argumen CLI asli, feature dari master
+            config.option.feature_name = rerun["feature"]
+        # path driver hasil resolve master, worker tidak perlu panggil webdriver_manager lagi
+        DriverResolver.seed(config.workerinput.get("driver_paths"))
+
+    # --profile: profiling seluruh session proses ini (worker, dan master untuk merge + PDF)
+    profile_mode = config.getoption("--profile")
+    if profile_mode:
+        # worker pakai token session master: nama file unik per session, merge tidak ikut run lama
+        session = config.workerinput.get("profile_session") if hasattr(config, "workerinput") else None
+        profiler = SessionProfiler(profile_mode, config.getoption("--profile_interval") / 1000, session)
+        profiler.start()
+        config._store[PROFILER_KEY] = profiler
 
 
+def _configure_rerun(config):
+    """
+    Master, --rerun_failed / --resume: pakai ulang folder run lama sebagai run_root
+    dan tentukan CaseID yang dilewati. Feature diambil dari run_info.json kalau tidak diisi.
+    """
+    feature_name = config.getoption("--feature_name")
+    mode = "rerun-failed" if config.getoption("--rerun_failed") else "resume"
+    try:
+        run_root = RerunPlan.resolve_run_dir(REPORTS_DIR, config.getoption("--resume"), feature_name)
+    except (FileNotFoundError, ValueError) as e:
+        raise pytest.UsageError(f"[RERUN] {e}")
+
+    run_feature = RunInfo.read(run_root).get("feature")
+    if not feature_name:
+        config.option.feature_name = run_feature
+    elif run_feature and run_feature != feature_name:
+        raise pytest.UsageError(f"[RERUN] {run_root} adalah run feature '{run_feature}', bukan '{feature_name}'")
+
+    plan = RerunPlan.build(run_root, mode)
+    plan.record()
+    config._store[RERUN_KEY] = plan
+    print(f"[DEBUG] (master) reuse run_root: {run_root}")
+    return run_root
+
+
+def pytest_collection_modifyitems(config, items):
+    """--rerun_failed / --resume: case yang sudah selesai di run lama di-deselect."""
+    plan = config._store.get(RERUN_KEY, None)
+    if plan is None:
+        return
+    selected, deselected = plan.select(items, case_id_of)
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+
+
+@pytest.hookimpl(optionalhook=True)
 def pytest_configure_node(node):
     """
     Dipanggil di master untuk setiap worker node yang dibuat.
     Kita share run_root (master) -> node.workerinput sehingga worker tahu folder yang sama.
+    Path binary driver juga di-resolve sekali di master lalu dibagi ke semua worker.
     """
     run_root = node.config._store.get(RUN_ROOT_KEY, None)
     if run_root:
         node.workerinput["run_root"] = run_root
-        print(f"[DEBUG] (node) sharing run_root to worker: {run_root}")     
+        print(f"[DEBUG] (node) sharing run_root to worker: {run_root}")
+    plan = node.config._store.get(RERUN_KEY, None)
+    if plan is not None:
+        node.workerinput["rerun"] = {"mode": plan.mode, "done": sorted(plan.done),
+                                     "feature": node.config.getoption("--feature_name")}
+
+    profiler = node.config._store.get(PROFILER_KEY, None)
+    if profiler is not None:
+        node.workerinput["profile_session"] = profiler.session
+
+    globaldata = ConfigRegistry.global_data()
+    try:
+        DriverResolver.resolve(DriverFactory.detect_browser(globaldata), globaldata)
+    except Exception as e:
+        # biarkan worker coba resolve sendiri (dan gagal dengan pesan yang jelas di test)
+        print(f"[WARN] Resolve driver di master gagal: {e}")
+    node.workerinput["driver_paths"] = DriverResolver.snapshot()     
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """Master: catat file profile worker session ini (dikirim lewat workeroutput saat worker selesai)."""
+    profiler = node.config._store.get(PROFILER_KEY, None)
+    path = getattr(node, "workeroutput", {}).get("profile")
+    if profiler is not None and path:
+        profiler.files.append(path)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_make_scheduler(config, log):
+    """
+    Master: case terlama dijalankan duluan (LPT) supaya 1 case lambat tidak jadi
+    ekor run sementara worker lain nganggur. Return None -> scheduler bawaan xdist.
+    """
+    feature_name = config.getoption("--feature_name")
+    if config.getoption("--schedule") != "duration" or config.getoption("dist") != "load" or not feature_name:
+        return None
+
+    durations = CaseDurations.load(
+        os.path.join(BASE_DIR, "reports", "capture"), feature_name,
+        runs=config.getoption("--schedule_runs"),
+        exclude=config._store.get(RUN_ROOT_KEY, None),
+        globaldata=ConfigRegistry.global_data()
+    )
+    if not durations:
+        print("[SCHEDULE] Belum ada durasi historis, pakai scheduler bawaan xdist")
+        return None
+    return make_duration_scheduler(config, log, durations)
 
 # ============================================================
-# Save snapshot from worker after each test (teardown)
+# Checkpoint event log setelah tiap test (teardown)
 # ============================================================
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
 def pytest_runtest_teardown(item, nextitem):
     """
     Setelah tiap test teardown:
-    - Worker menyimpan snapshot ke run_root dengan nama snapshot_<pid>.json
-    - Kita panggil report_generator.collect_results(run_root=...)
+    - tunggu screenshot background selesai ditulis
+    - checkpoint event log (flush + fsync), tidak ada lagi snapshot penuh per test
     """
     outcome = yield
 
-    # Pastikan run_root ada dan kita di worker
-    run_root = item.config._store.get(RUN_ROOT_KEY, None)
-    # juga coba dari workerinput (backward)
+    # barrier: screenshot background harus sudah ditulis sebelum event dianggap aman
+    ScreenshotWriter().flush()
 
-    if run_root and hasattr(item.config, "workerinput"):
-        # hanya jalankan di worker
-        from reports import report_generator
-        try:
-            report_generator.collect_results(exitstatus=None, run_root=run_root)
-        except Exception as e:
-            print(f"[ERROR] collect_results gagal di worker: {e}")
+    try:
+        ResultTracker().checkpoint()
+    except Exception as e:
+        print(f"[ERROR] Checkpoint event log gagal: {e}")
 
 # ============================================================
 # Master: merge + generate PDF saat session selesai
 # ============================================================
 def pytest_sessionfinish(session, exitstatus):
-    """Hanya dijalankan di master (tidak di worker)."""
+    """Merge + PDF hanya di master; worker cukup menutup event log + history (dan simpan profile)-nya."""
+    ResultTracker().close_event_log()
+    ResultTracker().close_history()
+    profiler = session.config._store.get(PROFILER_KEY, None)
     if hasattr(session.config, "workerinput"):
-        # worker; abaikan
+        run_root = session.config._store.get(RUN_ROOT_KEY, None)
+        if profiler and run_root:
+            session.config.workeroutput["profile"] = profiler.dump(run_root)
         return
 
     run_root = session.config._store.get(RUN_ROOT_KEY, None)
     if not run_root:
-        print("[WARN] Tidak ada run_root di pytest_sessionfinish; tidak generate report.")
+        if session.config.getoption("--feature_name"):
+            print("[WARN] Tidak ada run_root di pytest_sessionfinish; tidak generate report.")
         return
 
     print(f"[DEBUG] Master akan merge snapshot dari: {run_root}")
@@ -219,7 +518,12 @@ def pytest_sessionfinish(session, exitstatus):
 
     # panggil generator
     import reports.report_generator as report_gen
-    report_gen.generate_report(exitstatus=exitstatus, run_root=run_root)
+    report_gen.generate_report(exitstatus=exitstatus, run_root=run_root,
+                               feature=session.config.getoption("--feature_name"))
     print("[DEBUG] generate_report dipanggil oleh master.")
 
+    if profiler:
+        files = profiler.files + [profiler.dump(run_root)]
+        SessionProfiler.merge(run_root, files, top=session.config.getoption("--profile_top"))
+
 
@@ -0,0 +1,81 @@
+# core/capture_policy.py
+
+
+class CapturePolicy:
+    """
+    Kapan screenshot diambil untuk step yang PASSED:
+    - never         : tidak pernah (termasuk saat gagal)
+    - on-failure    : hanya step yang gagal
+    - every-step    : setiap step (perilaku lama, default)
+    - every-nth     : step ke-N, 2N, 3N, ... (EveryN)
+    - on-navigation : step navigate + step yang bikin URL berubah
+    Step yang gagal selalu di-capture kecuali mode "never".
+
+    Scope (area yang di-capture):
+    - page    : full viewport (default)
+    - element : hanya elemen target keyword
+    - region  : bounding box elemen + Padding px
+    Kalau elemen tidak ada / capture elemen gagal -> fallback full page.
+
+    Konfigurasi (prioritas: step > case > GlobalData):
+        GlobalData.Screenshot: {Mode: every-nth, EveryN: 5, Scope: element, Padding: 16}
+        case["Screenshot"] / step["Screenshot"]: "on-failure" atau {Mode: ..., Scope: ...}
+    """
+    MODES = ("never", "on-failure", "every-step", "every-nth", "on-navigation")
+    SCOPES = ("page", "element", "region")
+    DEFAULT_MODE = "every-step"
+
+    # hasil decide(): True = capture, False = skip, None = capture kalau URL berubah
+    CHECK_NAVIGATION = None
+
+    def __init__(self, mode=DEFAULT_MODE, every_n=1, scope="page", padding=0):
+        mode = str(mode or self.DEFAULT_MODE).strip().lower().replace("_", "-")
+        if mode not in self.MODES:
+            raise ValueError(f"Screenshot mode tidak dikenal: '{mode}' (pilihan: {', '.join(self.MODES)})")
+        scope = str(scope or "page").strip().lower()
+        if scope not in self.SCOPES:
+            raise ValueError(f"Screenshot scope tidak dikenal: '{scope}' (pilihan: {', '.join(self.SCOPES)})")
+        self.mode = mode
+        self.every_n = max(1, int(every_n or 1))
+        self.scope = scope
+        self.padding = max(0, int(padding or 0))
+
+    @classmethod
+    def from_config(cls, config, base=None):
+        """
+        config: None / str mode / dict {Mode, EveryN}. Field yang kosong diambil dari base.
+        """
+        base = base or cls()
+        if config is None or config == "":
+            return base
+        if isinstance(config, str):
+            return cls(config, base.every_n, base.scope, base.padding)
+        return cls(
+            config.get("Mode", base.mode),
+            config.get("EveryN", base.every_n),
+            config.get("Scope", base.scope),
+            config.get("Padding", base.padding),
+        )
+
+    @classmethod
+    def resolve(cls, globaldata, testcase=None, step=None):
+        policy = cls.from_config(globaldata.get("Screenshot"))
+        if testcase:
+            policy = cls.from_config(testcase.get("Screenshot"), policy)
+        if step:
+            policy = cls.from_config(step.get("Screenshot"), policy)
+        return policy
+
+    def decide(self, action, step_index):
+        """Keputusan capture untuk step yang berhasil."""
+        if self.mode == "every-step":
+            return True
+        if self.mode == "every-nth":
+            return step_index % self.every_n == 0
+        if self.mode == "on-navigation":
+            return True if action == "navigate" else self.CHECK_NAVIGATION
+        return False
+
+    @property
+    def on_failure(self):
+        return self.mode != "never"
@@ -0,0 +1,164 @@
+# core/case_scheduler.py
+import glob
+import json
+import os
+import statistics
+
+from core.event_log import EventLog
+from core.history_store import HistoryStore
+from core.run_info import RunInfo
+
+# prefilter murah sebelum json.loads: event ditulis compact (separators tanpa spasi)
+_CASE_END_MARK = '"ev":"case_end"'
+
+
+def case_id_of(nodeid):
+    """
+    'launcher.py::test_feature[TC001#2]' -> 'TC001#2', sama dengan CaseID di tracker / event log
+    (CaseID dobel sudah dapat suffix #n di pytest_generate_tests).
+    pytest meng-escape non-ASCII di node id ('TCé' -> 'TC\\xe9'), di sini dikembalikan ke aslinya.
+    """
+    if not nodeid.endswith("]") or "[" not in nodeid:
+        return None
+    case_id = nodeid[nodeid.index("[") + 1:-1]
+    try:
+        return case_id.encode("ascii").decode("unicode_escape")
+    except UnicodeError:
+        return case_id   # escaping pytest dimatikan: id sudah apa adanya
+
+
+class CaseDurations:
+    """
+    Durasi historis per CaseID untuk penjadwalan:
+    1. case_end di events_*.jsonl dari N run_* terakhir feature yang sama
+    2. sisanya diisi dari HistoryStore (kalau GlobalData.History.Enabled)
+    """
+
+    @staticmethod
+    def from_run_dirs(reports_dir, feature, runs=5, exclude=None):
+        """{case_id: rata-rata durasi} dari N run terakhir (attempt terakhir per run)."""
+        samples = {}
+        for run_root in RunInfo.previous_runs(reports_dir, feature, exclude)[:runs]:
+            latest = {}
+            for path in glob.glob(os.path.join(run_root, f"{EventLog.PREFIX}*{EventLog.SUFFIX}")):
+                try:
+                    CaseDurations._read_case_ends(path, latest)
+                except OSError as e:
+                    print(f"[WARN] Gagal baca durasi dari {path}: {e}")
+            for case_id, (_, duration) in latest.items():
+                samples.setdefault(case_id, []).append(duration)
+        return {case_id: sum(values) / len(values) for case_id, values in samples.items()}
+
+    @staticmethod
+    def _read_case_ends(path, latest):
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                if _CASE_END_MARK not in line:
+                    continue
+                try:
+                    event = json.loads(line)
+                except ValueError:
+                    continue
+                duration = event.get("duration")
+                if duration is None:
+                    continue
+                case_id, ts = str(event.get("case_id")), event.get("ts") or 0.0
+                if case_id not in latest or ts >= latest[case_id][0]:
+                    latest[case_id] = (ts, float(duration))
+
+    @staticmethod
+    def load(reports_dir, feature, runs=5, exclude=None, globaldata=None):
+        durations = CaseDurations.from_run_dirs(reports_dir, feature, runs, exclude)
+        source = f"{len(durations)} case dari run_*"
+        try:
+            store = HistoryStore.from_config(globaldata or {})
+            if store is not None:
+                with store:
+                    extra = {k: v for k, v in store.case_durations(feature, runs).items() if k not in durations}
+                durations.update(extra)
+                source += f", {len(extra)} case dari history"
+        except Exception as e:
+            print(f"[WARN] Gagal baca durasi dari HistoryStore: {e}")
+        print(f"[SCHEDULE] Durasi historis feature {feature}: {source}")
+        return durations
+
+
+def make_duration_scheduler(config, log, durations):
+    """
+    Bikin scheduler xdist LPT (longest processing time first).
+    Import xdist di sini supaya modul ini tetap bisa di-import tanpa pytest-xdist.
+    """
+    from xdist.scheduler import LoadScheduling
+
+    class DurationScheduling(LoadScheduling):
+        """
+        Seperti --dist=load, tapi:
+        - antrian diurutkan dari estimasi durasi terlama (case tanpa history = median)
+        - tiap worker cuma pegang 2 item (1 jalan + 1 nextitem), item berikutnya dikirim
+          ke worker yang selesai duluan -> case lambat tidak nyangkut di akhir run
+        """
+        PREFETCH = 2
+
+        def __init__(self, config, log=None):
+            super().__init__(config, log)
+            self.durations = durations
+            known = [d for d in durations.values() if d is not None]
+            self.default_estimate = statistics.median(known) if known else 0.0
+
+        def estimate(self, index):
+            duration = self.durations.get(case_id_of(self.collection[index]))
+            return self.default_estimate if duration is None else duration
+
+        def _sort_pending(self):
+            # sort stabil: estimasi sama tetap urut collection
+            self.pending.sort(key=lambda i: -self.estimate(i))
+
+        def schedule(self):
+            assert self.collection_is_completed
+            if self.collection is not None:
+                for node in self.nodes:
+                    self.check_schedule(node)
+                return
+
+            if not self._check_nodes_have_same_collection():
+                self.log("**Different tests collected, aborting run**")
+                return
+
+            self.collection = next(iter(self.node2collection.values()))
+            self.pending[:] = range(len(self.collection))
+            if not self.collection:
+                return
+            self._sort_pending()
+
+            known = sum(1 for nodeid in self.collection if case_id_of(nodeid) in self.durations)
+            total = sum(self.estimate(i) for i in self.pending)
+            print(f"[SCHEDULE] LPT {len(self.collection)} item ke {len(self.nodes)} worker "
+                  f"({known} punya durasi historis, estimasi total {total:.1f}s)")
+
+            # putaran 1 terlama -> worker 1..N, putaran 2 dibalik (snake) supaya lebih seimbang
+            for nodes in (self.nodes, list(reversed(self.nodes))):
+                for node in nodes:
+                    self._send_tests(node, 1)
+
+            if not self.pending:
+                for node in self.nodes:
+                    node.shutdown()
+
+        def check_schedule(self, node, duration=0):
+            if node.shutting_down:
+                return
+            if self.pending:
+                node_pending = self.node2pending[node]
+                if len(node_pending) < self.PREFETCH:
+                    self._send_tests(node, self.PREFETCH - len(node_pending))
+            else:
+                node.shutdown()
+            self.log("num items waiting for node:", len(self.pending))
+
+        def remove_node(self, node):
+            # item dari worker crash masuk lagi ke antrian: urutkan ulang sebelum dibagi
+            crashitem = super().remove_node(node)
+            self._sort_pending()
+            return crashitem
+
+    return DurationScheduling(config, log)
@@ -0,0 +1,96 @@
+# core/config_registry.py
+import hashlib
+import os
+import threading
+
+import yaml
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DATATEST_DIR = os.path.join(BASE_DIR, "..", "datatest")
+
+
+class FrozenDict(dict):
+    """
+    Dict read-only hasil parse YAML.
+    Sengaja turunan dict (bukan MappingProxyType) supaya str()/repr() tetap
+    sama seperti dict biasa -> resolve_value + ast.literal_eval tetap jalan.
+    """
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("Config dari ConfigRegistry read-only, copy dulu kalau mau diubah")
+
+    __setitem__ = __delitem__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+    __ior__ = _readonly
+
+    def __reduce__(self):
+        return (FrozenDict, (dict(self),))
+
+
+def freeze(data):
+    """Ubah hasil yaml.safe_load jadi struktur immutable (dict -> FrozenDict, list -> tuple)."""
+    if isinstance(data, dict):
+        return FrozenDict((k, freeze(v)) for k, v in data.items())
+    if isinstance(data, (list, tuple)):
+        return tuple(freeze(v) for v in data)
+    return data
+
+
+class ConfigRegistry:
+    """
+    Registry config per proses:
+    - tiap file YAML di-parse sekali, hasilnya disimpan immutable
+    - akses berikutnya cuma os.stat(); reload hanya kalau mtime/size berubah
+      DAN hash isi file-nya beda (touch doang gak bikin parse ulang)
+    """
+    _cache = {}   # abspath -> {"stat": (mtime_ns, size), "hash": sha1, "data": frozen}
+    _lock = threading.Lock()
+
+    GLOBAL_DATA = os.path.join(DATATEST_DIR, "global_data.yaml")
+    GLOBAL_LOCATORS = os.path.join(DATATEST_DIR, "global_locators.yaml")
+
+    @classmethod
+    def get(cls, file_path):
+        path = os.path.abspath(file_path)
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File YAML tidak ditemukan: {file_path}")
+        stat_key = (st.st_mtime_ns, st.st_size)
+
+        entry = cls._cache.get(path)
+        if entry is not None and entry["stat"] == stat_key:
+            return entry["data"]
+
+        with cls._lock:
+            entry = cls._cache.get(path)
+            if entry is not None and entry["stat"] == stat_key:
+                return entry["data"]
+
+            with open(path, "rb") as f:
+                raw = f.read()
+            digest = hashlib.sha1(raw).hexdigest()
+
+            if entry is not None and entry["hash"] == digest:
+                # file cuma di-touch, isi sama -> pakai hasil parse lama
+                entry["stat"] = stat_key
+                return entry["data"]
+
+            data = freeze(yaml.safe_load(raw.decode("utf-8")))
+            cls._cache[path] = {"stat": stat_key, "hash": digest, "data": data}
+            print(f"[CONFIG] Loaded {path}")
+            return data
+
+    @classmethod
+    def global_data(cls):
+        """Section GlobalData dari datatest/global_data.yaml"""
+        return cls.get(cls.GLOBAL_DATA)["GlobalData"]
+
+    @classmethod
+    def global_locators(cls):
+        """Section GlobalLocators dari datatest/global_locators.yaml"""
+        return cls.get(cls.GLOBAL_LOCATORS)["GlobalLocators"]
+
+    @classmethod
+    def clear(cls):
+        with cls._lock:
+            cls._cache.clear()
@@ -1,15 +1,24 @@
 import csv
-from collections import defaultdict
 
 class CSVReader:
     @staticmethod
-    def read_testcases(filepath):
-        cases = defaultdict(lambda: {"TestSteps": []})
+    def iter_testcases(filepath):
+        """
+        Generator: yield 1 case setiap kali CaseID berganti (baris case diasumsikan berurutan).
+        Memori yang dipakai cuma 1 case, jadi eksekusi bisa mulai sebelum file selesai dibaca.
+        """
         with open(filepath, newline="", encoding="utf-8") as f:
             reader = csv.DictReader(f)
+            case = None
             for row in reader:
-                cid = row["CaseID"].strip()
-                case = cases[cid]
+                cid = (row.get("CaseID") or "").strip()
+                if not cid:
+                    continue  # skip baris kosong
+
+                if case is None or case["CaseID"] != cid:
+                    if case is not None:
+                        yield case
+                    case = {"TestSteps": []}
 
                 # --- Case-level data ---
                 case["CaseID"] = cid
@@ -27,8 +36,27 @@ class CSVReader:
                     "Locator": row.get("Locator", "").strip(),
                     "TestData": row.get("TestData", "").strip(),
                     "Expected": row.get("Expected", "").strip(),
+                    "Screenshot": (row.get("Screenshot") or "").strip(),  # override CapturePolicy per step (opsional)
                 })
 
+            if case is not None:
+                yield case
+
+    @staticmethod
+    def read_testcases(filepath):
+        cases = {}
+        for case in CSVReader.iter_testcases(filepath):
+            existing = cases.get(case["CaseID"])
+            if existing is None:
+                cases[case["CaseID"]] = case
+                continue
+
+            # CaseID sama tapi barisnya tidak berurutan -> gabung ke case yang sudah ada
+            for step in case.pop("TestSteps"):
+                step["StepID"] = str(len(existing["TestSteps"]) + 1)
+                existing["TestSteps"].append(step)
+            existing.update(case)
+
         return {"test_cases": list(cases.values())}
 
     @staticmethod
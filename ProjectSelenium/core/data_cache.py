@@ -0,0 +1,131 @@
+# core/data_cache.py
+import hashlib
+import os
+import pickle
+import tempfile
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+class DataCache:
+    """
+    Cache hasil parse testcases/locators (YAML/CSV/XLSX) ke disk dalam bentuk pickle.
+    - 1 file cache per (path sumber, jenis data)
+    - valid kalau mtime+size sama; kalau beda, cek hash isi file dulu
+      sebelum parse ulang (git checkout / touch gak bikin cache basi)
+    - ditulis atomic (tmp + os.replace) karena banyak worker xdist bisa nulis bareng
+    """
+    VERSION = 2
+    CACHE_DIR = os.path.normpath(os.path.join(BASE_DIR, "..", ".cache", "datatest"))
+    enabled = os.environ.get("PROJECTSELENIUM_DATA_CACHE", "1") != "0"
+
+    @staticmethod
+    def _file_hash(path):
+        h = hashlib.sha1()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                h.update(chunk)
+        return h.hexdigest()
+
+    @classmethod
+    def _cache_path(cls, source_path, kind):
+        key = hashlib.sha1(f"{os.path.abspath(source_path)}|{kind}".encode("utf-8")).hexdigest()
+        return os.path.join(cls.CACHE_DIR, f"{kind}_{key}.pkl")
+
+    @classmethod
+    def _read_entry(cls, cache_path, source_path, kind):
+        try:
+            with open(cache_path, "rb") as f:
+                entry = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+            return None
+        if not isinstance(entry, dict) or entry.get("version") != cls.VERSION:
+            return None
+        if entry.get("source") != os.path.abspath(source_path) or entry.get("kind") != kind:
+            return None
+        return entry
+
+    @classmethod
+    def _write_entry(cls, cache_path, entry):
+        tmp = None
+        try:
+            os.makedirs(cls.CACHE_DIR, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=cls.CACHE_DIR, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, cache_path)
+        except OSError as e:
+            if tmp and os.path.exists(tmp):
+                os.remove(tmp)   # jangan tinggalkan *.tmp setengah jadi di CACHE_DIR
+            # cache cuma optimasi, gagal tulis jangan bikin test gagal
+            print(f"[WARN] Gagal tulis data cache {cache_path}: {e}")
+
+    @classmethod
+    def lookup(cls, source_path, kind):
+        """
+        Return data dari cache kalau masih valid untuk source_path, selain itu None.
+        Tidak pernah parse file sumber.
+        """
+        if not cls.enabled:
+            return None
+        st = os.stat(source_path)
+        stat_key = (st.st_mtime_ns, st.st_size)
+        cache_path = cls._cache_path(source_path, kind)
+        entry = cls._read_entry(cache_path, source_path, kind)
+        if entry is None:
+            return None
+
+        if entry["stat"] == stat_key:
+            print(f"[INFO] Data cache hit: {source_path}")
+            return entry["data"]
+
+        if entry["hash"] == cls._file_hash(source_path):
+            print(f"[INFO] Data cache hit (hash): {source_path}")
+            entry["stat"] = stat_key
+            cls._write_entry(cache_path, entry)
+            return entry["data"]
+        return None
+
+    @classmethod
+    def store(cls, source_path, kind, data):
+        if not cls.enabled:
+            return
+        st = os.stat(source_path)
+        cls._write_entry(cls._cache_path(source_path, kind), {
+            "version": cls.VERSION,
+            "source": os.path.abspath(source_path),
+            "kind": kind,
+            "stat": (st.st_mtime_ns, st.st_size),
+            "hash": cls._file_hash(source_path),
+            "data": data,
+        })
+
+    @classmethod
+    def load(cls, source_path, kind, parser):
+        """
+        Ambil data dari cache kalau masih valid, kalau tidak panggil parser(source_path)
+        lalu simpan hasilnya.
+        kind: "testcases" / "locators"
+        """
+        if not cls.enabled:
+            return parser(source_path)
+
+        data = cls.lookup(source_path, kind)
+        if data is not None:
+            return data
+
+        data = parser(source_path)
+        cls.store(source_path, kind, data)
+        return data
+
+    @classmethod
+    def clear(cls):
+        """Hapus semua file cache."""
+        if not os.path.isdir(cls.CACHE_DIR):
+            return
+        for f in os.listdir(cls.CACHE_DIR):
+            if f.endswith(".pkl"):
+                try:
+                    os.remove(os.path.join(cls.CACHE_DIR, f))
+                except OSError:
+                    pass
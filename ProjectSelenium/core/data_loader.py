@@ -2,66 +2,132 @@ import os
 import openpyxl
 from core.yaml_reader import YAMLReader
 from core.csv_reader import CSVReader
+from core.data_cache import DataCache
 
 class DataLoader:
+    @staticmethod
+    def _find_source(folder, basename):
+        """Cari <basename>.yaml/.yml/.csv/.xlsx di folder, prioritas YAML > CSV > XLSX."""
+        for ext in (".yaml", ".yml", ".csv", ".xlsx"):
+            path = os.path.join(folder, basename + ext)
+            if os.path.exists(path):
+                return path
+        return None
+
     @staticmethod
     def load_testcases(folder):
         """
         Mencari testcases.yaml / testcases.csv / testcases.xlsx di folder,
         prioritas YAML > CSV > XLSX.
+        Hasil parse di-cache di disk (DataCache), jadi folder yang tidak berubah
+        tidak di-parse ulang oleh tiap worker.
         """
-        paths = [
-            os.path.join(folder, "testcases.yaml"),
-            os.path.join(folder, "testcases.yml"),
-            os.path.join(folder, "testcases.csv"),
-            os.path.join(folder, "testcases.xlsx"),
-        ]
+        path = DataLoader._find_source(folder, "testcases")
+        if path is None:
+            raise FileNotFoundError(f"Tidak ditemukan testcases di {folder}")
+        return DataCache.load(path, "testcases", DataLoader._parse_testcases)
 
-        for path in paths:
-            if os.path.exists(path):
-                ext = os.path.splitext(path)[1].lower()
-                if ext in [".yaml", ".yml"]:
-                    print(f"[INFO] Load testcases YAML: {path}")
-                    return YAMLReader.read(path)
-                elif ext == ".csv":
-                    print(f"[INFO] Load testcases CSV: {path}")
-                    return CSVReader.read_testcases(path)
-                elif ext == ".xlsx":
-                    print(f"[INFO] Load testcases XLSX: {path}")
-                    wb = openpyxl.load_workbook(path)
-                    sheet = wb.active
-                    keys = [cell.value for cell in sheet[1]]
+    @staticmethod
+    def _parse_testcases(path):
+        ext = os.path.splitext(path)[1].lower()
+        if ext in [".yaml", ".yml"]:
+            print(f"[INFO] Load testcases YAML: {path}")
+            return YAMLReader.read(path)
+        elif ext == ".csv":
+            print(f"[INFO] Load testcases CSV: {path}")
+            return CSVReader.read_testcases(path)
+        elif ext == ".xlsx":
+            print(f"[INFO] Load testcases XLSX: {path}")
+            testcases = {}
+            for case in DataLoader._iter_xlsx_testcases(path):
+                existing = testcases.get(case["CaseID"])
+                if existing is None:
+                    testcases[case["CaseID"]] = case
+                else:
+                    existing["TestSteps"].extend(case["TestSteps"])
 
-                    testcases = {}
-                    for row in sheet.iter_rows(min_row=2, values_only=True):
-                        row_dict = dict(zip(keys, row))
-                        case_id = row_dict["CaseID"]
+            # bungkus biar konsisten
+            return {"test_cases": list(testcases.values())}
 
-                        step = {
-                            "Action": row_dict.get("Action"),
-                            "Locator": row_dict.get("Locator"),
-                            "TestData": row_dict.get("TestData"),
-                            "Expected": row_dict.get("Expected"),
-                            "Title": row_dict.get("StepTitle"),       # ✅ judul step
-                            "Description": row_dict.get("Description") # ✅ deskripsi step
-                        }
+    @staticmethod
+    def iter_testcases(folder):
+        """
+        Versi streaming dari load_testcases: yield 1 case per iterasi.
+        - cache DataCache masih valid -> yield dari cache
+        - CSV/XLSX -> dibaca baris per baris (XLSX pakai read_only), memori ~1 case
+        - YAML -> tetap di-parse sekali (yaml.safe_load tidak bisa streaming)
+        Asumsi: baris-baris satu CaseID berurutan di file sumber. Kalau CaseID muncul lagi
+        setelah case lain, potongan itu di-yield sebagai case terpisah (StepID CSV mulai dari 1),
+        TIDAK digabung seperti load_testcases. Yang butuh hasil sama persis dengan collection
+        (mis. preflight) pakai load_testcases.
+        """
+        path = DataLoader._find_source(folder, "testcases")
+        if path is None:
+            raise FileNotFoundError(f"Tidak ditemukan testcases di {folder}")
 
-                        if case_id not in testcases:
-                            testcases[case_id] = {
-                                "CaseID": case_id,
-                                "CaseTitle": row_dict.get("CaseTitle", "").strip(),
-                                "Title": row_dict.get("CaseTitle", "").strip(),   # ✅ alias biar aman
-                                "ScenarioType": row_dict.get("ScenarioType", "").strip(),
-                                "Run": str(row_dict.get("Run", "")).lower() in ("true", "yes", "1"),
-                                "TestSteps": [],
-                            }
+        cached = DataCache.lookup(path, "testcases")
+        if cached is not None:
+            yield from cached.get("test_cases", [])
+            return
 
-                        testcases[case_id]["TestSteps"].append(step)
+        ext = os.path.splitext(path)[1].lower()
+        if ext == ".csv":
+            print(f"[INFO] Stream testcases CSV: {path}")
+            yield from CSVReader.iter_testcases(path)
+        elif ext == ".xlsx":
+            print(f"[INFO] Stream testcases XLSX: {path}")
+            yield from DataLoader._iter_xlsx_testcases(path)
+        else:
+            yield from (DataLoader._parse_testcases(path) or {}).get("test_cases", [])
 
-                    # bungkus biar konsisten
-                    return {"test_cases": list(testcases.values())}
+    @staticmethod
+    def _iter_xlsx_rows(path):
+        """Yield dict per baris (header = baris 1) dari sheet aktif, workbook dibuka read-only."""
+        wb = openpyxl.load_workbook(path, read_only=True, data_only=True)
+        try:
+            rows = wb.active.iter_rows(values_only=True)
+            keys = next(rows, None)
+            if not keys:
+                return
+            for row in rows:
+                if row is None or all(v is None for v in row):
+                    continue  # skip baris kosong di bawah tabel
+                yield dict(zip(keys, row))
+        finally:
+            wb.close()
 
-        raise FileNotFoundError(f"Tidak ditemukan testcases di {folder}")
+    @staticmethod
+    def _iter_xlsx_testcases(path):
+        case = None
+        for row_dict in DataLoader._iter_xlsx_rows(path):
+            case_id = row_dict["CaseID"]
+
+            step = {
+                "Action": row_dict.get("Action"),
+                "Locator": row_dict.get("Locator"),
+                "TestData": row_dict.get("TestData"),
+                "Expected": row_dict.get("Expected"),
+                "Title": row_dict.get("StepTitle"),       # ✅ judul step
+                "Description": row_dict.get("Description"), # ✅ deskripsi step
+                "Screenshot": row_dict.get("Screenshot"),    # override CapturePolicy per step (opsional)
+            }
+
+            if case is None or case["CaseID"] != case_id:
+                if case is not None:
+                    yield case
+                case = {
+                    "CaseID": case_id,
+                    "CaseTitle": (row_dict.get("CaseTitle") or "").strip(),
+                    "Title": (row_dict.get("CaseTitle") or "").strip(),   # ✅ alias biar aman
+                    "ScenarioType": (row_dict.get("ScenarioType") or "").strip(),
+                    "Run": str(row_dict.get("Run", "")).lower() in ("true", "yes", "1"),
+                    "TestSteps": [],
+                }
+
+            case["TestSteps"].append(step)
+
+        if case is not None:
+            yield case
 
     @staticmethod
     def load_locators(folder):
@@ -69,37 +135,29 @@ class DataLoader:
         Mencari locators.yaml / locators.csv / locators.xlsx di folder,
         prioritas YAML > CSV > XLSX.
         """
-        paths = [
-            os.path.join(folder, "locators.yaml"),
-            os.path.join(folder, "locators.yml"),
-            os.path.join(folder, "locators.csv"),
-            os.path.join(folder, "locators.xlsx"),
-        ]
-
-        for path in paths:
-            if os.path.exists(path):
-                ext = os.path.splitext(path)[1].lower()
-                if ext in [".yaml", ".yml"]:
-                    print(f"[INFO] Load locators YAML: {path}")
-                    data = YAMLReader.read(path)
-                    return data.get("locators", data)
-                elif ext == ".csv":
-                    print(f"[INFO] Load locators CSV: {path}")
-                    return CSVReader.read_locators(path)
-                elif ext == ".xlsx":
-                    print(f"[INFO] Load locators XLSX: {path}")
-                    wb = openpyxl.load_workbook(path)
-                    sheet = wb.active
-                    keys = [cell.value for cell in sheet[1]]
-                    locators = {}
-                    for row in sheet.iter_rows(min_row=2, values_only=True):
-                        row_dict = dict(zip(keys, row))
-                        name = row_dict["LocatorName"]
-                        locators[name] = {
-                            "LocatorType": row_dict.get("LocatorType"),
-                            "LocatorValue": row_dict.get("LocatorValue"),
-                            "Description": row_dict.get("Description", ""),  # 🆕 konsisten ada deskripsi locator
-                        }
-                    return locators
+        path = DataLoader._find_source(folder, "locators")
+        if path is None:
+            raise FileNotFoundError(f"Tidak ditemukan locators di {folder}")
+        return DataCache.load(path, "locators", DataLoader._parse_locators)
 
-        raise FileNotFoundError(f"Tidak ditemukan locators di {folder}")
+    @staticmethod
+    def _parse_locators(path):
+        ext = os.path.splitext(path)[1].lower()
+        if ext in [".yaml", ".yml"]:
+            print(f"[INFO] Load locators YAML: {path}")
+            data = YAMLReader.read(path)
+            return data.get("locators", data)
+        elif ext == ".csv":
+            print(f"[INFO] Load locators CSV: {path}")
+            return CSVReader.read_locators(path)
+        elif ext == ".xlsx":
+            print(f"[INFO] Load locators XLSX: {path}")
+            locators = {}
+            for row_dict in DataLoader._iter_xlsx_rows(path):
+                name = row_dict["LocatorName"]
+                locators[name] = {
+                    "LocatorType": row_dict.get("LocatorType"),
+                    "LocatorValue": row_dict.get("LocatorValue"),
+                    "Description": row_dict.get("Description", ""),  # 🆕 konsisten ada deskripsi locator
+                }
+            return locators
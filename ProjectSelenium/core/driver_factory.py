@@ -0,0 +1,179 @@
+# core/driver_factory.py
+import webbrowser
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.chrome.service import Service as ChromeService
+from selenium.webdriver.firefox.service import Service as FirefoxService
+from selenium.webdriver.edge.service import Service as EdgeService
+from core.driver_resolver import DriverResolver
+from core.network_profile import NetworkProfile
+from core.page_load import PageReady
+
+
+class DriverFactory:
+
+    @staticmethod
+    def detect_browser(globaldata):
+        """Browser dari GlobalData.Browser, kalau kosong pakai browser default OS."""
+        config_browser = (globaldata.get("Browser") or "").lower()
+        try:
+            default_browser = webbrowser.get().name.lower()
+        except Exception:
+            default_browser = ""
+        if config_browser:
+            default_browser = config_browser
+        return default_browser
+
+    @staticmethod
+    def create(globaldata):
+        """Buat 1 WebDriver baru sesuai GlobalData (Browser, Headless, WindowSize, Timeout)."""
+        # [UPDATE-6] Deteksi browser default user
+        default_browser = DriverFactory.detect_browser(globaldata)
+        print(f"[INFO] Default browser terdeteksi: {default_browser}")
+
+        # config network divalidasi dulu, jangan sampai browser sudah jalan baru error
+        network = NetworkProfile.from_config(globaldata)
+        page_load = PageReady.strategy(globaldata)
+        headless = globaldata.get("Headless")
+        driver = None
+        print(f"[INFO] Menggunakan Headless: {headless}, page load strategy: {page_load}")
+
+        if "chrome" in default_browser:
+            service = ChromeService(DriverResolver.resolve("chrome", globaldata))
+            options = webdriver.ChromeOptions()
+            if headless:
+                options.add_argument("--headless=new")
+                options.add_argument(f"--window-size={globaldata.get('WindowSize','1920,1080')}")
+            else:
+                options.add_argument("--start-maximized")
+            options.page_load_strategy = page_load
+            driver = webdriver.Chrome(service=service, options=options)
+            print("[INFO] Menggunakan Chrome WebDriver")
+
+        elif "firefox" in default_browser or "mozilla" in default_browser:
+            service = FirefoxService(DriverResolver.resolve("firefox", globaldata))
+            options = webdriver.FirefoxOptions()
+            if headless:
+                options.add_argument("--headless")
+                w, h = globaldata.get("WindowSize","1920,1080").split(",")
+                options.add_argument(f"--width={w}")
+                options.add_argument(f"--height={h}")
+            else:
+                options.add_argument("--width=1920")
+                options.add_argument("--height=1080")
+            options.page_load_strategy = page_load
+            driver = webdriver.Firefox(service=service, options=options)
+            print("[INFO] Menggunakan Firefox WebDriver")
+
+        elif "edge" in default_browser:
+            service = EdgeService(DriverResolver.resolve("edge", globaldata))
+            options = webdriver.EdgeOptions()
+            if headless:
+                options.add_argument("--headless=new")
+            else:
+                options.add_argument("--start-maximized")
+            options.page_load_strategy = page_load
+            driver = webdriver.Edge(service=service, options=options)
+            print("[INFO] Menggunakan Edge WebDriver")
+
+        else:
+            # [UPDATE-7] fallback ke Chrome jika browser tidak dikenali
+            print("[WARNING] Browser default tidak dikenali, fallback ke Chrome")
+            service = ChromeService(DriverResolver.resolve("chrome", globaldata))
+            options = webdriver.ChromeOptions()
+            options.add_argument("--start-maximized")
+            options.page_load_strategy = page_load
+            driver = webdriver.Chrome(service=service, options=options)
+
+        # --- setting umum ---
+        driver.implicitly_wait(globaldata.get("Timeout"))
+        try:
+            network.apply(driver)
+        except WebDriverException:
+            driver.quit()
+            raise
+        return driver
+
+
+class DriverPool:
+    """
+    Pool WebDriver per proses (per worker xdist).
+    - acquire(): pakai browser idle yang masih sehat, kalau tidak ada buat baru
+    - release(): reset state (window, cookies, local/session storage) lalu simpan lagi
+    - browser di-quit kalau sudah dipakai max_uses kali, crash, atau gagal di-reset
+    """
+
+    def __init__(self, factory, max_uses=20):
+        self._factory = factory
+        self.max_uses = max(1, int(max_uses or 1))
+        self._idle = []
+        self._uses = {}   # id(driver) -> jumlah pemakaian
+
+    @staticmethod
+    def _is_alive(driver):
+        try:
+            driver.window_handles
+            return True
+        except WebDriverException:
+            return False
+
+    def acquire(self):
+        while self._idle:
+            driver = self._idle.pop()
+            if self._is_alive(driver):
+                print(f"[POOL] Reuse browser (pemakaian ke-{self._uses.get(id(driver), 0) + 1})")
+                return driver
+            print("[POOL] Browser idle sudah mati, dibuang")
+            self.discard(driver)
+
+        driver = self._factory()
+        self._uses[id(driver)] = 0
+        return driver
+
+    @staticmethod
+    def reset(driver):
+        """Bersihkan state antar test. Return False kalau browser tidak bisa di-reset (crash)."""
+        try:
+            handles = driver.window_handles
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+
+            # storage harus dibersihkan saat masih di origin aplikasi
+            try:
+                driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+            except WebDriverException:
+                pass  # halaman about:blank / data: tidak punya storage
+
+            if hasattr(driver, "execute_cdp_cmd"):
+                # chromium: hapus cookies semua domain, bukan cuma domain halaman aktif
+                driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            driver.delete_all_cookies()
+            driver.get("about:blank")
+            return True
+        except WebDriverException as e:
+            print(f"[POOL][WARN] Gagal reset browser: {e}")
+            return False
+
+    def release(self, driver):
+        key = id(driver)
+        self._uses[key] = self._uses.get(key, 0) + 1
+        if self._uses[key] >= self.max_uses:
+            print(f"[POOL] Browser sudah dipakai {self._uses[key]}x, recycle")
+            self.discard(driver)
+        elif not self.reset(driver):
+            self.discard(driver)
+        else:
+            self._idle.append(driver)
+
+    def discard(self, driver):
+        self._uses.pop(id(driver), None)
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def close_all(self):
+        while self._idle:
+            self.discard(self._idle.pop())
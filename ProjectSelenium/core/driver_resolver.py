@@ -0,0 +1,86 @@
+# core/driver_resolver.py
+import os
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_DIR = os.path.normpath(os.path.join(BASE_DIR, ".."))
+
+
+class DriverResolver:
+    """
+    Resolve path binary driver (chromedriver/geckodriver/msedgedriver) sekali per session.
+    - master resolve sekali, path dibagi ke worker lewat workerinput (pytest_configure_node)
+    - GlobalData.DriverPaths.<browser> diisi -> pakai binary lokal itu, webdriver_manager tidak dipanggil
+    - GlobalData.DriverOffline: true (atau env PROJECTSELENIUM_DRIVER_OFFLINE=1) -> wajib pakai
+      DriverPaths, tidak pernah download / cek versi online
+    """
+    _paths = {}   # browser_key -> path binary
+
+    @staticmethod
+    def browser_key(browser):
+        """Nama browser bebas ("Google Chrome", "mozilla", ...) -> chrome/firefox/edge."""
+        browser = (browser or "").lower()
+        if "chrome" in browser:
+            return "chrome"
+        if "firefox" in browser or "mozilla" in browser:
+            return "firefox"
+        if "edge" in browser:
+            return "edge"
+        return "chrome"  # sama dengan fallback DriverFactory
+
+    @staticmethod
+    def is_offline(globaldata):
+        env = os.environ.get("PROJECTSELENIUM_DRIVER_OFFLINE", "").lower()
+        return env in ("1", "true", "yes") or bool(globaldata.get("DriverOffline"))
+
+    @staticmethod
+    def _pinned_path(key, globaldata):
+        path = (globaldata.get("DriverPaths") or {}).get(key)
+        if not path:
+            return None
+        path = os.path.expanduser(str(path))
+        if not os.path.isabs(path):
+            path = os.path.join(PROJECT_DIR, path)
+        if not os.path.isfile(path):
+            raise FileNotFoundError(f"[ERROR] DriverPaths.{key} tidak ditemukan: {path}")
+        return path
+
+    @staticmethod
+    def _download(key):
+        # import di sini supaya mode offline tidak butuh webdriver_manager sama sekali
+        if key == "firefox":
+            from webdriver_manager.firefox import GeckoDriverManager
+            return GeckoDriverManager().install()
+        if key == "edge":
+            from webdriver_manager.microsoft import EdgeChromiumDriverManager
+            return EdgeChromiumDriverManager().install()
+        from webdriver_manager.chrome import ChromeDriverManager
+        return ChromeDriverManager().install()
+
+    @classmethod
+    def resolve(cls, browser, globaldata):
+        key = cls.browser_key(browser)
+        if key in cls._paths:
+            return cls._paths[key]
+
+        path = cls._pinned_path(key, globaldata)
+        if path:
+            print(f"[INFO] Pakai driver lokal ({key}): {path}")
+        elif cls.is_offline(globaldata):
+            raise RuntimeError(f"[ERROR] DriverOffline aktif tapi GlobalData.DriverPaths.{key} belum diisi")
+        else:
+            path = cls._download(key)
+            print(f"[INFO] Driver {key} di-resolve webdriver_manager: {path}")
+
+        cls._paths[key] = path
+        return path
+
+    @classmethod
+    def seed(cls, paths):
+        """Isi cache dari hasil resolve master (dipanggil di worker)."""
+        for key, path in (paths or {}).items():
+            if path:
+                cls._paths[key] = path
+
+    @classmethod
+    def snapshot(cls):
+        return dict(cls._paths)
@@ -0,0 +1,110 @@
+# core/event_log.py
+import json
+import os
+import threading
+import time
+import uuid
+
+
+class EventLog:
+    """
+    Log event append-only (JSON per baris) per proses: run_*/events_<pid>_<token>.jsonl
+    (token acak per proses: pid yang dipakai ulang saat --rerun_failed/--resume di folder run
+    yang sama tidak pernah menulis ke file attempt sebelumnya)
+    - write di-buffer, fsync hanya saat checkpoint() (akhir tiap test) / close()
+    - kalau worker crash, event sampai checkpoint terakhir tetap ada di disk
+      dan master bisa rebuild hasil dari situ (lihat replay())
+
+    Event:
+        {"ev": "meta", "meta": {...}}
+        {"ev": "case_start", "case_id", "attempt", "title", "scenario_type"}
+        {"ev": "step", "case_id", "step": {...}}
+        {"ev": "case_end", "case_id", "status", "duration"}
+    """
+    PREFIX = "events_"
+    SUFFIX = ".jsonl"
+    BUFFER_SIZE = 64 * 1024
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._file = open(path, "a", encoding="utf-8", buffering=self.BUFFER_SIZE)
+
+    @classmethod
+    def for_process(cls, run_root):
+        token = uuid.uuid4().hex[:8]
+        return cls(os.path.join(run_root, f"{cls.PREFIX}{os.getpid()}_{token}{cls.SUFFIX}"))
+
+    def emit(self, ev, **fields):
+        fields["ev"] = ev
+        fields["ts"] = round(time.time(), 3)
+        line = json.dumps(fields, ensure_ascii=False, separators=(",", ":"))
+        with self._lock:
+            if self._file is not None:
+                self._file.write(line + "\n")
+
+    def checkpoint(self):
+        """Flush buffer + fsync: semua event sebelum titik ini aman di disk."""
+        with self._lock:
+            if self._file is None:
+                return
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def close(self):
+        self.checkpoint()
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    # -------------------- Baca ulang (master) --------------------
+    @staticmethod
+    def read(path):
+        """Generator event dari 1 file. Baris terakhir yang terpotong (worker crash) dilewati."""
+        with open(path, "r", encoding="utf-8") as f:
+            for lineno, line in enumerate(f, start=1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    print(f"[WARN] Event rusak dilewati: {os.path.basename(path)}:{lineno}")
+
+    @classmethod
+    def replay(cls, path):
+        """
+        Rebuild {meta, cases} dari 1 file event.
+        Case tanpa case_end (worker mati di tengah case) ditandai status "incomplete".
+        case_start kedua untuk CaseID yang sama = attempt baru, menggantikan attempt sebelumnya.
+        """
+        meta, cases, index = {}, [], {}
+        for event in cls.read(path):
+            kind = event.get("ev")
+            if kind == "meta":
+                meta.update(event.get("meta") or {})
+            elif kind == "case_start":
+                case_id = event.get("case_id")
+                case = {
+                    "case_id": case_id,
+                    "title": event.get("title"),
+                    "scenario_type": event.get("scenario_type"),
+                    "status": "incomplete",
+                    "steps": []
+                }
+                if case_id in index:
+                    cases[index[case_id]] = case
+                else:
+                    index[case_id] = len(cases)
+                    cases.append(case)
+            elif kind == "step":
+                idx = index.get(event.get("case_id"))
+                if idx is not None:
+                    cases[idx]["steps"].append(event.get("step") or {})
+            elif kind == "case_end":
+                idx = index.get(event.get("case_id"))
+                if idx is not None:
+                    cases[idx]["status"] = event.get("status") or "passed"
+                    cases[idx]["duration"] = event.get("duration")
+        return {"meta": meta, "cases": cases}
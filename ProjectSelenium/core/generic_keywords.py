@@ -4,115 +4,252 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import Select
 from selenium.webdriver import ActionChains
-from selenium.common.exceptions import NoSuchElementException
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
 from core.utils import Utils
 from core.result_tracker import ResultTracker  # 🆕 UPDATE
-from core.yaml_reader import YAMLReader
+from core.config_registry import ConfigRegistry
+from core.step_plan import ExecutionPlan, compile_testcase, keyword, resolve_locator, to_by
+from core.capture_policy import CapturePolicy
+from core.screenshot_writer import ScreenshotWriter
+from core.session_store import SessionStore
 
-import os, re, pytest, ast
+import os, re, time, pytest
 
 class GenericKeywords:
     def __init__(self, driver):
         self.driver = driver
         self.tracker = ResultTracker()  # 🆕 UPDATE: init tracker
+        self._step_capture = True  # keputusan CapturePolicy untuk step yang sedang jalan
+        self._step_scope = ("page", 0)  # (Scope, Padding) step yang sedang jalan
+        self._phase_times = dict.fromkeys(("resolve", "wait", "capture"), 0.0)  # detik per fase, di-reset tiap step
+        self._last_url = None
+        self._case_id = None   # case yang sedang jalan (dipakai log retry langkah login)
+        self._attempts = 1   # jumlah percobaan step terakhir (lihat _dispatch)
 
     @staticmethod
     def parse_locator(locator_type, locator_value):
-        mapping = {
-            "id": By.ID,
-            "name": By.NAME,
-            "xpath": By.XPATH,
-            "css": By.CSS_SELECTOR,
-            "link_text": By.LINK_TEXT,
-            "partial_link_text": By.PARTIAL_LINK_TEXT
-        }
-        return mapping[locator_type.lower()], locator_value
+        # locator dari ExecutionPlan sudah berupa (By, value), to_by melewatkannya apa adanya
+        return to_by(locator_type, locator_value)
+
+    # ================== TIMING ==================
+    def wait_until(self, timeout, condition, message="", locate=True):
+        """
+        WebDriverWait(...).until(condition) + catat waktunya per fase:
+        - resolve : waktu di dalam condition (find_element + cek state elemen)
+        - wait    : sisa waktu polling (sleep) sampai condition terpenuhi
+        locate=False -> semuanya dihitung wait (mis. nunggu halaman siap).
+        """
+        spent = 0.0
+
+        def timed(driver):
+            nonlocal spent
+            lookup = time.perf_counter()
+            try:
+                return condition(driver)
+            finally:
+                spent += time.perf_counter() - lookup
+
+        started = time.perf_counter()
+        try:
+            return WebDriverWait(self.driver, timeout).until(timed if locate else condition, message)
+        finally:
+            self._phase_times["resolve"] += spent
+            self._phase_times["wait"] += time.perf_counter() - started - spent
+
+    def _timed_capture(self, *args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return Utils.capture_screenshot(*args, **kwargs)
+        finally:
+            self._phase_times["capture"] += time.perf_counter() - started
+
+    # ================== CAPTURE ==================
+    def capture(self, run_dir, step_title=None, step_desc=None, element=None):
+        """
+        Screenshot di akhir keyword, mengikuti CapturePolicy step yang sedang jalan.
+        element: elemen yang sudah di-resolve keyword (dipakai Scope element/region).
+        Return None kalau step ini tidak perlu capture.
+        """
+        decision = self._step_capture
+        if decision is CapturePolicy.CHECK_NAVIGATION:
+            url = self.driver.current_url
+            decision = url != self._last_url
+            self._last_url = url
+        if not decision:
+            return None
+        scope, padding = self._step_scope
+        return self._timed_capture(self.driver, run_dir, step_title, step_desc,
+                                   element=element, scope=scope, padding=padding)
 
     # ================== ACTIONS ==================
-    def navigate(self, url):
+    # @keyword mendaftarkan action di testcase -> method + argumen yang diambil dari step
+    @keyword("navigate", "test_data", "ready")
+    def navigate(self, url, ready=None, timeout=None, run_dir=None, step_title=None, step_desc=None):
         print(f"[ACTION] Navigate to {url}")  # 🆕 LOG
         self.driver.get(url)
+        if ready is not None:
+            # PageLoad.Strategy eager/none: driver.get sudah balik, tunggu sampai halaman bisa dipakai
+            self.wait_until(timeout, ready, f"Halaman {url} belum siap ({ready.describe()})", locate=False)
+        self._last_url = self.driver.current_url  # acuan mode screenshot on-navigation
+        if run_dir:
+            return self.capture(run_dir, step_title, step_desc)
 
+    @keyword("click", "locator")
     def click(self, locator, timeout, run_dir=None, step_title=None, step_desc=None):
         print(f"[ACTION] Click on {locator}")  # 🆕 LOG
         locator_type, locator_value = self.parse_locator(*locator)
-        WebDriverWait(self.driver, timeout).until(
-            EC.element_to_be_clickable((locator_type, locator_value))
-        ).click()
-        return Utils.capture_screenshot(self.driver, run_dir, step_title, step_desc)  # 🆕 UPDATE
+        elem = self.wait_until(timeout, EC.element_to_be_clickable((locator_type, locator_value)))
+        elem.click()
+        # kalau click pindah halaman elemen jadi stale -> capture fallback full page
+        return self.capture(run_dir, step_title, step_desc, elem)  # 🆕 UPDATE
 
+    @keyword("type", "locator", "test_data")
     def type(self, locator, text, timeout, run_dir=None, step_title=None, step_desc=None):
         print(f"[ACTION] Type '{text}' into {locator}")  # 🆕 LOG
         locator_type, locator_value = self.parse_locator(*locator)
-        elem = WebDriverWait(self.driver, timeout).until(
-            EC.presence_of_element_located((locator_type, locator_value))
-        )
+        elem = self.wait_until(timeout, EC.presence_of_element_located((locator_type, locator_value)))
         elem.clear()
         elem.send_keys(text)
-        return Utils.capture_screenshot(self.driver, run_dir, step_title, step_desc)  # 🆕 UPDATE
+        return self.capture(run_dir, step_title, step_desc, elem)  # 🆕 UPDATE
 
+    @keyword("assert", "locator", "expected")
     def assert_text(self, locator, expected_text, timeout, run_dir=None, step_title=None, step_desc=None):
         print(f"[ACTION] Assert text '{expected_text}' on {locator}")  # 🆕 LOG
         locator_type, locator_value = self.parse_locator(*locator)
-        elem = WebDriverWait(self.driver, timeout).until(
-            EC.presence_of_element_located((locator_type, locator_value))
-        )
+        elem = self.wait_until(timeout, EC.presence_of_element_located((locator_type, locator_value)))
         actual = elem.text
         assert actual == expected_text, f"Expected {expected_text}, got {actual}"
-        return Utils.capture_screenshot(self.driver, run_dir, step_title, step_desc)  # 🆕 UPDATE
+        return self.capture(run_dir, step_title, step_desc, elem)  # 🆕 UPDATE
 
+    @keyword("select", "locator", "test_data")
     def select_by_value(self, locator, value, timeout, run_dir=None, step_title=None, step_desc=None):
         print(f"[ACTION] Select '{value}' in {locator}")  # 🆕 LOG
         locator_type, locator_value = self.parse_locator(*locator)
-        elem = WebDriverWait(self.driver, timeout).until(
-            EC.presence_of_element_located((locator_type, locator_value))
-        )
+        elem = self.wait_until(timeout, EC.presence_of_element_located((locator_type, locator_value)))
         select = Select(elem)
         try:
             select.select_by_value(value)
         except NoSuchElementException:
             select.select_by_visible_text(value)
-        return Utils.capture_screenshot(self.driver, run_dir, step_title, step_desc)  # 🆕 UPDATE
+        return self.capture(run_dir, step_title, step_desc, elem)  # 🆕 UPDATE
 
+    @keyword("hover", "locator")
     def hover(self, locator, timeout, run_dir=None, step_title=None, step_desc=None):
         print(f"[ACTION] Hover on {locator}")
         locator_type, locator_value = self.parse_locator(*locator)
-        elem = WebDriverWait(self.driver, timeout).until(
-            EC.visibility_of_element_located((locator_type, locator_value))
-        )
+        elem = self.wait_until(timeout, EC.visibility_of_element_located((locator_type, locator_value)))
         ActionChains(self.driver).move_to_element(elem).perform()
-        return Utils.capture_screenshot(self.driver, run_dir, step_title, step_desc)
+        return self.capture(run_dir, step_title, step_desc, elem)
 
+    @keyword("js_click", "locator")
     def js_click(self, locator, timeout, run_dir=None, step_title=None, step_desc=None):
         print(f"[ACTION] JS Click on {locator}")
         locator_type, locator_value = self.parse_locator(*locator)
-        elem = WebDriverWait(self.driver, timeout).until(
-            EC.element_to_be_clickable((locator_type, locator_value))
-        )
+        elem = self.wait_until(timeout, EC.element_to_be_clickable((locator_type, locator_value)))
         self.driver.execute_script("arguments[0].click();", elem)
-        return Utils.capture_screenshot(self.driver, run_dir, step_title, step_desc)
+        return self.capture(run_dir, step_title, step_desc, elem)
 
+    @keyword("drag_drop", "locator", "target")
     def drag_drop(self, source_locator, target_locator, timeout, run_dir=None, step_title=None, step_desc=None):
         print(f"[ACTION] Drag {source_locator} to {target_locator}")
         src_type, src_value = self.parse_locator(*source_locator)
         tgt_type, tgt_value = self.parse_locator(*target_locator)
-        source = WebDriverWait(self.driver, timeout).until(
-            EC.presence_of_element_located((src_type, src_value))
-        )
-        target = WebDriverWait(self.driver, timeout).until(
-            EC.presence_of_element_located((tgt_type, tgt_value))
-        )
+        source = self.wait_until(timeout, EC.presence_of_element_located((src_type, src_value)))
+        target = self.wait_until(timeout, EC.presence_of_element_located((tgt_type, tgt_value)))
         ActionChains(self.driver).drag_and_drop(source, target).perform()
-        return Utils.capture_screenshot(self.driver, run_dir, step_title, step_desc)
+        return self.capture(run_dir, step_title, step_desc, target)
 
+    @keyword("upload_file", "locator", "test_data")
     def upload_file(self, locator, file_path, timeout, run_dir=None, step_title=None, step_desc=None):
         print(f"[ACTION] Upload file {file_path} into {locator}")
         locator_type, locator_value = self.parse_locator(*locator)
-        elem = WebDriverWait(self.driver, timeout).until(
-            EC.presence_of_element_located((locator_type, locator_value))
-        )
+        elem = self.wait_until(timeout, EC.presence_of_element_located((locator_type, locator_value)))
         elem.send_keys(file_path)
-        return Utils.capture_screenshot(self.driver, run_dir, step_title, step_desc)
+        return self.capture(run_dir, step_title, step_desc, elem)
+
+    @keyword("login_once", "test_data")
+    def login_once(self, name, timeout, run_dir=None, step_title=None, step_desc=None):
+        """
+        Ganti langkah login di tiap case: login (GlobalData.Session.Logins.<name>) cukup sekali
+        per worker, case berikutnya cuma inject cookies + storage hasil login itu.
+        TestData = nama login (default "default").
+        """
+        name = name or "default"
+        config = ConfigRegistry.global_data().get("Session") or {}
+        login_case = (config.get("Logins") or {}).get(name)
+        if login_case is None:
+            raise ValueError(f"Login '{name}' tidak ada di GlobalData.Session.Logins")
+
+        store = SessionStore()
+        reuse = config.get("Enabled", True)
+        state = store.get(name, config.get("TTL")) if reuse else None
+        if state is not None:
+            if self._restore(name, state, config.get("Check"), timeout):
+                return self.capture(run_dir, step_title, step_desc)
+            store.invalidate(name)
+
+        print(f"[ACTION] Login '{name}'")
+        self._run_login_steps(login_case, timeout)
+        if reuse:
+            store.put(name, SessionStore.capture(self.driver))
+        return self.capture(run_dir, step_title, step_desc)
+
+    @keyword("restore_session", "test_data")
+    def restore_session(self, name, timeout, run_dir=None, step_title=None, step_desc=None):
+        """
+        Restore saja, tanpa login: inject state hasil login_once sebelumnya di worker yang sama.
+        Step FAILED kalau state belum ada / lewat TTL, atau locator Check tidak ada setelah restore
+        (case yang butuh login pasti di browser ini -> pakai login_once).
+        TestData = nama login (default "default").
+        """
+        name = name or "default"
+        config = ConfigRegistry.global_data().get("Session") or {}
+        store = SessionStore()
+        state = store.get(name, config.get("TTL"))
+        if state is None:
+            raise ValueError(f"Session '{name}' belum ada / kadaluarsa di worker ini, "
+                             f"jalankan login_once '{name}' dulu")
+        if not self._restore(name, state, config.get("Check"), timeout):
+            store.invalidate(name)
+            raise AssertionError(f"Session '{name}' tidak valid setelah restore "
+                                 f"(Check {config.get('Check')} tidak ditemukan)")
+        return self.capture(run_dir, step_title, step_desc)
+
+    def _restore(self, name, state, check, timeout):
+        """Inject state ke browser lalu cek locator Check. Return False kalau session expired di server."""
+        print(f"[ACTION] Restore session '{name}' (umur {state.age():.0f}s)")
+        SessionStore.inject(self.driver, state)
+        return self._session_valid(check, timeout)
+
+    def _run_login_steps(self, login_case, timeout):
+        """
+        Jalankan langkah login sebagai bagian dari 1 step (tanpa capture / log step sendiri).
+        Retry per langkah sama seperti step biasa (RetryPolicy hasil compile).
+        """
+        plan = self.compile_testcase(login_case, {})
+        decision = self._step_capture
+        self._step_capture = False
+        try:
+            for step in plan.steps:
+                if step.error:
+                    raise ValueError(f"Session login: {step.error}")
+                self._dispatch(self._case_id, step, timeout, None, f"login:{step.step_id}")
+        finally:
+            self._step_capture = decision
+
+    def _session_valid(self, check, timeout):
+        """Restore dianggap berhasil kalau locator Check ada (tanpa Check selalu dianggap valid)."""
+        if not check:
+            return True
+        locator, error = resolve_locator(check, {}, ConfigRegistry.global_data(), ConfigRegistry.global_locators())
+        if locator is None:
+            raise ValueError(f"Session Check: {error}")
+        try:
+            self.wait_until(timeout, EC.presence_of_element_located(locator))
+            return True
+        except TimeoutException:
+            print(f"[SESSION] Check {check} tidak ditemukan setelah restore, session dianggap expired")
+            return False
 
     # ================== VALUE RESOLVER ==================
     def resolve_value(self, value, globaldata: dict, test_data: str = None):
@@ -130,16 +267,28 @@ class GenericKeywords:
         return value
 
     # ================== YAML EXECUTOR ==================
-    def execute_testcase(self, testcase, LOCATORS, run_dir=None):
-        case_id = testcase.get("CaseID")
-        title = testcase.get("Title", "")
-        scenario_type = testcase.get("ScenarioType", "")
-        BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+    def compile_testcase(self, testcase, LOCATORS):
+        """
+        Compile testcase jadi ExecutionPlan: placeholder {global.x}/{value} sudah di-resolve,
+        locator sudah (By, value), tiap step sudah terikat ke keyword-nya.
+        Plan bisa disimpan dan dipakai ulang untuk execute_testcase.
+        """
+        return compile_testcase(
+            testcase, LOCATORS,
+            ConfigRegistry.global_data(),
+            ConfigRegistry.global_locators()
+        )
 
-        # 🆕 UPDATE: ambil globaldata & locator dari YAML, tanpa JSON
-        globaldata = YAMLReader.read(os.path.join(BASE_DIR, "..", "datatest", "global_data.yaml"))["GlobalData"]
-        globallocator = YAMLReader.read(os.path.join(BASE_DIR, "..", "datatest", "global_locators.yaml"))["GlobalLocators"]
-        DefaultTimeout = globaldata.get("Timeout")
+    def execute_testcase(self, testcase, LOCATORS, run_dir=None):
+        """
+        testcase boleh dict mentah dari DataLoader atau ExecutionPlan hasil compile_testcase.
+        Loop di sini cuma dispatch ke keyword (I/O ke browser), semua resolve sudah di compile.
+        """
+        plan = testcase if isinstance(testcase, ExecutionPlan) else self.compile_testcase(testcase, LOCATORS)
+        case_id = plan.case_id
+        title = plan.title
+        scenario_type = plan.scenario_type
+        globaldata = ConfigRegistry.global_data()
 
         # 🆕 UPDATE: set meta tracker langsung
         self.tracker.set_meta(
@@ -150,93 +299,116 @@ class GenericKeywords:
         )
 
         # 🆕 UPDATE: siapkan directory capture per testcase
-        testcase_dir = os.path.join(run_dir or "reports/capture", str(testcase["Title"]))
+        testcase_dir = os.path.join(run_dir or "reports/capture", str(title))
         os.makedirs(testcase_dir, exist_ok=True)
 
         # 🆕 UPDATE: mulai testcase di tracker
         self.tracker.start_test_case(case_id, title, scenario_type)
-        step_id = 0
-        for step in testcase.get("TestSteps", []):
-            action = step["Action"].lower()
-            locator_name = self.resolve_value(step.get("Locator"), globallocator)
-            test_data = self.resolve_value(step.get("TestData"), globaldata, step.get("TestData"))
-            expected = self.resolve_value(step.get("Expected"), globaldata, test_data)
-            step_title = step.get("Title", f"Step - {action}")
-            step_desc = step.get("Description", "")
-            step_id = step_id + 1
-
-            locator = None
-            if locator_name:
-                local_dict = LOCATORS.get("locators", LOCATORS)
-                local = local_dict.get(locator_name)
-                if local:
-                    resolved_value = self.resolve_value(local["LocatorValue"], globaldata, test_data)
-                    locator = (local["LocatorType"], resolved_value)
-                else:
-                    resolved_global = self.resolve_value(locator_name, globallocator, test_data)
-                    if isinstance(resolved_global, str):
-                        resolved_global = ast.literal_eval(resolved_global)
-                    locator = (resolved_global["LocatorType"], resolved_global["LocatorValue"])
-
-            # --- execute action + capture + log status ---
-            try:
-                shot = None
-                if action == "navigate":
-                    self.navigate(test_data)
-                    shot = Utils.capture_screenshot(self.driver, testcase_dir, step_title, step_desc)
-                elif action == "click" and locator:
-                    shot = self.click(locator, DefaultTimeout, testcase_dir, step_title, step_desc)
-                elif action == "type" and locator:
-                    shot = self.type(locator, test_data, DefaultTimeout, testcase_dir, step_title, step_desc)
-                elif action == "select" and locator:
-                    shot = self.select_by_value(locator, test_data, DefaultTimeout, testcase_dir, step_title, step_desc)
-                elif action == "assert" and locator:
-                    shot = self.assert_text(locator, expected, DefaultTimeout, testcase_dir, step_title, step_desc)
-                elif action == "hover" and locator:
-                    shot = self.hover(locator, DefaultTimeout, testcase_dir, step_title, step_desc)
-                elif action == "js_click" and locator:
-                    shot = self.js_click(locator, DefaultTimeout, testcase_dir, step_title, step_desc)
-                elif action == "drag_drop":
-                    source = locator
-                    #target_name = step.get("Target")
-                    target_name = test_data
-                    target = None
-                    if target_name:
-                        tgt_local = LOCATORS.get("locators", LOCATORS).get(target_name)
-                        if tgt_local:
-                            target = (tgt_local["LocatorType"], self.resolve_value(tgt_local["LocatorValue"], globaldata))
-                    if source and target:
-                        shot = self.drag_drop(source, target, DefaultTimeout, testcase_dir, step_title, step_desc)
-                elif action == "upload_file" and locator:
-                    shot = self.upload_file(locator, test_data, DefaultTimeout, testcase_dir, step_title, step_desc)                
-                else:
-                    pytest.fail(f"[ERROR] Unknown action or missing locator: {action}")
-
-                # 🆕 UPDATE: log capture ke tracker
-                self.tracker.log_step(
-                    case_id=case_id,
-                    step_id=step_id,
-                    step_title=step_title,
-                    step_desc=step_desc,
-                    image_path=(shot or {}).get("file", ""),
-                    status="passed"
-                )
-            except Exception as e:
+        self._last_url = None
+        self._case_id = case_id
+        status = "failed"  # tetap failed kalau loop berhenti karena exception / pytest.fail
+        try:
+            for step in plan.steps:
+                self._execute_step(plan, step, testcase_dir)
+            status = None   # dihitung tracker dari status step
+        finally:
+            # 🆕 UPDATE: finalize testcase (juga saat step gagal, supaya case_end tercatat)
+            self._step_capture = True
+            self._step_scope = ("page", 0)
+            ScreenshotWriter().flush()  # barrier: semua capture case ini sudah di disk
+            self.tracker.end_test_case(case_id, status)
+
+    def _step_timings(self, elapsed):
+        """Pecah durasi step per fase; action = sisa waktu di luar resolve, wait dan capture."""
+        phases = self._phase_times
+        return {
+            "resolve": phases["resolve"],
+            "wait": phases["wait"],
+            "action": max(0.0, elapsed - phases["resolve"] - phases["wait"] - phases["capture"]),
+            "capture": phases["capture"],
+        }
+
+    def _dispatch(self, case_id, step, timeout, run_dir, step_id=None):
+        """
+        Panggil keyword step; error sementara (stale, click ketutup, ...) -> ulang step ini saja,
+        bukan seluruh case. Jumlah percobaan disimpan di self._attempts (juga saat gagal).
+        """
+        attempt = 1
+        try:
+            while True:
+                try:
+                    return getattr(self, step.method)(*step.args, timeout, run_dir, step.title, step.description)
+                except Exception as e:
+                    if not step.retry.should_retry(e, attempt):
+                        raise
+                    self._backoff(case_id, step_id or step.step_id, step, attempt, e)
+                    attempt += 1
+        finally:
+            self._attempts = attempt
+
+    def _backoff(self, case_id, step_id, step, attempt, error):
+        """Catat retry ke tracker lalu tunggu sesuai RetryPolicy (dihitung sebagai fase wait)."""
+        delay = step.retry.delay(attempt)
+        message = str(error).strip().splitlines()
+        self.tracker.log_retry(case_id, step_id, attempt,
+                               f"{type(error).__name__}: {message[0] if message else ''}", delay)
+        if delay:
+            time.sleep(delay)
+            self._phase_times["wait"] += delay
+
+    def _execute_step(self, plan, step, testcase_dir):
+        """1 step: dispatch keyword + capture + log status ke tracker."""
+        case_id = plan.case_id
+        step_title = step.title
+        step_desc = step.description
+
+        # --- execute action + capture + log status ---
+        self._step_capture = step.capture
+        self._step_scope = (step.capture_scope, step.capture_padding)
+        self._phase_times = dict.fromkeys(("resolve", "wait", "capture"), 0.0)
+        started = time.perf_counter()
+        self._attempts = 1
+        try:
+            if step.error:
+                # error compile (action / locator tidak valid) lewat handler yang sama: step dicatat failed + screenshot
+                raise ValueError(step.error)
+            shot = self._dispatch(case_id, step, plan.timeout, testcase_dir)
+            elapsed = time.perf_counter() - started
+
+            # 🆕 UPDATE: log capture ke tracker
+            self.tracker.log_step(
+                case_id=case_id,
+                step_id=step.step_id,
+                step_title=step_title,
+                step_desc=step_desc,
+                image_path=(shot or {}).get("file", ""),
+                image_hash=(shot or {}).get("hash", ""),
+                status="passed",
+                duration=elapsed,
+                timings=self._step_timings(elapsed),
+                attempts=self._attempts
+            )
+        except Exception as e:
+            img_path, img_hash = "", ""
+            if step.capture_on_failure:
                 try:
-                    fail_shot = Utils.capture_screenshot(self.driver, testcase_dir, f"{step_title} (FAILED)", step_desc)
-                    img_path = fail_shot.get("file", "")
+                    fail_shot = self._timed_capture(self.driver, testcase_dir, f"{step_title} (FAILED)", step_desc)
+                    img_path, img_hash = fail_shot.get("file", ""), fail_shot.get("hash", "")
                 except Exception:
-                    img_path = ""
-                self.tracker.log_step(
-                    case_id=case_id,
-                    step_id=step_id,
-                    step_title=step_title,
-                    step_desc=step_desc,
-                    image_path=img_path,
-                    status="failed",
-                    error=str(e)
-                )
-                pytest.fail(f"[EXCEPTION] {e}")
-
-        # 🆕 UPDATE: finalize testcase
-        self.tracker.end_test_case(case_id)
+                    img_path, img_hash = "", ""
+            elapsed = time.perf_counter() - started  # termasuk screenshot kegagalan
+            self.tracker.log_step(
+                case_id=case_id,
+                step_id=step.step_id,
+                step_title=step_title,
+                step_desc=step_desc,
+                image_path=img_path,
+                image_hash=img_hash,
+                status="failed",
+                error=str(e),
+                duration=elapsed,
+                timings=self._step_timings(elapsed),
+                attempts=self._attempts
+            )
+            ScreenshotWriter().flush()
+            pytest.fail(f"[EXCEPTION] {e}")
@@ -0,0 +1,418 @@
+# core/history_store.py
+import os
+import socket
+import sqlite3
+import sys
+import threading
+import time
+from datetime import datetime
+
+from core.config_registry import ConfigRegistry
+from core.run_info import RunInfo
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_DIR = os.path.normpath(os.path.join(BASE_DIR, ".."))
+DEFAULT_PATH = os.path.join(PROJECT_DIR, ".cache", "history.sqlite")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id      TEXT PRIMARY KEY,
+    feature     TEXT,
+    started_at  TEXT,
+    finished_at TEXT,
+    exitstatus  TEXT,
+    host        TEXT,
+    passed      INTEGER,
+    failed      INTEGER,
+    total       INTEGER
+);
+CREATE TABLE IF NOT EXISTS cases (
+    run_id        TEXT NOT NULL,
+    feature       TEXT,
+    case_id       TEXT NOT NULL,
+    title         TEXT,
+    scenario_type TEXT,
+    status        TEXT,
+    duration      REAL,
+    PRIMARY KEY (run_id, case_id)
+);
+CREATE TABLE IF NOT EXISTS steps (
+    run_id   TEXT NOT NULL,
+    case_id  TEXT NOT NULL,
+    seq      INTEGER NOT NULL,
+    step_id  TEXT,
+    title    TEXT,
+    status   TEXT,
+    duration REAL,
+    error    TEXT,
+    resolve_time REAL,
+    wait_time    REAL,
+    action_time  REAL,
+    capture_time REAL,
+    attempts     INTEGER,
+    PRIMARY KEY (run_id, case_id, seq)
+);
+CREATE INDEX IF NOT EXISTS idx_cases_feature ON cases (feature, case_id);
+CREATE INDEX IF NOT EXISTS idx_runs_feature ON runs (feature, started_at);
+"""
+
+# kolom yang ditambah setelah tabel pertama kali dibuat: (tabel, kolom, tipe)
+MIGRATIONS = (
+    ("steps", "resolve_time", "REAL"),
+    ("steps", "wait_time", "REAL"),
+    ("steps", "action_time", "REAL"),
+    ("steps", "capture_time", "REAL"),
+    ("steps", "attempts", "INTEGER"),
+)
+STEP_COLUMNS = ("run_id", "case_id", "seq", "step_id", "title", "status", "duration", "error",
+                "resolve_time", "wait_time", "action_time", "capture_time", "attempts")
+
+
+def _case_rows(run_id, feature, case):
+    """(row tabel cases, list row tabel steps) dari 1 case dict (format snapshot / CaseRecord.to_dict())."""
+    case_id = str(case.get("case_id"))
+    case_row = (run_id, feature, case_id, case.get("title"), case.get("scenario_type"),
+                case.get("status"), case.get("duration"))
+    step_rows = []
+    for seq, step in enumerate(case.get("steps", []), start=1):
+        timings = step.get("timings") or {}
+        step_rows.append((run_id, case_id, seq, str(step.get("step_id")), step.get("title"),
+                          step.get("status"), step.get("duration"), step.get("error") or None,
+                          timings.get("resolve"), timings.get("wait"),
+                          timings.get("action"), timings.get("capture"),
+                          step.get("attempts") or 1))
+    return case_row, step_rows
+
+
+class HistoryStore:
+    """
+    Riwayat hasil run di SQLite lokal (default ProjectSelenium/.cache/history.sqlite).
+    - case/step ditulis tracker tiap worker saat case selesai (HistoryRecorder, per batch, WAL),
+      master cuma update baris runs (totals, exitstatus) setelah merge -> finish_run
+    - tanpa folder run (tidak ada tracker recorder) master simpan semuanya sekaligus -> record_run
+    - dipakai untuk lihat step paling lambat, case paling flaky, tren durasi per feature
+      dan (nanti) penjadwalan berdasarkan durasi historis
+
+    Config (GlobalData.History): {Enabled: true, Path: .cache/history.sqlite}
+    CLI: python -m core.history_store slowest|flaky|trend|cases [--feature login] [--limit 10] [--runs 20]
+    """
+    BATCH_SIZE = 500
+
+    def __init__(self, path=DEFAULT_PATH):
+        self.path = path
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        # koneksi boleh dipakai thread lain (tracker thread-safe); akses diserialkan HistoryRecorder
+        self.conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        self._migrate()
+
+    def _migrate(self):
+        """DB lama (sebelum kolom baru ada) -> ALTER TABLE ADD COLUMN."""
+        for table, column, kind in MIGRATIONS:
+            existing = {row["name"] for row in self.conn.execute(f"PRAGMA table_info({table})")}
+            if column not in existing:
+                self.conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {kind}")
+
+    @classmethod
+    def from_config(cls, globaldata):
+        """Return HistoryStore kalau GlobalData.History.Enabled, selain itu None."""
+        if not (globaldata.get("History") or {}).get("Enabled"):
+            return None
+        return cls(cls.path_from_config(globaldata))
+
+    @staticmethod
+    def path_from_config(globaldata):
+        """GlobalData.History.Path (relatif ke folder ProjectSelenium), default .cache/history.sqlite."""
+        config = globaldata.get("History") or {}
+        path = os.path.expanduser(str(config.get("Path") or DEFAULT_PATH))
+        if not os.path.isabs(path):
+            path = os.path.join(PROJECT_DIR, path)
+        return path
+
+    @staticmethod
+    def run_id_of(run_root=None):
+        """(run_id, started_at): nama folder run_YYYYmmdd_HHMMSS, tanpa folder pakai waktu sekarang."""
+        run_id = os.path.basename(os.path.normpath(run_root)) if run_root else datetime.now().strftime("run_%Y%m%d_%H%M%S")
+        try:
+            started_at = datetime.strptime(run_id, "run_%Y%m%d_%H%M%S").isoformat()
+        except ValueError:
+            started_at = None
+        return run_id, started_at
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # -------------------- Tulis --------------------
+    def record_run(self, run_id, snapshot, feature=None, exitstatus=None, started_at=None):
+        """
+        Simpan 1 run dari snapshot {meta, cases, totals}. cases boleh MergedCases (streaming):
+        step di-insert per BATCH_SIZE, memori tidak ikut membesar dengan jumlah step.
+        Run dengan run_id yang sama ditimpa.
+        """
+        totals = snapshot.get("totals", {})
+        with self.conn:
+            for table in ("steps", "cases", "runs"):
+                self.conn.execute(f"DELETE FROM {table} WHERE run_id = ?", (run_id,))
+            self.conn.execute(
+                "INSERT INTO runs VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (run_id, feature, started_at, datetime.now().isoformat(timespec="seconds"),
+                 exitstatus, socket.gethostname(),
+                 totals.get("passed", 0), totals.get("failed", 0), totals.get("total", 0))
+            )
+
+            case_rows, step_rows = [], []
+            for case in snapshot.get("cases", []):
+                case_row, rows = _case_rows(run_id, feature, case)
+                case_rows.append(case_row)
+                step_rows.extend(rows)
+                if len(step_rows) >= self.BATCH_SIZE:
+                    self._flush(case_rows, step_rows)
+            self._flush(case_rows, step_rows)
+
+        print(f"[HISTORY] Run {run_id} disimpan ke {self.path}")
+
+    def begin_run(self, run_id, feature=None, started_at=None):
+        """Baris runs awal (tanpa totals) supaya case yang ditulis worker sudah ikut query selama run jalan."""
+        with self.conn:
+            self.conn.execute("INSERT OR IGNORE INTO runs (run_id, feature, started_at, host) VALUES (?, ?, ?, ?)",
+                              (run_id, feature, started_at, socket.gethostname()))
+
+    def record_cases(self, run_id, feature, cases):
+        """
+        Simpan case yang sudah selesai tanpa menyentuh case lain di run yang sama (1 transaksi).
+        CaseID yang ditulis ulang (rerun / retry di worker lain) menggantikan case + step lamanya.
+        """
+        case_rows, step_rows = [], []
+        for case in cases:
+            case_row, rows = _case_rows(run_id, feature, case)
+            case_rows.append(case_row)
+            step_rows.extend(rows)
+        with self.conn:
+            self.conn.executemany("DELETE FROM steps WHERE run_id = ? AND case_id = ?",
+                                  [(run_id, row[2]) for row in case_rows])
+            self._flush(case_rows, step_rows)
+
+    def finish_run(self, run_id, totals, feature=None, exitstatus=None, started_at=None):
+        """Update baris runs setelah merge (totals, exitstatus); case/step sudah ditulis tracker."""
+        with self.conn:
+            self.conn.execute(
+                """INSERT INTO runs VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                   ON CONFLICT (run_id) DO UPDATE SET
+                       feature = COALESCE(runs.feature, excluded.feature),
+                       started_at = COALESCE(runs.started_at, excluded.started_at),
+                       finished_at = excluded.finished_at, exitstatus = excluded.exitstatus,
+                       host = excluded.host, passed = excluded.passed,
+                       failed = excluded.failed, total = excluded.total""",
+                (run_id, feature, started_at, datetime.now().isoformat(timespec="seconds"),
+                 exitstatus, socket.gethostname(),
+                 totals.get("passed", 0), totals.get("failed", 0), totals.get("total", 0))
+            )
+        print(f"[HISTORY] Run {run_id} selesai, tersimpan di {self.path}")
+
+    def _flush(self, case_rows, step_rows):
+        if case_rows:
+            self.conn.executemany("INSERT OR REPLACE INTO cases VALUES (?, ?, ?, ?, ?, ?, ?)", case_rows)
+        if step_rows:
+            self.conn.executemany(
+                f"INSERT OR REPLACE INTO steps ({', '.join(STEP_COLUMNS)}) "
+                f"VALUES ({', '.join('?' * len(STEP_COLUMNS))})", step_rows)
+        case_rows.clear()
+        step_rows.clear()
+
+    # -------------------- Query --------------------
+    def _recent_runs(self, feature, runs):
+        """Subquery run_id untuk N run terakhir (per feature kalau diisi)."""
+        where = "WHERE feature = ?" if feature else ""
+        params = [feature] if feature else []
+        return (f"SELECT run_id FROM runs {where} ORDER BY started_at DESC, run_id DESC LIMIT ?",
+                params + [int(runs)])
+
+    def slowest_steps(self, feature=None, limit=10, runs=20):
+        """Step dengan rata-rata durasi paling lama di N run terakhir (+ rata-rata per fase)."""
+        recent, params = self._recent_runs(feature, runs)
+        return [dict(r) for r in self.conn.execute(f"""
+            SELECT s.case_id, s.step_id, s.title, COUNT(*) AS samples,
+                   AVG(s.duration) AS avg_duration, MAX(s.duration) AS max_duration,
+                   AVG(s.wait_time) AS avg_wait, AVG(s.action_time) AS avg_action,
+                   AVG(s.capture_time) AS avg_capture
+            FROM steps s
+            WHERE s.duration IS NOT NULL AND s.run_id IN ({recent})
+            GROUP BY s.case_id, s.step_id, s.title
+            ORDER BY avg_duration DESC LIMIT ?""", params + [int(limit)])]
+
+    def flakiest_cases(self, feature=None, limit=10, runs=20):
+        """
+        Case yang hasilnya berubah-ubah (passed dan failed) di N run terakhir.
+        flip = berapa kali status berganti antar run berurutan.
+        """
+        recent, params = self._recent_runs(feature, runs)
+        rows = self.conn.execute(f"""
+            SELECT c.case_id, c.title, c.status
+            FROM cases c JOIN runs r ON r.run_id = c.run_id
+            WHERE c.run_id IN ({recent}) AND c.status IN ('passed', 'failed')
+            ORDER BY c.case_id, r.started_at, r.run_id""", params)
+
+        stats = {}
+        for row in rows:
+            item = stats.setdefault(row["case_id"], {
+                "case_id": row["case_id"], "title": row["title"],
+                "runs": 0, "failed": 0, "flips": 0, "_last": None
+            })
+            item["runs"] += 1
+            item["failed"] += row["status"] == "failed"
+            if item["_last"] is not None and item["_last"] != row["status"]:
+                item["flips"] += 1
+            item["_last"] = row["status"]
+
+        result = []
+        for item in stats.values():
+            item.pop("_last")
+            if 0 < item["failed"] < item["runs"]:
+                item["fail_rate"] = item["failed"] / item["runs"]
+                result.append(item)
+        result.sort(key=lambda i: (i["flips"], i["fail_rate"]), reverse=True)
+        return result[:int(limit)]
+
+    def duration_trend(self, feature=None, runs=20):
+        """Total durasi case per run (lama -> baru), untuk lihat runtime suite naik/turun."""
+        recent, params = self._recent_runs(feature, runs)
+        rows = self.conn.execute(f"""
+            SELECT r.run_id, r.feature, r.started_at, COUNT(c.case_id) AS cases,
+                   SUM(c.duration) AS total_duration, r.passed, r.failed
+            FROM runs r LEFT JOIN cases c ON c.run_id = r.run_id
+            WHERE r.run_id IN ({recent})
+            GROUP BY r.run_id
+            ORDER BY r.started_at, r.run_id""", params)
+        return [dict(r) for r in rows]
+
+    def case_durations(self, feature=None, runs=5):
+        """{case_id: rata-rata durasi} dari N run terakhir (bahan penjadwalan)."""
+        recent, params = self._recent_runs(feature, runs)
+        rows = self.conn.execute(f"""
+            SELECT case_id, AVG(duration) AS avg_duration FROM cases
+            WHERE duration IS NOT NULL AND run_id IN ({recent})
+            GROUP BY case_id""", params)
+        return {r["case_id"]: r["avg_duration"] for r in rows}
+
+
+class HistoryRecorder:
+    """
+    Penulis history di sisi tracker (1 per proses / worker, lihat ResultTracker.attach_history):
+    case yang selesai (end_test_case) di-buffer lalu ditulis per batch, tiap BATCH_SIZE step
+    atau FLUSH_SECONDS, sisanya saat close(). Worker yang mati kehilangan batch terakhir saja
+    (hasilnya tetap ada di event log / PDF); case incomplete tidak masuk history.
+    """
+    FLUSH_SECONDS = 5.0
+
+    def __init__(self, store, run_id, feature=None, started_at=None):
+        self.store = store
+        self.run_id = run_id
+        self.feature = feature
+        self._lock = threading.Lock()
+        self._pending = []
+        self._pending_steps = 0
+        self._last_flush = time.monotonic()
+        store.begin_run(run_id, feature, started_at)
+
+    @classmethod
+    def for_run(cls, globaldata, run_root):
+        """Recorder untuk folder run ini, None kalau History tidak aktif / DB tidak bisa dibuka."""
+        try:
+            store = HistoryStore.from_config(globaldata)
+            if store is None:
+                return None
+            run_id, started_at = HistoryStore.run_id_of(run_root)
+            return cls(store, run_id, RunInfo.read(run_root).get("feature"), started_at)
+        except Exception as e:
+            print(f"[WARN] History tidak dicatat di proses ini: {e}")
+            return None
+
+    def add(self, case):
+        """case = CaseRecord.to_dict() yang sudah selesai."""
+        with self._lock:
+            self._pending.append(case)
+            self._pending_steps += len(case.get("steps", []))
+            due = (self._pending_steps >= self.store.BATCH_SIZE
+                   or time.monotonic() - self._last_flush >= self.FLUSH_SECONDS)
+        if due:
+            self.flush()
+
+    def flush(self):
+        with self._lock:
+            cases, self._pending, self._pending_steps = self._pending, [], 0
+            self._last_flush = time.monotonic()
+            if not cases:
+                return
+            try:
+                self.store.record_cases(self.run_id, self.feature, cases)
+            except sqlite3.Error as e:
+                print(f"[WARN] Gagal simpan {len(cases)} case ke history: {e}")
+
+    def close(self):
+        self.flush()
+        self.store.close()
+
+
+# -------------------- CLI --------------------
+def _print_rows(rows):
+    if not rows:
+        print("(kosong)")
+        return
+    columns = list(rows[0].keys())
+    print(" | ".join(columns))
+    for row in rows:
+        print(" | ".join(f"{row[c]:.3f}" if isinstance(row[c], float) else str(row[c]) for c in columns))
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    commands = ("slowest", "flaky", "trend", "cases")
+    if not argv or argv[0] not in commands:
+        print(f"Usage: python -m core.history_store {'|'.join(commands)} "
+              "[--feature <name>] [--limit N] [--runs N] [--db <path>]")
+        return 2
+
+    # default --db sama dengan yang dipakai writer (GlobalData.History.Path)
+    try:
+        default_db = HistoryStore.path_from_config(ConfigRegistry.global_data())
+    except FileNotFoundError:
+        default_db = DEFAULT_PATH
+    command, opts = argv[0], {"--feature": None, "--limit": "10", "--runs": "20", "--db": default_db}
+    args = iter(argv[1:])
+    for arg in args:
+        if arg not in opts:
+            print(f"[ERROR] Opsi tidak dikenal: {arg}")
+            return 2
+        opts[arg] = next(args, None)
+
+    if not os.path.isfile(opts["--db"]):
+        print(f"[ERROR] History belum ada: {opts['--db']}")
+        return 2
+
+    feature, limit, runs = opts["--feature"], int(opts["--limit"]), int(opts["--runs"])
+    with HistoryStore(opts["--db"]) as store:
+        if command == "slowest":
+            rows = store.slowest_steps(feature, limit, runs)
+        elif command == "flaky":
+            rows = store.flakiest_cases(feature, limit, runs)
+        elif command == "trend":
+            rows = store.duration_trend(feature, runs)
+        else:
+            durations = store.case_durations(feature, runs)
+            rows = [{"case_id": k, "avg_duration": v}
+                    for k, v in sorted(durations.items(), key=lambda kv: kv[1], reverse=True)][:limit]
+    _print_rows(rows)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
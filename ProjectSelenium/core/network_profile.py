@@ -0,0 +1,103 @@
+# core/network_profile.py
+
+# ResourceTypes -> ekstensi file (CDP Network.setBlockedURLs cuma kenal pola URL, bukan tipe resource)
+RESOURCE_EXTENSIONS = {
+    "image": ("png", "jpg", "jpeg", "gif", "webp", "svg", "ico", "avif"),
+    "font": ("woff", "woff2", "ttf", "otf", "eot"),
+    "media": ("mp4", "webm", "ogg", "mp3", "wav", "m4a"),
+    "stylesheet": ("css",),
+    "script": ("js",),
+}
+# asset versioned / CDN ("/logo.png?v=3", "/app.js#x") juga kena, tapi "/data.json" tidak ikut "*.js*"
+RESOURCE_PATTERNS = {
+    key: tuple(pattern for ext in exts for pattern in (f"*.{ext}", f"*.{ext}?*", f"*.{ext}#*"))
+    for key, exts in RESOURCE_EXTENSIONS.items()
+}
+
+# profil bawaan: Latency ms, Download/Upload kbit/s (angka mengikuti preset DevTools)
+PROFILES = {
+    "none": None,
+    "offline": {"Offline": True, "Latency": 0, "Download": 0, "Upload": 0},
+    "slow-3g": {"Latency": 400, "Download": 400, "Upload": 400},
+    "fast-3g": {"Latency": 150, "Download": 1600, "Upload": 750},
+    "4g": {"Latency": 20, "Download": 9000, "Upload": 9000},
+}
+
+
+class NetworkProfile:
+    """
+    Atur network browser lewat Chrome DevTools (chrome/edge), dipasang sekali saat driver dibuat:
+    - Block.Patterns      : pola URL yang diblok (iklan, analytics, ...), wildcard * didukung
+    - Block.ResourceTypes : image / font / media / stylesheet / script -> diblok per ekstensi file
+    - Profile             : none / offline / slow-3g / fast-3g / 4g / nama di Profiles
+    Browser tanpa CDP (firefox) dilewati dengan warning, test tetap jalan normal.
+
+    Config (GlobalData.Network):
+        Block: {Patterns: ["*google-analytics.com*"], ResourceTypes: [image, font]}
+        Profile: fast-3g
+        Profiles: {kantor: {Latency: 80, Download: 2000, Upload: 1000}}
+    """
+
+    def __init__(self, blocked_urls=(), profile="none", conditions=None):
+        self.blocked_urls = tuple(blocked_urls)
+        self.profile = profile
+        self.conditions = conditions   # dict param Network.emulateNetworkConditions, None = tanpa throttle
+
+    @classmethod
+    def from_config(cls, globaldata):
+        config = globaldata.get("Network") or {}
+        block = config.get("Block") or {}
+
+        blocked = list(block.get("Patterns") or ())
+        for resource_type in block.get("ResourceTypes") or ():
+            key = str(resource_type).strip().lower()
+            if key not in RESOURCE_PATTERNS:
+                raise ValueError(f"Network ResourceType tidak dikenal: '{resource_type}' "
+                                 f"(pilihan: {', '.join(RESOURCE_PATTERNS)})")
+            blocked.extend(RESOURCE_PATTERNS[key])
+
+        name = str(config.get("Profile") or "none").strip().lower()
+        custom = {str(k).lower(): v for k, v in (config.get("Profiles") or {}).items()}
+        if name in custom:
+            profile = custom[name]
+        elif name in PROFILES:
+            profile = PROFILES[name]
+        else:
+            raise ValueError(f"Network profile tidak dikenal: '{name}' "
+                             f"(pilihan: {', '.join(list(PROFILES) + list(custom))})")
+        return cls(dict.fromkeys(blocked), name, cls._conditions(profile))
+
+    @staticmethod
+    def _conditions(profile):
+        if not profile:
+            return None
+
+        def kbps(key):   # kbit/s -> byte/s
+            return int(float(profile.get(key) or 0) * 1024 / 8)
+
+        return {
+            "offline": bool(profile.get("Offline", False)),
+            "latency": float(profile.get("Latency") or 0),
+            # 0 di config = tanpa batas, di CDP -1 = tanpa batas
+            "downloadThroughput": kbps("Download") or -1,
+            "uploadThroughput": kbps("Upload") or -1,
+        }
+
+    @property
+    def active(self):
+        return bool(self.blocked_urls) or self.conditions is not None
+
+    def apply(self, driver):
+        """Pasang blocklist + throttle ke driver. Return False kalau browser tidak mendukung CDP."""
+        if not self.active:
+            return True
+        if not hasattr(driver, "execute_cdp_cmd"):
+            print("[NETWORK][WARN] Browser tanpa Chrome DevTools, blocklist/throttle dilewati")
+            return False
+        driver.execute_cdp_cmd("Network.enable", {})
+        if self.blocked_urls:
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(self.blocked_urls)})
+        if self.conditions is not None:
+            driver.execute_cdp_cmd("Network.emulateNetworkConditions", self.conditions)
+        print(f"[NETWORK] {len(self.blocked_urls)} pola URL diblok, profile: {self.profile}")
+        return True
@@ -0,0 +1,115 @@
+# core/page_load.py
+import re
+
+STRATEGIES = ("normal", "eager", "none")
+READY_STATES = ("loading", "interactive", "complete")
+_STRING_LITERAL = re.compile(r"'(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\"|`[^`]*`")
+_RETURN = re.compile(r"\breturn\b")
+
+
+class PageReady:
+    """
+    Kondisi "halaman siap dipakai" setelah driver.get, dipakai bersama PageLoad.Strategy:
+    - normal : driver.get nunggu semua resource (gambar, font, iklan) selesai (default selenium)
+    - eager  : driver.get balik saat DOMContentLoaded
+    - none   : driver.get langsung balik, kesiapan ditentukan kondisi di bawah
+
+    Kondisi (semua harus terpenuhi, dicek berulang sampai Timeout):
+    - State   : document.readyState minimal interactive / complete
+    - Element : locator yang harus sudah ada di DOM (nama locator / {global.X})
+    - Script  : predicate JS, contoh "window.appReady === true"
+                1 ekspresi (tanpa ; / baris baru) otomatis jadi "return (...)";
+                script berisi statement wajib return sendiri, contoh "var a = window.app; return a && a.ready;"
+
+    Config (prioritas: step navigate > GlobalData.PageLoad):
+        GlobalData.PageLoad: {Strategy: eager, State: interactive, Element: ..., Script: ...}
+        step["Ready"]: "complete" (State saja) atau {State: ..., Element: ..., Script: ...}
+    """
+    __slots__ = ("state", "element", "script")
+
+    def __init__(self, state=None, element=None, script=None):
+        state = str(state).strip().lower() if state else None
+        if state is not None and state not in READY_STATES:
+            raise ValueError(f"Ready state tidak dikenal: '{state}' (pilihan: {', '.join(READY_STATES)})")
+        self.state = state
+        self.element = element   # nama locator saat dibaca dari config, (By, value) setelah di-resolve
+        self.script = self._script(script)
+
+    @staticmethod
+    def _script(script):
+        """Predicate JS siap pakai untuk execute_script (selalu ada return)."""
+        script = str(script).strip() if script else None
+        if not script:
+            return None
+        code = _STRING_LITERAL.sub("''", script)   # ; / return di dalam string tidak dihitung
+        if _RETURN.search(code):
+            return script   # sudah ada return (termasuk hasil bungkus sebelumnya): dipakai apa adanya
+        script, code = script.rstrip("; \t"), code.rstrip("; \t")
+        if not script:
+            return None
+        if ";" in code or "\n" in code:
+            raise ValueError(f"Ready Script berisi statement tapi tidak ada return: {script!r} "
+                             f"(tulis 1 ekspresi, atau return hasilnya secara eksplisit)")
+        return f"return ({script});"
+
+    @staticmethod
+    def strategy(globaldata):
+        """PageLoad.Strategy dari GlobalData (default normal)."""
+        strategy = str((globaldata.get("PageLoad") or {}).get("Strategy") or "normal").strip().lower()
+        if strategy not in STRATEGIES:
+            raise ValueError(f"PageLoad.Strategy tidak dikenal: '{strategy}' (pilihan: {', '.join(STRATEGIES)})")
+        return strategy
+
+    @classmethod
+    def from_config(cls, config, base=None):
+        """config: None / str State / dict {State, Element, Script}. Field kosong diambil dari base."""
+        base = base or cls()
+        if config is None or config == "":
+            return base
+        if isinstance(config, str):
+            return cls(config, base.element, base.script)
+        if not isinstance(config, dict):
+            raise ValueError(f"Ready tidak valid: {config!r}")
+        return cls(
+            config.get("State", base.state),
+            config.get("Element", base.element),
+            config.get("Script", base.script),
+        )
+
+    @classmethod
+    def resolve(cls, globaldata, step=None):
+        """
+        Default GlobalData.PageLoad, di-override step["Ready"].
+        Strategy none tanpa State -> minimal interactive (DOM sudah bisa dicari).
+        """
+        config = globaldata.get("PageLoad") or {}
+        ready = cls(config.get("State"), config.get("Element"), config.get("Script"))
+        if cls.strategy(globaldata) == "none" and ready.state is None:
+            ready.state = "interactive"
+        if step:
+            ready = cls.from_config(step.get("Ready"), ready)
+        return ready
+
+    @property
+    def active(self):
+        return bool(self.state or self.element or self.script)
+
+    def __call__(self, driver):
+        """Expected condition untuk WebDriverWait: truthy kalau semua kondisi terpenuhi."""
+        if self.state:
+            current = driver.execute_script("return document.readyState")
+            if current not in READY_STATES or READY_STATES.index(current) < READY_STATES.index(self.state):
+                return False
+        if self.element and not driver.find_elements(*self.element):
+            return False
+        if self.script and not driver.execute_script(self.script):
+            return False
+        return True
+
+    def describe(self):
+        parts = [f"state>={self.state}"] if self.state else []
+        if self.element:
+            parts.append(f"element {self.element}")
+        if self.script:
+            parts.append(f"script {self.script}")
+        return ", ".join(parts)
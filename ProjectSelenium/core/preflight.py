@@ -0,0 +1,183 @@
+# core/preflight.py
+"""
+Validasi data testcase TANPA browser, supaya data rusak ketahuan dalam milidetik,
+bukan setelah Chrome start + load baseURL.
+
+CLI:
+    python -m core.preflight login
+    python -m core.preflight datatest/login
+"""
+import os
+import re
+import sys
+from functools import lru_cache
+
+from selenium.webdriver.common.by import By
+from core.config_registry import ConfigRegistry
+from core.data_loader import DataLoader
+from core.step_plan import compile_testcase
+import core.generic_keywords  # noqa: F401 - registrasi @keyword (daftar action yang valid)
+
+try:  # opsional: validasi XPath/CSS lebih akurat kalau lxml/cssselect terpasang
+    from lxml import etree as _lxml_etree
+except ImportError:
+    _lxml_etree = None
+try:
+    import cssselect as _cssselect
+except ImportError:
+    _cssselect = None
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+_GLOBAL_REF = re.compile(r"\{global\.([a-zA-Z0-9_]+)\}")
+_ANY_GLOBAL = re.compile(r"\{global\.[^{}]*\}?")
+
+
+def _balanced(expr):
+    """Cek kurung [] () dan quote seimbang (fallback kalau lxml/cssselect tidak ada)."""
+    pairs = {"]": "[", ")": "("}
+    stack = []
+    quote = None
+    for ch in expr:
+        if quote:
+            if ch == quote:
+                quote = None
+            continue
+        if ch in ("'", '"'):
+            quote = ch
+        elif ch in "[(":
+            stack.append(ch)
+        elif ch in "])":
+            if not stack or stack.pop() != pairs[ch]:
+                return False
+    return not stack and quote is None
+
+
+@lru_cache(maxsize=2048)
+def check_selector(by, value):
+    """Return pesan error kalau selector tidak valid secara sintaks, selain itu None."""
+    if value is None or str(value).strip() == "":
+        return "LocatorValue kosong"
+    value = str(value)
+    if by == By.XPATH:
+        if _lxml_etree is not None:
+            try:
+                _lxml_etree.XPath(value)
+            except _lxml_etree.XPathSyntaxError as e:
+                return f"XPath tidak valid '{value}': {e}"
+        elif not _balanced(value) or value.rstrip().endswith(("/", "[", "(", "=")):
+            return f"XPath tidak valid '{value}'"
+    elif by == By.CSS_SELECTOR:
+        if _cssselect is not None:
+            try:
+                _cssselect.parse(value)
+            except _cssselect.SelectorError as e:
+                return f"CSS selector tidak valid '{value}': {e}"
+        elif not _balanced(value):
+            return f"CSS selector tidak valid '{value}'"
+    return None
+
+
+def _placeholder_issues(field, value, globaldata):
+    if not isinstance(value, str) or "{global" not in value:
+        return []
+    issues = []
+    for m in _ANY_GLOBAL.finditer(value):
+        ref = _GLOBAL_REF.fullmatch(m.group(0))
+        if ref is None:
+            issues.append(f"{field}: placeholder rusak '{m.group(0)}'")
+        elif ref.group(1) not in globaldata:
+            issues.append(f"{field}: key '{ref.group(1)}' tidak ada di GlobalData")
+    return issues
+
+
+class Preflight:
+
+    @staticmethod
+    def validate_testcase(testcase, locators, globaldata=None, globallocator=None):
+        """
+        Validasi 1 testcase. Return list of (step_id, pesan). List kosong = aman.
+        """
+        globaldata = ConfigRegistry.global_data() if globaldata is None else globaldata
+        globallocator = ConfigRegistry.global_locators() if globallocator is None else globallocator
+        plan = compile_testcase(testcase, locators, globaldata, globallocator)
+
+        issues = []
+        for step in plan.steps:
+            if step.error:
+                issues.append((step.step_id, step.error))
+
+            raw = step.source or {}
+            # Locator {global.X} dicek ke GlobalLocators oleh compile, sisanya ke GlobalData
+            for field in ("TestData", "Expected"):
+                for msg in _placeholder_issues(field, raw.get(field), globaldata):
+                    issues.append((step.step_id, msg))
+
+            for arg in step.args:
+                if isinstance(arg, tuple) and len(arg) == 2:
+                    by, value = arg
+                    msg = _placeholder_issues("LocatorValue", value, globaldata)
+                    msg = msg[0] if msg else check_selector(by, value)
+                    if msg:
+                        issues.append((step.step_id, msg))
+
+            if step.action == "navigate" and not step.test_data:
+                issues.append((step.step_id, "navigate tanpa URL di TestData"))
+
+        return issues
+
+    @staticmethod
+    def validate_feature(folder):
+        """
+        Validasi semua case di folder feature.
+        Case dibaca lewat DataLoader.load_testcases (bukan iter_testcases) supaya aturan merge-nya
+        sama dengan collection: CaseID yang barisnya terpisah di file divalidasi sebagai 1 case
+        utuh (nomor step sama dengan saat jalan), dan DataCache sudah terisi untuk worker.
+        Return dict {CaseID: [(step_id, pesan), ...]} hanya untuk case yang bermasalah.
+        """
+        locators = DataLoader.load_locators(folder)
+        globaldata = ConfigRegistry.global_data()
+        globallocator = ConfigRegistry.global_locators()
+
+        report = {}
+        for testcase in DataLoader.load_testcases(folder).get("test_cases", []):
+            issues = Preflight.validate_testcase(testcase, locators, globaldata, globallocator)
+            if issues:
+                report.setdefault(str(testcase.get("CaseID")), []).extend(issues)
+        return report
+
+    @staticmethod
+    def format_issues(case_id, issues):
+        lines = [f"[PREFLIGHT] {case_id}:"]
+        lines.extend(f"    step {step_id}: {msg}" for step_id, msg in issues)
+        return "\n".join(lines)
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv:
+        print("Usage: python -m core.preflight <feature_name|folder>")
+        return 2
+
+    target = argv[0]
+    folder = target if os.path.isdir(target) else os.path.join(BASE_DIR, "..", "datatest", target)
+    try:
+        report = Preflight.validate_feature(folder)
+    except FileNotFoundError as e:
+        print(f"[ERROR] {e}")
+        return 2
+    except (ValueError, AttributeError, KeyError, TypeError) as e:
+        print(f"[ERROR] Gagal load data {folder}: {type(e).__name__}: {e}")
+        return 2
+
+    for case_id, issues in report.items():
+        print(Preflight.format_issues(case_id, issues))
+    if report:
+        print(f"[PREFLIGHT] {len(report)} case bermasalah di {folder}")
+        return 1
+    print(f"[PREFLIGHT] OK: {folder}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
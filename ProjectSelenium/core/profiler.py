@@ -0,0 +1,147 @@
+# core/profiler.py
+import cProfile
+import io
+import os
+import pstats
+import sys
+import threading
+import uuid
+from collections import Counter
+
+
+class SessionProfiler:
+    """
+    Profiling 1 proses pytest (worker xdist / master) selama session, opt-in lewat --profile.
+    - cprofile : cProfile deterministik -> run_*/profile_<session>_<pid>.prof
+    - sample   : sampling stack tiap interval (overhead kecil) -> run_*/profile_<session>_<pid>.collapsed
+                 (format collapsed stack, bisa langsung dipakai flamegraph.pl / speedscope)
+    <session> = token acak dari master, sama untuk semua worker 1 session: --rerun_failed / --resume
+    menulis ke run_* lama tanpa menimpa / ikut menggabungkan profile session sebelumnya.
+    Master menggabungkan file session ini saja di pytest_sessionfinish (merge()); path file worker
+    dikirim lewat workeroutput.
+    """
+    MODES = ("cprofile", "sample")
+    PREFIX = "profile_"
+
+    def __init__(self, mode="cprofile", interval=0.005, session=None):
+        if mode not in self.MODES:
+            raise ValueError(f"Mode profile tidak dikenal: '{mode}' (pilihan: {', '.join(self.MODES)})")
+        self.mode = mode
+        self.interval = max(0.001, float(interval))
+        self.session = session or uuid.uuid4().hex[:8]
+        self.files = []   # master: file profile worker session ini (dari workeroutput)
+        self._profile = None
+        self._samples = Counter()
+        self._stop = threading.Event()
+        self._thread = None
+
+    # -------------------- Start / Stop --------------------
+    def start(self):
+        if self.mode == "cprofile":
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+        else:
+            self._thread = threading.Thread(target=self._sample_loop, name="profiler", daemon=True)
+            self._thread.start()
+        print(f"[PROFILE] Mulai ({self.mode}) di proses {os.getpid()}")
+
+    def stop(self):
+        if self._profile is not None:
+            self._profile.disable()
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+
+    def _sample_loop(self):
+        own = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            for ident, frame in sys._current_frames().items():
+                if ident == own:
+                    continue
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                    frame = frame.f_back
+                self._samples[";".join(reversed(stack))] += 1
+
+    def dump(self, run_root):
+        """Stop lalu tulis file profile proses ini ke run_root. Return path."""
+        self.stop()
+        base = os.path.join(run_root, f"{self.PREFIX}{self.session}_{os.getpid()}")
+        if self.mode == "cprofile":
+            path = base + ".prof"
+            self._profile.dump_stats(path)
+        else:
+            path = base + ".collapsed"
+            with open(path, "w", encoding="utf-8") as f:
+                for stack, count in self._samples.items():
+                    f.write(f"{stack} {count}\n")
+        print(f"[PROFILE] Disimpan: {path}")
+        return path
+
+    # -------------------- Merge (master) --------------------
+    @classmethod
+    def merge(cls, run_root, files, top=30):
+        """
+        Gabungkan file profile 1 session (hasil dump() master + worker):
+        - .prof      -> profile_merged.prof + profile_report.txt (top N tottime & cumtime)
+        - .collapsed -> profile_merged.collapsed + top N fungsi (self samples)
+        """
+        files = sorted(set(files))
+        prof_files = [path for path in files if path.endswith(".prof")]
+        collapsed_files = [path for path in files if path.endswith(".collapsed")]
+        if prof_files:
+            cls._merge_cprofile(run_root, prof_files, top)
+        if collapsed_files:
+            cls._merge_collapsed(run_root, collapsed_files, top)
+        if not prof_files and not collapsed_files:
+            print(f"[PROFILE] Tidak ada file profile di {run_root}")
+
+    @classmethod
+    def _merge_cprofile(cls, run_root, files, top):
+        out = io.StringIO()
+        stats = pstats.Stats(files[0], stream=out)
+        for path in files[1:]:
+            stats.add(path)
+        stats.dump_stats(os.path.join(run_root, "profile_merged.prof"))
+
+        out.write(f"=== Gabungan {len(files)} proses, top {top} berdasarkan tottime ===\n")
+        stats.sort_stats("tottime").print_stats(top)
+        out.write(f"=== top {top} berdasarkan cumulative ===\n")
+        stats.sort_stats("cumulative").print_stats(top)
+        report = out.getvalue()
+
+        path = os.path.join(run_root, "profile_report.txt")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(report)
+        print(report)
+        print(f"[PROFILE] Report: {path} (buka profile_merged.prof pakai snakeviz / pstats)")
+
+    @classmethod
+    def _merge_collapsed(cls, run_root, files, top):
+        merged = Counter()
+        for path in files:
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    stack, _, count = line.rstrip("\n").rpartition(" ")
+                    if stack and count.isdigit():
+                        merged[stack] += int(count)
+
+        path = os.path.join(run_root, "profile_merged.collapsed")
+        with open(path, "w", encoding="utf-8") as f:
+            for stack, count in merged.most_common():
+                f.write(f"{stack} {count}\n")
+
+        total = sum(merged.values()) or 1
+        self_samples, inclusive = Counter(), Counter()
+        for stack, count in merged.items():
+            frames = stack.split(";")
+            self_samples[frames[-1]] += count
+            for name in set(frames):
+                inclusive[name] += count
+
+        print(f"[PROFILE] {len(files)} proses, {total} sample. Top {top} (self / inclusive):")
+        for name, count in self_samples.most_common(top):
+            print(f"    {count / total:6.1%} {inclusive[name] / total:6.1%}  {name}")
+        print(f"[PROFILE] Collapsed stack: {path} (flamegraph.pl {os.path.basename(path)} > flame.svg)")
@@ -0,0 +1,66 @@
+# core/rerun_plan.py
+import os
+from datetime import datetime
+
+from core.run_info import RunInfo
+from reports.result_merge import case_statuses
+
+
+class RerunPlan:
+    """
+    Jalankan ulang sebagian case ke dalam run_* lama (bukan run baru):
+    - resume      : case yang belum selesai (tidak ada case_end / belum dijalankan sama sekali)
+    - rerun-failed: sama seperti resume + case yang statusnya failed
+    Hasil baru ditulis ke events_<pid>_<token>.jsonl baru di folder yang sama; merge master
+    mengambil attempt lengkap terakhir per case, jadi report lama ikut ter-update.
+    """
+    MODES = ("resume", "rerun-failed")
+
+    def __init__(self, run_root, mode, done):
+        self.run_root = run_root
+        self.mode = mode
+        self.done = done    # set CaseID yang TIDAK perlu dijalankan lagi
+
+    @staticmethod
+    def resolve_run_dir(reports_dir, value=None, feature=None):
+        """
+        value: path folder run / nama run_* di reports/capture; kosong = run terakhir feature ini.
+        """
+        if value:
+            for candidate in (value, os.path.join(reports_dir, value)):
+                if os.path.isdir(candidate):
+                    return os.path.abspath(candidate)
+            raise FileNotFoundError(f"Folder run tidak ditemukan: {value}")
+        if not feature:
+            raise ValueError("--rerun_failed tanpa --resume butuh --feature_name untuk cari run terakhir")
+        runs = RunInfo.previous_runs(reports_dir, feature)
+        if not runs:
+            raise FileNotFoundError(f"Belum ada run sebelumnya untuk feature {feature} di {reports_dir}")
+        return os.path.abspath(runs[0])
+
+    @classmethod
+    def build(cls, run_root, mode):
+        if mode not in cls.MODES:
+            raise ValueError(f"Mode rerun tidak dikenal: '{mode}' (pilihan: {', '.join(cls.MODES)})")
+        statuses = case_statuses(run_root)
+        keep = ("incomplete", "failed") if mode == "rerun-failed" else ("incomplete",)
+        done = {case_id for case_id, status in statuses.items() if status not in keep}
+        rerun = len(statuses) - len(done)
+        print(f"[RERUN] {mode} di {run_root}: {len(statuses)} case tercatat, "
+              f"{rerun} diulang, {len(done)} dilewati (+ case yang belum pernah jalan)")
+        return cls(run_root, mode, done)
+
+    def select(self, items, case_id_of):
+        """Pisah item pytest jadi (dijalankan, deselected) berdasarkan CaseID."""
+        selected, deselected = [], []
+        for item in items:
+            case_id = case_id_of(item.nodeid)
+            (deselected if case_id in self.done else selected).append(item)
+        return selected, deselected
+
+    def record(self):
+        """Catat riwayat resume di run_info.json folder run lama."""
+        history = RunInfo.read(self.run_root).get("reruns") or []
+        history.append({"mode": self.mode, "at": datetime.now().isoformat(timespec="seconds"),
+                        "skipped": len(self.done)})
+        RunInfo.update(self.run_root, reruns=history)
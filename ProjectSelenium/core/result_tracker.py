@@ -1,5 +1,113 @@
 # core/result_tracker.py
+import sys
+import threading
+import time
 from collections import defaultdict
+from enum import IntEnum
+
+
+class Status(IntEnum):
+    """Status step/case disimpan sebagai int, label string cuma saat serialisasi."""
+    PASSED = 0
+    FAILED = 1
+    WARNING = 2
+    SKIPPED = 3
+    INCOMPLETE = 4
+
+    @classmethod
+    def parse(cls, value):
+        if isinstance(value, cls):
+            return value
+        try:
+            return cls[str(value or "").upper()]
+        except KeyError:
+            return cls.WARNING   # status lain dihitung sebagai warning (sama dengan totals)
+
+    @property
+    def label(self):
+        return self.name.lower()
+
+
+# fase waktu per step (detik): resolve (cari elemen di DOM), wait, action, capture
+PHASES = ("resolve", "wait", "action", "capture")
+
+
+def _intern(value):
+    # judul/deskripsi/path blob banyak yang berulang antar case -> 1 objek string saja
+    return sys.intern(value) if isinstance(value, str) and value else (value or "")
+
+
+def format_timings(duration, timings):
+    """' Time=0.52s (resolve 0.001 / wait 0.120 / action 0.300 / capture 0.050)' untuk console."""
+    if duration is None:
+        return ""
+    text = f" Time={duration:.2f}s"
+    if timings:
+        if isinstance(timings, dict):
+            timings = tuple(timings.get(p) or 0.0 for p in PHASES)
+        text += " (" + " / ".join(f"{p} {t:.3f}" for p, t in zip(PHASES, timings)) + ")"
+    return text
+
+
+class StepRecord:
+    __slots__ = ("step_id", "title", "description", "image", "image_hash", "status", "error", "duration", "timings",
+                 "attempts")
+
+    def __init__(self, step_id, title, description, image, image_hash, status, error, duration=None, timings=None,
+                 attempts=1):
+        self.step_id = step_id
+        self.title = _intern(title or "Untitled Step")
+        self.description = _intern(description)
+        self.image = _intern(image)
+        self.image_hash = _intern(image_hash)  # referensi blob di ScreenshotStore (Store: content)
+        self.status = Status.parse(status)
+        self.error = error or ""
+        self.duration = duration   # detik (action + capture), None kalau tidak diukur
+        # tuple urut PHASES (lebih hemat dari dict per step), None kalau tidak diukur
+        self.timings = tuple(float(timings.get(p) or 0.0) for p in PHASES) if timings else None
+        self.attempts = attempts   # > 1 kalau step berhasil/gagal setelah retry (RetryPolicy)
+
+    def to_dict(self):
+        return {
+            "step_id": self.step_id,
+            "title": self.title,
+            "description": self.description,
+            "image": self.image,
+            "image_hash": self.image_hash,
+            "status": self.status.label,
+            "error": self.error,
+            "duration": None if self.duration is None else round(self.duration, 3),
+            "timings": None if self.timings is None else {p: round(t, 4) for p, t in zip(PHASES, self.timings)},
+            "attempts": self.attempts
+        }
+
+
+class CaseRecord:
+    __slots__ = ("case_id", "title", "scenario_type", "status", "steps", "started", "duration", "attempt")
+
+    def __init__(self, case_id, title, scenario_type, attempt=1):
+        self.case_id = case_id
+        self.attempt = attempt   # percobaan ke-N case ini di proses ini (rerun di worker yang sama)
+        self.title = _intern(title)
+        self.scenario_type = _intern(scenario_type)
+        self.status = None   # diisi end_test_case
+        self.steps = []
+        self.started = time.perf_counter()
+        self.duration = None
+
+    def to_dict(self):
+        data = {
+            "case_id": self.case_id,
+            "title": self.title,
+            "scenario_type": self.scenario_type,
+            "steps": [step.to_dict() for step in self.steps]
+        }
+        if self.status is not None:
+            data["status"] = self.status.label
+        if self.duration is not None:
+            data["duration"] = round(self.duration, 3)
+        return data
+
 
 class ResultTracker:
     """
@@ -7,12 +115,20 @@ class ResultTracker:
     - per test case
     - per step (judul, deskripsi, path capture, status)
     - agregat total untuk summary
+    Case/step disimpan sebagai CaseRecord/StepRecord (__slots__, status int), dict baru
+    dibuat saat get_snapshot(). Semua perubahan di-lock, aman dipanggil dari banyak thread.
+    Kalau attach_event_log() dipanggil, setiap perubahan juga ditulis sebagai event
+    append-only (lihat EventLog) supaya master bisa rebuild hasil tanpa snapshot penuh.
+    Kalau attach_history() dipanggil, case yang selesai juga dicatat ke HistoryStore (SQLite).
     """
     _instance = None
 
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super(ResultTracker, cls).__new__(cls)
+            cls._instance.event_log = None  # EventLog proses ini (tidak ikut di-reset)
+            cls._instance.history = None    # HistoryRecorder proses ini (tidak ikut di-reset)
+            cls._instance._lock = threading.RLock()
             cls._instance._reset()
         return cls._instance
 
@@ -24,7 +140,7 @@ class ResultTracker:
             "author": None,
             "tools": None
         }
-        self.cases = []     # list of {case_id, title, scenario_type, steps: [...]}
+        self.cases = []     # list of CaseRecord
         self._case_index = {}  # map CaseID -> index di self.cases
         self.totals = defaultdict(int)  # passed, failed, warning, done, total
 
@@ -34,59 +150,129 @@ class ResultTracker:
         🆕 UPDATE: tambahkan tools dan semua field bisa None
         """
     def set_meta(self, **kwargs):
-        for k, v in kwargs.items():
-            if v is not None:
-                self.meta[k] = v
+        with self._lock:
+            changed = {k: v for k, v in kwargs.items() if v is not None and self.meta.get(k) != v}
+            self.meta.update(changed)
+            if changed and self.event_log:
+                self.event_log.emit("meta", meta=changed)
         print(f"[TRACKER] Meta set: {self.meta}")
 
+    # -------------------- Event Log --------------------
+    def attach_event_log(self, event_log):
+        self.event_log = event_log
+        if any(self.meta.values()):
+            event_log.emit("meta", meta={k: v for k, v in self.meta.items() if v is not None})
+        print(f"[TRACKER] Event log: {event_log.path}")
+
+    def checkpoint(self):
+        """Pastikan event sampai titik ini sudah di disk (dipanggil setelah tiap test)."""
+        if self.event_log:
+            self.event_log.checkpoint()
+
+    def close_event_log(self):
+        if self.event_log:
+            self.event_log.close()
+            self.event_log = None
+
+    # -------------------- History --------------------
+    def attach_history(self, recorder):
+        self.history = recorder
+        print(f"[TRACKER] History: {recorder.store.path} (run {recorder.run_id})")
+
+    def close_history(self):
+        if self.history:
+            self.history.close()
+            self.history = None
+
     # -------------------- Case Lifecycle --------------------
     def start_test_case(self, case_id: str, title: str, scenario_type: str):
-        if case_id not in self._case_index:
-            self._case_index[case_id] = len(self.cases)
-            self.cases.append({
-                "case_id": case_id,
-                "title": title,
-                "scenario_type": scenario_type,
-                "steps": []
-            })
-            # 🆕 LOG
-            print(f"[TRACKER] Start TestCase: {case_id} - {title} ({scenario_type})")
-
-    def log_step(self, case_id: str, step_id, step_title: str, step_desc: str, image_path: str, status: str, error: str = ""):
+        """
+        Case yang sudah pernah jalan di proses ini (rerun) = attempt baru: record lama diganti
+        (totals-nya dikurangi) dan case_start tetap di-emit supaya step attempt baru tidak yatim.
+        """
+        with self._lock:
+            idx = self._case_index.get(case_id)
+            if idx is None:
+                record = CaseRecord(case_id, title, scenario_type)
+                self._case_index[case_id] = len(self.cases)
+                self.cases.append(record)
+            else:
+                previous = self.cases[idx]
+                for step in previous.steps:
+                    self._count(step, -1)
+                record = CaseRecord(case_id, title, scenario_type, previous.attempt + 1)
+                self.cases[idx] = record
+            if self.event_log:
+                self.event_log.emit("case_start", case_id=case_id, attempt=record.attempt,
+                                    title=title, scenario_type=scenario_type)
+        # 🆕 LOG
+        print(f"[TRACKER] Start TestCase: {case_id} - {title} ({scenario_type})")
+
+    def log_step(self, case_id: str, step_id, step_title: str, step_desc: str, image_path: str, status: str, error: str = "", image_hash: str = "", duration: float = None, timings: dict = None, attempts: int = 1):
         """
         🆕 UPDATE: otomatis update totals dan log console
         """
-        idx = self._case_index.get(case_id)
-        if idx is None:
-            print(f"[TRACKER][WARN] CaseID '{case_id}' not found.")
-            return
-
-        step_record = {
-            "step_id": step_id,
-            "title": step_title or "Untitled Step",
-            "description": step_desc or "",
-            "image": image_path or "",
-            "status": status,
-            "error": error or ""
-        }
-        self.cases[idx]["steps"].append(step_record)
-
-        # update totals
-        self.totals["total"] += 1
-        self.totals["done"] += 1
-        if status == "passed":
-            self.totals["passed"] += 1
-        elif status == "failed":
-            self.totals["failed"] += 1
-        else:
-            self.totals["warning"] += 1
+        step_record = StepRecord(step_id, step_title, step_desc, image_path, image_hash, status, error, duration, timings,
+                                 attempts)
+        with self._lock:
+            idx = self._case_index.get(case_id)
+            if idx is None:
+                print(f"[TRACKER][WARN] CaseID '{case_id}' not found.")
+                return
+            self.cases[idx].steps.append(step_record)
+            if self.event_log:
+                self.event_log.emit("step", case_id=case_id, step=step_record.to_dict())
+
+            self._count(step_record, 1)
 
         # 🆕 LOG
-        print(f"[TRACKER] Logged step: Case={case_id} Step={step_id} Status={status} Image={image_path}")
+        print(f"[TRACKER] Logged step: Case={case_id} Step={step_id} Status={status} Image={image_path}"
+              f"{format_timings(step_record.duration, step_record.timings)}"
+              f"{f' Attempts={attempts}' if attempts > 1 else ''}")
 
-    def end_test_case(self, case_id: str):
-        # 🆕 placeholder kalau kelak butuh finalize per case
-        print(f"[TRACKER] End TestCase: {case_id}")
+    def log_retry(self, case_id: str, step_id, attempt: int, error: str, delay: float):
+        """Percobaan ke-attempt gagal dan step akan diulang setelah delay detik."""
+        with self._lock:
+            if self.event_log:
+                self.event_log.emit("retry", case_id=case_id, step_id=step_id, attempt=attempt,
+                                    error=error, delay=round(delay, 3))
+        print(f"[RETRY] Case={case_id} Step={step_id} percobaan {attempt} gagal ({error}), ulang dalam {delay:.2f}s")
+
+    def _count(self, step_record, sign):
+        """Update totals untuk 1 step (sign -1 = batalkan step attempt lama)."""
+        self.totals["total"] += sign
+        self.totals["done"] += sign
+        if step_record.status is Status.PASSED:
+            self.totals["passed"] += sign
+        elif step_record.status is Status.FAILED:
+            self.totals["failed"] += sign
+        else:
+            self.totals["warning"] += sign
+
+    def end_test_case(self, case_id: str, status: str = None):
+        """status None -> failed kalau ada step gagal, selain itu passed."""
+        with self._lock:
+            idx = self._case_index.get(case_id)
+            if status is not None:
+                status = Status.parse(status)
+            elif idx is not None and any(s.status is Status.FAILED for s in self.cases[idx].steps):
+                status = Status.FAILED
+            else:
+                status = Status.PASSED
+            duration = finished = None
+            if idx is not None:
+                case = self.cases[idx]
+                case.status = status
+                case.duration = duration = time.perf_counter() - case.started
+                if self.history:
+                    finished = case.to_dict()
+            if self.event_log:
+                self.event_log.emit("case_end", case_id=case_id, status=status.label,
+                                    duration=None if duration is None else round(duration, 3))
+        if finished is not None:
+            self.history.add(finished)   # di luar lock tracker: flush batch menulis ke SQLite
+        status = status.label
+        print(f"[TRACKER] End TestCase: {case_id} ({status})")
 
     # -------------------- Snapshot for PDF --------------------
     def get_snapshot(self):
@@ -94,12 +280,13 @@ class ResultTracker:
         🆕 UPDATE: fungsi publik untuk langsung dipakai generate_pdf_report()
         """
         # pastikan semua field meta tidak None agar PDF generator aman
-        meta_copy = {k: v or "" for k, v in self.meta.items()}
-        snapshot = {
-            "meta": meta_copy,
-            "cases": self.cases,
-            "totals": dict(self.totals)
-        }
+        # cases berupa dict baru (bukan list internal tracker), aman dimodifikasi pemanggil
+        with self._lock:
+            snapshot = {
+                "meta": {k: v or "" for k, v in self.meta.items()},
+                "cases": [case.to_dict() for case in self.cases],
+                "totals": dict(self.totals)
+            }
 
         # 🆕 LOG summary
         print(f"[TRACKER] Snapshot ready: {len(snapshot['cases'])} cases, totals={snapshot['totals']}")
@@ -109,7 +296,8 @@ class ResultTracker:
         """
         🆕 UPDATE: reset tracker sepenuhnya
         """
-        self._reset()
+        with self._lock:
+            self._reset()
         print("[TRACKER] Tracker reset.")
 
 # -------------------- Merge Snapshots --------------------
@@ -0,0 +1,92 @@
+# core/retry_policy.py
+from selenium.common import exceptions as selenium_errors
+
+# alias di config -> class exception selenium (nama class lengkap juga boleh dipakai)
+EXCEPTION_ALIASES = {
+    "stale": "StaleElementReferenceException",
+    "intercepted": "ElementClickInterceptedException",
+    "not_interactable": "ElementNotInteractableException",
+    "no_such_element": "NoSuchElementException",
+    "timeout": "TimeoutException",
+    "move_target": "MoveTargetOutOfBoundsException",
+    "javascript": "JavascriptException",
+}
+DEFAULT_EXCEPTIONS = ("stale", "intercepted", "not_interactable")
+
+
+def _exception_class(name):
+    key = str(name).strip()
+    cls = getattr(selenium_errors, EXCEPTION_ALIASES.get(key.lower(), key), None)
+    if not (isinstance(cls, type) and issubclass(cls, Exception)):
+        raise ValueError(f"Retry exception tidak dikenal: '{name}' "
+                         f"(pilihan: {', '.join(EXCEPTION_ALIASES)} atau nama class selenium)")
+    return cls
+
+
+class RetryPolicy:
+    """
+    Retry 1 step yang gagal karena error sementara (elemen stale, click ketutup overlay,
+    spinner lama) sebelum case dianggap FAILED. Jauh lebih murah dari rerun case dari navigate.
+
+    - MaxAttempts : total percobaan (1 = tanpa retry)
+    - Backoff     : jeda (detik) sebelum retry pertama
+    - Multiplier  : jeda dikali ini tiap retry berikutnya (exponential backoff)
+    - MaxBackoff  : batas atas jeda
+    - Exceptions  : exception yang boleh di-retry (alias / nama class selenium),
+                    AssertionError & error data tidak pernah di-retry
+
+    Konfigurasi (prioritas: step > GlobalData.Retry.Actions.<action> > GlobalData.Retry):
+        GlobalData.Retry: {MaxAttempts: 2, Backoff: 0.5, Exceptions: [stale, intercepted],
+                           Actions: {click: {MaxAttempts: 3}}}
+        step["Retry"]: 3 (MaxAttempts saja) atau {MaxAttempts: ..., Exceptions: [...]}
+    """
+
+    def __init__(self, max_attempts=1, backoff=0.5, multiplier=2.0, max_backoff=5.0, exceptions=DEFAULT_EXCEPTIONS):
+        try:
+            self.max_attempts = max(1, int(max_attempts or 1))
+            self.backoff = max(0.0, float(backoff or 0))
+            self.multiplier = max(1.0, float(multiplier or 1))
+            self.max_backoff = max(0.0, float(max_backoff or 0))
+        except (TypeError, ValueError):
+            raise ValueError(f"Retry tidak valid: MaxAttempts={max_attempts!r} Backoff={backoff!r} "
+                             f"Multiplier={multiplier!r} MaxBackoff={max_backoff!r}")
+        if isinstance(exceptions, str):
+            exceptions = [exceptions]
+        self.exceptions = tuple(exceptions or ())
+        self.retry_on = tuple(_exception_class(name) for name in self.exceptions)
+
+    @classmethod
+    def from_config(cls, config, base=None):
+        """config: None / int MaxAttempts / dict {MaxAttempts, Backoff, ...}. Field kosong diambil dari base."""
+        base = base or cls()
+        if config is None or config == "":
+            return base
+        if isinstance(config, bool) or not isinstance(config, (dict, int, str)):
+            raise ValueError(f"Retry tidak valid: {config!r}")
+        if not isinstance(config, dict):
+            return cls(config, base.backoff, base.multiplier, base.max_backoff, base.exceptions)
+        return cls(
+            config.get("MaxAttempts", base.max_attempts),
+            config.get("Backoff", base.backoff),
+            config.get("Multiplier", base.multiplier),
+            config.get("MaxBackoff", base.max_backoff),
+            config.get("Exceptions", base.exceptions),
+        )
+
+    @classmethod
+    def resolve(cls, globaldata, action=None, step=None):
+        config = globaldata.get("Retry") or {}
+        policy = cls.from_config(config)
+        if action:
+            policy = cls.from_config((config.get("Actions") or {}).get(action), policy)
+        if step:
+            policy = cls.from_config(step.get("Retry"), policy)
+        return policy
+
+    def should_retry(self, error, attempt):
+        """attempt = percobaan yang barusan gagal (mulai 1)."""
+        return attempt < self.max_attempts and isinstance(error, self.retry_on)
+
+    def delay(self, attempt):
+        """Jeda sebelum percobaan ke-(attempt + 1)."""
+        return min(self.backoff * self.multiplier ** (attempt - 1), self.max_backoff)
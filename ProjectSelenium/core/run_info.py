@@ -0,0 +1,52 @@
+# core/run_info.py
+import glob
+import json
+import os
+from datetime import datetime
+
+
+class RunInfo:
+    """
+    Info ringkas 1 run (run_*/run_info.json), ditulis master di pytest_configure.
+    Event log tidak menyimpan nama feature, jadi file ini yang dipakai untuk
+    mencari run sebelumnya dari feature yang sama (penjadwalan, rerun, dll).
+    """
+    FILENAME = "run_info.json"
+
+    @classmethod
+    def write(cls, run_root, feature=None, **extra):
+        info = {"feature": feature, "started_at": datetime.now().isoformat(timespec="seconds")}
+        info.update(extra)
+        with open(os.path.join(run_root, cls.FILENAME), "w", encoding="utf-8") as f:
+            json.dump(info, f, indent=2, ensure_ascii=False)
+        return info
+
+    @classmethod
+    def update(cls, run_root, **fields):
+        """Tambah/ubah field di run_info.json yang sudah ada (mis. riwayat resume)."""
+        info = cls.read(run_root)
+        info.update(fields)
+        with open(os.path.join(run_root, cls.FILENAME), "w", encoding="utf-8") as f:
+            json.dump(info, f, indent=2, ensure_ascii=False)
+        return info
+
+    @classmethod
+    def read(cls, run_root):
+        """Return dict info, atau {} kalau run lama (belum ada run_info.json) / file rusak."""
+        try:
+            with open(os.path.join(run_root, cls.FILENAME), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    @classmethod
+    def previous_runs(cls, reports_dir, feature, exclude=None):
+        """Folder run_* milik feature ini, paling baru dulu (nama run_YYYYmmdd_HHMMSS urut waktu)."""
+        exclude = os.path.normpath(exclude) if exclude else None
+        runs = []
+        for run_root in sorted(glob.glob(os.path.join(reports_dir, "run_*")), reverse=True):
+            if not os.path.isdir(run_root) or os.path.normpath(run_root) == exclude:
+                continue
+            if cls.read(run_root).get("feature") == feature:
+                runs.append(run_root)
+        return runs
@@ -0,0 +1,91 @@
+# core/screenshot_store.py
+import hashlib
+import io
+import os
+import threading
+
+from core.screenshot_writer import ScreenshotWriter, PILImage
+
+
+def dhash(png_bytes, size=8):
+    """Perceptual hash (difference hash) 64-bit dari PNG. Butuh Pillow."""
+    with PILImage.open(io.BytesIO(png_bytes)) as im:
+        small = im.convert("L").resize((size + 1, size), PILImage.BILINEAR)
+        pixels = list(small.getdata())
+    bits = 0
+    for row in range(size):
+        for col in range(size):
+            left = pixels[row * (size + 1) + col]
+            right = pixels[row * (size + 1) + col + 1]
+            bits = (bits << 1) | (left > right)
+    return bits
+
+
+class ScreenshotStore:
+    """
+    Penyimpanan screenshot content-addressed per run:
+        <run_root>/blobs/<2 char hash>/<sha256>.<ext>
+    - frame identik (hash PNG sama) cuma ditulis sekali, step lain menunjuk blob yang sama
+    - NearDuplicate: frame yang mirip (jarak dHash <= threshold) dengan frame sebelumnya
+      di case yang sama dilipat ke blob sebelumnya
+    - format lossy (jpeg/webp + Quality) ikut config ScreenshotWriter
+    Aktif kalau GlobalData.Screenshot.Store = content.
+    """
+    _stores = {}
+    _stores_lock = threading.Lock()
+
+    def __init__(self, root, near_duplicate=False, threshold=4):
+        self.root = root
+        self.near_duplicate = bool(near_duplicate) and PILImage is not None
+        self.threshold = int(threshold)
+        self._known = {}    # sha256 -> path blob
+        self._last = {}     # capture_dir -> (dhash, path, sha256) frame terakhir
+        self._dirs = set()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_capture_dir(cls, capture_dir):
+        """
+        Store untuk run yang memiliki capture_dir (<run_root>/<Title>) -> blob di <run_root>/blobs.
+        """
+        root = os.path.join(os.path.dirname(os.path.abspath(capture_dir)), "blobs")
+        with cls._stores_lock:
+            store = cls._stores.get(root)
+            if store is None:
+                writer = ScreenshotWriter()
+                store = cls(root, writer.near_duplicate, writer.near_duplicate_threshold)
+                cls._stores[root] = store
+            return store
+
+    def blob_path(self, digest):
+        folder = os.path.join(self.root, digest[:2])
+        if folder not in self._dirs:
+            os.makedirs(folder, exist_ok=True)
+            self._dirs.add(folder)
+        return os.path.join(folder, digest + ScreenshotWriter().extension)
+
+    def put(self, png_bytes, capture_dir=None):
+        """
+        Simpan screenshot. Return (path_blob, hash). Penulisan file lewat ScreenshotWriter (background).
+        """
+        digest = hashlib.sha256(png_bytes).hexdigest()
+        phash = dhash(png_bytes) if self.near_duplicate else None
+
+        with self._lock:
+            if phash is not None and capture_dir in self._last:
+                last_phash, last_path, last_digest = self._last[capture_dir]
+                if bin(phash ^ last_phash).count("1") <= self.threshold:
+                    return last_path, last_digest
+
+            path = self._known.get(digest)
+            is_new = path is None
+            if is_new:
+                path = self.blob_path(digest)
+                self._known[digest] = path
+            if phash is not None:
+                self._last[capture_dir] = (phash, path, digest)
+
+        # worker lain (run_root sama) mungkin sudah menulis blob yang sama
+        if is_new and not os.path.exists(path):
+            ScreenshotWriter().submit(png_bytes, path)
+        return path, digest
@@ -0,0 +1,157 @@
+# core/screenshot_writer.py
+import io
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+try:  # Pillow opsional: hanya perlu untuk downscale / re-encode (jpeg/webp)
+    from PIL import Image as PILImage
+except ImportError:
+    PILImage = None
+
+
+class ScreenshotWriter:
+    """
+    Singleton per proses: screenshot diambil sebagai bytes PNG di thread test,
+    lalu downscale/re-encode + tulis file dikerjakan thread pool di background.
+    - MaxPending membatasi jumlah PNG di memori (submit nunggu kalau penuh)
+    - flush() = barrier, dipanggil di akhir testcase / teardown supaya semua file
+      sudah ada di disk sebelum tracker/report membacanya
+
+    Config (GlobalData.Screenshot):
+        Async: true, Workers: 2, MaxPending: 16, Scale: 1.0, Format: png, Quality: 85,
+        Store: files/content, NearDuplicate: false, NearDuplicateThreshold: 4 (lihat ScreenshotStore)
+    """
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    FORMATS = {"png": ("PNG", ".png"), "jpeg": ("JPEG", ".jpg"), "jpg": ("JPEG", ".jpg"), "webp": ("WEBP", ".webp")}
+
+    def __new__(cls):
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    instance = super(ScreenshotWriter, cls).__new__(cls)
+                    instance._executor = None
+                    instance._pending = []
+                    instance._lock = threading.Lock()
+                    instance._configured = False
+                    cls._instance = instance
+        return cls._instance
+
+    def configure(self, async_write=True, workers=2, max_pending=16, scale=1.0, fmt="png", quality=85,
+                  store="files", near_duplicate=False, near_duplicate_threshold=4):
+        self.flush()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+        fmt = str(fmt or "png").lower()
+        if fmt not in self.FORMATS:
+            print(f"[WARN] Format screenshot '{fmt}' tidak dikenal, pakai png")
+            fmt = "png"
+        scale = float(scale or 1.0)
+        if PILImage is None and (fmt != "png" or scale != 1.0):
+            print("[WARN] Pillow tidak terpasang: screenshot disimpan PNG apa adanya")
+            fmt, scale = "png", 1.0
+
+        store = str(store or "files").lower()
+        if store not in ("files", "content"):
+            print(f"[WARN] Screenshot.Store '{store}' tidak dikenal, pakai files")
+            store = "files"
+        if near_duplicate and PILImage is None:
+            print("[WARN] Pillow tidak terpasang: NearDuplicate dinonaktifkan")
+            near_duplicate = False
+
+        self.store = store
+        self.near_duplicate = bool(near_duplicate)
+        self.near_duplicate_threshold = int(near_duplicate_threshold or 0)
+        self.async_write = bool(async_write)
+        self.scale = scale
+        self.quality = int(quality or 85)
+        self.pil_format, self.extension = self.FORMATS[fmt]
+        self._slots = threading.BoundedSemaphore(max(1, int(max_pending or 1)))
+        if self.async_write:
+            self._executor = ThreadPoolExecutor(max_workers=max(1, int(workers or 1)),
+                                                thread_name_prefix="screenshot")
+        self._configured = True
+
+    def configure_from(self, config):
+        config = config if hasattr(config, "get") else {}
+        self.configure(
+            async_write=config.get("Async", True),
+            workers=config.get("Workers", 2),
+            max_pending=config.get("MaxPending", 16),
+            scale=config.get("Scale", 1.0),
+            fmt=config.get("Format", "png"),
+            quality=config.get("Quality", 85),
+            store=config.get("Store", "files"),
+            near_duplicate=config.get("NearDuplicate", False),
+            near_duplicate_threshold=config.get("NearDuplicateThreshold", 4),
+        )
+
+    def ensure_configured(self):
+        if not self._configured:
+            from core.config_registry import ConfigRegistry
+            self.configure_from(ConfigRegistry.global_data().get("Screenshot"))
+
+    def encode(self, png_bytes):
+        """PNG bytes -> bytes final sesuai Scale/Format (tanpa Pillow: dikembalikan apa adanya)."""
+        if self.pil_format == "PNG" and self.scale == 1.0:
+            return png_bytes
+        with PILImage.open(io.BytesIO(png_bytes)) as im:
+            if self.scale != 1.0:
+                size = (max(1, int(im.width * self.scale)), max(1, int(im.height * self.scale)))
+                im = im.resize(size, PILImage.LANCZOS)
+            if self.pil_format == "JPEG" and im.mode != "RGB":
+                im = im.convert("RGB")
+            out = io.BytesIO()
+            params = {"optimize": True} if self.pil_format == "PNG" else {"quality": self.quality}
+            im.save(out, self.pil_format, **params)
+            return out.getvalue()
+
+    def _write(self, png_bytes, path):
+        data = self.encode(png_bytes)
+        # nama tmp unik: beberapa worker bisa menulis blob yang sama bersamaan
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.part"
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+
+    def target_path(self, capture_dir, basename):
+        """Path final file screenshot (ekstensi mengikuti Format)."""
+        self.ensure_configured()
+        return os.path.join(capture_dir, basename + self.extension)
+
+    def submit(self, png_bytes, path):
+        """
+        Jadwalkan penulisan screenshot. Return path (langsung, sebelum file ditulis).
+        """
+        self.ensure_configured()
+        if not self.async_write:
+            self._write(png_bytes, path)
+            return path
+
+        self._slots.acquire()   # backpressure kalau antrean penuh
+        try:
+            future = self._executor.submit(self._write, png_bytes, path)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _f: self._slots.release())
+        with self._lock:
+            self._pending.append((path, future))
+        return path
+
+    def flush(self):
+        """Tunggu semua screenshot selesai ditulis. Return list (path, error) yang gagal."""
+        with self._lock:
+            pending, self._pending = self._pending, []
+        errors = []
+        for path, future in pending:
+            try:
+                future.result()
+            except Exception as e:
+                errors.append((path, e))
+                print(f"[WARN] Gagal tulis screenshot {path}: {e}")
+        return errors
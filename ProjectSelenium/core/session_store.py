@@ -0,0 +1,121 @@
+# core/session_store.py
+import threading
+import time
+from urllib.parse import urlsplit
+
+from selenium.common.exceptions import WebDriverException
+
+# semua key localStorage/sessionStorage + origin halaman aktif
+_READ_STORAGE_JS = """
+var dump = function (s) {
+    var out = {};
+    for (var i = 0; i < s.length; i++) { var k = s.key(i); out[k] = s.getItem(k); }
+    return out;
+};
+return [window.location.origin, dump(window.localStorage), dump(window.sessionStorage)];
+"""
+_WRITE_STORAGE_JS = """
+var local = arguments[0], session = arguments[1];
+Object.keys(local).forEach(function (k) { window.localStorage.setItem(k, local[k]); });
+Object.keys(session).forEach(function (k) { window.sessionStorage.setItem(k, session[k]); });
+"""
+# field cookie yang diterima add_cookie (hasil get_cookies bisa punya field lain)
+_COOKIE_FIELDS = ("name", "value", "path", "domain", "secure", "httpOnly", "expiry", "sameSite")
+
+
+class SessionState:
+    """State login 1 browser: cookies + local/session storage di origin aplikasi."""
+    __slots__ = ("origin", "cookies", "local", "session", "created")
+
+    def __init__(self, origin, cookies, local, session):
+        self.origin = origin
+        self.cookies = cookies
+        self.local = local
+        self.session = session
+        self.created = time.monotonic()
+
+    def age(self):
+        return time.monotonic() - self.created
+
+
+class SessionStore:
+    """
+    Singleton per proses (per worker xdist): hasil login disimpan sekali lalu
+    di-inject ke browser case berikutnya (keyword login_once / restore_session),
+    jadi case tidak perlu ulang navigate -> LoginLink -> email/password -> LoginButton.
+
+    - state kadaluarsa setelah TTL detik -> login ulang
+    - setelah restore dicek locator Check (mis. LogoutLink); kalau tidak ada,
+      session dianggap expired di server -> invalidate + login ulang
+    - restore_session tidak pernah login: belum ada state / Check tidak ada -> step FAILED
+
+    Config (GlobalData.Session):
+        Enabled: true, TTL: 1800, Check: LogoutLink,
+        Logins: {default: {Title: ..., TestSteps: [...]}}   # langkah login, locator dari GlobalLocators
+    """
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __new__(cls):
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    instance = super(SessionStore, cls).__new__(cls)
+                    instance._states = {}
+                    instance._lock = threading.Lock()
+                    cls._instance = instance
+        return cls._instance
+
+    # -------------------- Store --------------------
+    def get(self, name, ttl=None):
+        """State valid untuk login `name`, None kalau belum ada / sudah lewat TTL."""
+        with self._lock:
+            state = self._states.get(name)
+            if state is not None and ttl and state.age() > float(ttl):
+                print(f"[SESSION] State '{name}' kadaluarsa ({state.age():.0f}s > TTL {ttl}s)")
+                self._states.pop(name, None)
+                state = None
+            return state
+
+    def put(self, name, state):
+        with self._lock:
+            self._states[name] = state
+        print(f"[SESSION] State '{name}' disimpan: {len(state.cookies)} cookie, "
+              f"{len(state.local)} localStorage, {len(state.session)} sessionStorage")
+
+    def invalidate(self, name=None):
+        with self._lock:
+            if name is None:
+                self._states.clear()
+            else:
+                self._states.pop(name, None)
+        print(f"[SESSION] State '{name or '*'}' di-invalidate")
+
+    # -------------------- Browser --------------------
+    @staticmethod
+    def capture(driver):
+        """Ambil cookies + storage dari halaman aktif (harus sudah di origin aplikasi)."""
+        origin, local, session = driver.execute_script(_READ_STORAGE_JS)
+        return SessionState(origin, driver.get_cookies(), local or {}, session or {})
+
+    @staticmethod
+    def inject(driver, state):
+        """
+        Pasang state ke browser (hasil reset DriverPool: cookies/storage kosong).
+        Browser dibawa ke origin dulu kalau belum di sana, lalu refresh supaya aplikasi baca state.
+        """
+        current = urlsplit(driver.current_url or "")
+        if f"{current.scheme}://{current.netloc}" != state.origin:
+            driver.get(state.origin)
+
+        skipped = 0
+        for cookie in state.cookies:
+            try:
+                driver.add_cookie({k: cookie[k] for k in _COOKIE_FIELDS if k in cookie})
+            except WebDriverException:
+                skipped += 1   # cookie domain lain (third-party) tidak bisa dipasang dari origin ini
+        if state.local or state.session:
+            driver.execute_script(_WRITE_STORAGE_JS, state.local, state.session)
+        driver.refresh()
+        if skipped:
+            print(f"[SESSION][WARN] {skipped} cookie domain lain dilewati")
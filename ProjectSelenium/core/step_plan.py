@@ -0,0 +1,299 @@
+# core/step_plan.py
+import ast
+import re
+from functools import lru_cache
+from selenium.webdriver.common.by import By
+from core.capture_policy import CapturePolicy
+from core.retry_policy import RetryPolicy
+from core.page_load import PageReady
+
+# LocatorType di data (case-insensitive) -> strategi By selenium
+LOCATOR_TYPES = {
+    "id": By.ID,
+    "name": By.NAME,
+    "xpath": By.XPATH,
+    "css": By.CSS_SELECTOR,
+    "link_text": By.LINK_TEXT,
+    "partial_link_text": By.PARTIAL_LINK_TEXT
+}
+_BY_VALUES = frozenset(LOCATOR_TYPES.values())
+
+_GLOBAL_REF = re.compile(r"\{global\.([a-zA-Z0-9_]+)\}")
+_TEMPLATE = re.compile(r"\{global\.([a-zA-Z0-9_]+)\}|\{value\}")
+
+
+def to_by(locator_type, locator_value):
+    """(LocatorType, LocatorValue) -> (By, value). By yang sudah jadi dilewatkan apa adanya."""
+    key = str(locator_type).lower()
+    if key in _BY_VALUES:
+        return key, locator_value
+    return LOCATOR_TYPES[key], locator_value
+
+
+# ================== TEMPLATE ==================
+@lru_cache(maxsize=4096)
+def split_template(text):
+    """
+    Pecah string jadi potongan literal / placeholder, di-cache per string:
+    "a{global.x}b{value}" -> ("a", ("global", "x"), "b", ("value",))
+    """
+    parts = []
+    pos = 0
+    for m in _TEMPLATE.finditer(text):
+        if m.start() > pos:
+            parts.append(text[pos:m.start()])
+        parts.append(("global", m.group(1)) if m.group(1) else ("value",))
+        pos = m.end()
+    if pos < len(text):
+        parts.append(text[pos:])
+    return tuple(parts)
+
+
+def render_template(value, globaldata, test_data=None):
+    """Sama dengan GenericKeywords.resolve_value, tapi pakai template yang sudah dipecah."""
+    if not isinstance(value, str):
+        return value
+    parts = split_template(value)
+    if len(parts) == 1 and isinstance(parts[0], str):
+        return value
+    out = []
+    for part in parts:
+        if isinstance(part, str):
+            out.append(part)
+        elif part[0] == "global":
+            out.append(str(globaldata.get(part[1], f"{{global.{part[1]}}}")))
+        elif test_data is not None:
+            out.append(str(test_data))
+        else:
+            out.append("{value}")
+    return "".join(out)
+
+
+# ================== KEYWORD REGISTRY ==================
+class KeywordSpec:
+    """
+    Metadata 1 keyword:
+    - method: nama method di GenericKeywords
+    - args: argumen sebelum (timeout, run_dir, step_title, step_desc),
+      diambil dari step: "locator" / "test_data" / "expected" / "target" / "ready"
+    """
+    __slots__ = ("action", "method", "args")
+
+    def __init__(self, action, method, args):
+        self.action = action
+        self.method = method
+        self.args = tuple(args)
+
+
+KEYWORDS = {}
+
+
+def keyword(action, *args):
+    """
+    Decorator untuk mendaftarkan method GenericKeywords sebagai action di testcase.
+    Contoh: @keyword("click", "locator")
+    """
+    def decorator(fn):
+        KEYWORDS[action] = KeywordSpec(action, fn.__name__, args)
+        return fn
+    return decorator
+
+
+# ================== PLAN ==================
+class CompiledStep:
+    """1 step yang sudah di-resolve: placeholder, locator (By, value) dan keyword-nya."""
+    __slots__ = ("step_id", "action", "title", "description", "method", "args",
+                 "locator", "test_data", "expected", "error", "source",
+                 "capture", "capture_on_failure", "capture_scope", "capture_padding", "retry")
+
+    def __init__(self, step_id, action, title, description, method=None, args=(),
+                 locator=None, test_data=None, expected=None, error=None, source=None,
+                 capture=True, capture_on_failure=True, capture_scope="page", capture_padding=0):
+        self.step_id = step_id
+        self.action = action
+        self.title = title
+        self.description = description
+        self.method = method
+        self.args = args
+        self.locator = locator
+        self.test_data = test_data
+        self.expected = expected
+        self.error = error
+        self.source = source
+        # hasil CapturePolicy.decide(): True / False / None (capture kalau URL berubah)
+        self.capture = capture
+        self.capture_on_failure = capture_on_failure
+        self.capture_scope = capture_scope
+        self.capture_padding = capture_padding
+        self.retry = RetryPolicy()   # default 1 percobaan (tanpa retry)
+
+    def __getstate__(self):
+        return {k: getattr(self, k) for k in self.__slots__}
+
+    def __setstate__(self, state):
+        for k, v in state.items():
+            setattr(self, k, v)
+
+
+class ExecutionPlan:
+    """
+    Testcase yang sudah di-compile. Isinya data murni (str/tuple) jadi bisa
+    di-pickle dan dipakai ulang (rerun, dikirim ke worker lain).
+    """
+    __slots__ = ("case_id", "title", "scenario_type", "timeout", "steps", "source")
+
+    def __init__(self, case_id, title, scenario_type, timeout, steps, source=None):
+        self.case_id = case_id
+        self.title = title
+        self.scenario_type = scenario_type
+        self.timeout = timeout
+        self.steps = tuple(steps)
+        self.source = source
+
+    @property
+    def errors(self):
+        return [(s.step_id, s.error) for s in self.steps if s.error]
+
+    def __getstate__(self):
+        return {k: getattr(self, k) for k in self.__slots__}
+
+    def __setstate__(self, state):
+        for k, v in state.items():
+            setattr(self, k, v)
+
+
+def resolve_locator(name, local_locators, globaldata, globallocator, test_data=None):
+    """
+    Nama locator -> ((By, value), None) atau (None, pesan_error).
+    Urutan cari: {global.X} -> GlobalLocators, nama biasa -> locators lokal lalu GlobalLocators.
+    """
+    if not name:
+        return None, None
+    if not isinstance(name, str):
+        return None, f"Locator tidak valid: {name!r}"
+
+    ref = _GLOBAL_REF.fullmatch(name.strip())
+    if ref:
+        entry = globallocator.get(ref.group(1))
+        if entry is None:
+            return None, f"Locator '{ref.group(1)}' tidak ditemukan di GlobalLocators"
+    else:
+        entry = local_locators.get(name) or globallocator.get(name)
+        if entry is None:
+            # fallback lama: string hasil resolve berupa literal dict {'LocatorType': ..., ...}
+            try:
+                entry = ast.literal_eval(render_template(name, globallocator, test_data))
+            except (ValueError, SyntaxError):
+                entry = None
+            if not isinstance(entry, dict):
+                return None, f"Locator '{name}' tidak ditemukan di locators lokal maupun GlobalLocators"
+
+    locator_type = entry.get("LocatorType")
+    locator_value = render_template(entry.get("LocatorValue"), globaldata, test_data)
+    try:
+        return to_by(locator_type, locator_value), None
+    except KeyError:
+        return None, f"LocatorType '{locator_type}' tidak dikenal untuk locator '{name}'"
+
+
+def resolve_ready(step, local_locators, globaldata, globallocator):
+    """
+    PageReady untuk navigate (GlobalData.PageLoad + step["Ready"]), Element sudah (By, value).
+    Return (PageReady / None kalau tidak ada kondisi, pesan_error).
+    """
+    try:
+        ready = PageReady.resolve(globaldata, step)
+    except ValueError as e:
+        return None, f"[ERROR] {e}"
+    if ready.element:
+        locator, error = resolve_locator(ready.element, local_locators, globaldata, globallocator)
+        if locator is None:
+            return None, f"[ERROR] Ready Element: {error}"
+        ready.element = locator
+    return (ready if ready.active else None), None
+
+
+def compile_testcase(testcase, locators, globaldata, globallocator):
+    """
+    Compile testcase (dict dari DataLoader) jadi ExecutionPlan.
+    Error data (action tidak dikenal, locator tidak ada) tidak di-raise di sini,
+    tapi disimpan di step.error supaya step sebelumnya tetap jalan seperti biasa.
+    """
+    local_locators = locators.get("locators", locators) if locators else {}
+    try:
+        case_policy = CapturePolicy.resolve(globaldata, testcase)
+        policy_error = None
+    except ValueError as e:
+        case_policy, policy_error = CapturePolicy(), f"[ERROR] {e}"
+
+    steps = []
+    for idx, step in enumerate(testcase.get("TestSteps", []), start=1):
+        action = str(step.get("Action") or "").strip().lower()
+        test_data = render_template(step.get("TestData"), globaldata, step.get("TestData"))
+        expected = render_template(step.get("Expected"), globaldata, test_data)
+        compiled = CompiledStep(
+            step_id=idx,
+            action=action,
+            title=step.get("Title", f"Step - {action}"),
+            description=step.get("Description", ""),
+            test_data=test_data,
+            expected=expected,
+            source=step,
+        )
+
+        try:
+            policy = CapturePolicy.from_config(step.get("Screenshot"), case_policy)
+        except ValueError as e:
+            policy, compiled.error = case_policy, f"[ERROR] {e}"
+        compiled.capture = policy.decide(action, idx)
+        compiled.capture_on_failure = policy.on_failure
+        compiled.capture_scope = policy.scope
+        compiled.capture_padding = policy.padding
+        try:
+            compiled.retry = RetryPolicy.resolve(globaldata, action, step)
+        except ValueError as e:
+            compiled.error = compiled.error or f"[ERROR] {e}"
+
+        spec = KEYWORDS.get(action)
+        if spec is None:
+            compiled.error = f"[ERROR] Unknown action or missing locator: {action}"
+            steps.append(compiled)
+            continue
+
+        locator, locator_error = resolve_locator(step.get("Locator"), local_locators, globaldata, globallocator, test_data)
+        compiled.locator = locator
+
+        error = None
+        args = []
+        for arg in spec.args:
+            if arg == "locator":
+                if locator is None:
+                    error = error or locator_error or f"[ERROR] Unknown action or missing locator: {action}"
+                args.append(locator)
+            elif arg == "target":
+                target, target_error = resolve_locator(test_data, local_locators, globaldata, globallocator)
+                if target is None:
+                    error = error or target_error or f"[ERROR] Target locator kosong untuk action: {action}"
+                args.append(target)
+            elif arg == "test_data":
+                args.append(test_data)
+            elif arg == "expected":
+                args.append(expected)
+            elif arg == "ready":
+                ready, ready_error = resolve_ready(step, local_locators, globaldata, globallocator)
+                error = error or ready_error
+                args.append(ready)
+
+        compiled.method = spec.method
+        compiled.args = tuple(args)
+        compiled.error = compiled.error or policy_error or error
+        steps.append(compiled)
+
+    return ExecutionPlan(
+        case_id=testcase.get("CaseID"),
+        title=testcase.get("Title", ""),
+        scenario_type=testcase.get("ScenarioType", ""),
+        timeout=globaldata.get("Timeout"),
+        steps=steps,
+        source=testcase,
+    )
@@ -1,33 +1,91 @@
 # core/utils.py
 from selenium.webdriver.common.by import By
+from core.screenshot_writer import ScreenshotWriter, PILImage
+from core.screenshot_store import ScreenshotStore
+import io
 import os
 from datetime import datetime
 import random
 
+# bounding box elemen relatif viewport + devicePixelRatio dalam 1 round-trip
+_ELEMENT_BOX_JS = (
+    "var r = arguments[0].getBoundingClientRect();"
+    "return [r.left, r.top, r.width, r.height, window.devicePixelRatio || 1];"
+)
+
+
 class Utils:
 
     @staticmethod
-    def capture_screenshot(driver, capture_dir, step_title=None, step_desc=None, case_id=None):  # 🆕 UPDATE
+    def _crop_region(png, box, padding):
+        """Potong PNG viewport ke box [left, top, width, height, dpr] + padding (px CSS)."""
+        left, top, width, height, dpr = (float(v) for v in box)
+        with PILImage.open(io.BytesIO(png)) as im:
+            x0 = max(0, int((left - padding) * dpr))
+            y0 = max(0, int((top - padding) * dpr))
+            x1 = min(im.width, int((left + width + padding) * dpr))
+            y1 = min(im.height, int((top + height + padding) * dpr))
+            if x1 <= x0 or y1 <= y0:
+                raise ValueError("elemen di luar viewport")
+            out = io.BytesIO()
+            im.crop((x0, y0, x1, y1)).save(out, "PNG")
+            return out.getvalue()
+
+    @staticmethod
+    def grab_png(driver, element=None, scope="page", padding=0):
+        """
+        Bytes PNG sesuai Scope:
+        - page    : full viewport
+        - element : screenshot elemen saja (element.screenshot_as_png)
+        - region  : viewport dipotong ke bounding box elemen + padding (butuh Pillow)
+        Elemen stale / di luar viewport / error lain -> fallback full page.
+        """
+        if element is not None and scope != "page":
+            try:
+                if scope == "element":
+                    return element.screenshot_as_png
+                if PILImage is None:
+                    raise RuntimeError("Pillow tidak terpasang")
+                box = driver.execute_script(_ELEMENT_BOX_JS, element)
+                return Utils._crop_region(driver.get_screenshot_as_png(), box, padding)
+            except Exception as e:
+                print(f"[WARN] Capture {scope} gagal ({e.__class__.__name__}: {e}), fallback full page")
+        return driver.get_screenshot_as_png()
+
+    @staticmethod
+    def capture_screenshot(driver, capture_dir, step_title=None, step_desc=None, case_id=None,
+                           element=None, scope="page", padding=0):  # 🆕 UPDATE
         """
         Ambil screenshot halaman saat ini dengan format nama:
-        <project_name>_YYYY-MM-DD_HH-MM-SS_<random_number>.png
+        <project_name>_YYYY-MM-DD_HH-MM-SS_<random_number>.png (ekstensi ikut Screenshot.Format)
         Return dict {title, desc, file, case_id} untuk PDF
+        Bytes PNG diambil di sini, encode + tulis file dikerjakan ScreenshotWriter di background;
+        panggil ScreenshotWriter().flush() sebelum file-nya dibaca.
+        element + scope (element/region) -> hanya area elemen yang di-capture, lihat grab_png.
         """
         project_name = "ProjectSelenium"
         os.makedirs(capture_dir, exist_ok=True)
 
         timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
         rand_num = random.randint(1000, 9999)
-        filename = f"{project_name}_{timestamp}_{rand_num}.png"
-        path = os.path.join(capture_dir, filename)
+        writer = ScreenshotWriter()
+        writer.ensure_configured()
+        png = Utils.grab_png(driver, element, scope, padding)
 
-        driver.save_screenshot(path)
+        if writer.store == "content":
+            # content-addressed: <run_root>/blobs/<hash>.<ext>, frame identik ditulis sekali
+            path, image_hash = ScreenshotStore.for_capture_dir(capture_dir).put(png, capture_dir)
+        else:
+            path = writer.target_path(capture_dir, f"{project_name}_{timestamp}_{rand_num}")
+            writer.submit(png, path)
+            image_hash = ""
 
         return {
             "title": step_title or "Untitled Step",  # 🆕 UPDATE
             "desc": step_desc or "",                 # 🆕 UPDATE
             "file": path,                             # 🆕 UPDATE
-            "case_id": case_id or ""                  # 🆕 UPDATE
+            "case_id": case_id or "",                 # 🆕 UPDATE
+            "hash": image_hash                        # sha256 PNG asli (mode Store: content)
         }
 
     @staticmethod
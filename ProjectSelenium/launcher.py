@@ -1,6 +1,5 @@
-import os, sys, pytest
+import sys, pytest
 from core.generic_keywords import GenericKeywords
-from core.data_loader import DataLoader  # DataLoader generik
 
 if __name__ == "__main__":
     # Gunakan pytest-html agar report tersimpan di folder Log/
@@ -13,46 +12,12 @@ if __name__ == "__main__":
         "--self-contained-html"
     ]))
 
-def test_feature(driver, run_dir, feature_name):
+def test_feature(driver, run_dir, testcase, locators):
     """
-    Eksekusi testcases untuk feature tertentu.
+    Eksekusi satu testcase (satu CaseID) dari feature yang dipilih.
+    Parametrize testcase dibuat di conftest.pytest_generate_tests, jadi tiap
+    CaseID punya node id sendiri dan bisa dijadwalkan xdist ke worker manapun.
     File testcases dan locators bisa YAML, CSV, atau XLSX.
     """
-    if not feature_name:
-        pytest.skip("[SKIPPED] Argumen --feature_name wajib diisi, contoh: pytest launcher.py --feature_name=login -s")
-
-    BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-    folder = os.path.join(BASE_DIR, "datatest", feature_name)
-
-    # --- Load testcases dan locators pakai DataLoader ---
-    try:
-        LOCATORS = DataLoader.load_locators(folder)
-        testcases = DataLoader.load_testcases(folder)
-    except FileNotFoundError as e:
-        pytest.skip(f"[SKIPPED] {str(e)}")
-
-
-    # --- Validasi wajib ada keduanya ---
-    if not testcases or not LOCATORS:
-        pytest.skip(f"[SKIPPED] File testcases/locators tidak lengkap di {folder}")
-
-    # --- Jalankan testcases ---
     executor = GenericKeywords(driver)
-    results = []
-    for testcase in testcases["test_cases"]:
-        if not testcase.get("Run", True):
-            print(f"[SKIPPED] {testcase['CaseID']} - {testcase['Title']}")
-            results.append((testcase['CaseID'], "SKIPPED"))
-            continue
-
-        try:
-            executor.execute_testcase(testcase, LOCATORS, run_dir)
-            results.append((testcase['CaseID'], "PASS"))
-        except Exception as e:
-            print(f"[ERROR] {testcase['CaseID']} - {testcase['Title']} gagal dijalankan: {e}")
-            results.append((testcase['CaseID'], "FAIL"))
-        continue
-
-    
-
-
+    executor.execute_testcase(testcase, locators, run_dir)
@@ -7,6 +7,8 @@ from reportlab.lib import colors
 from PIL import Image as PILImage
 import os, math
 
+from core.result_tracker import PHASES
+
 # --------- Header / Footer dengan Page X of Y ---------
 def _header_footer(canvas, doc, meta_info):
     """
@@ -74,6 +76,19 @@ def _scale_image(img_path, max_w=460, max_h=360):
     ratio = min(max_w / w, max_h / h)
     return int(w*ratio), int(h*ratio)
 
+def _format_step_time(step):
+    """'0.52 (0.02/0.10/0.30/0.05)' dari duration + timings step, '-' kalau tidak diukur. ' x2' = step di-retry."""
+    duration = step.get("duration")
+    if duration is None:
+        return "-"
+    attempts = step.get("attempts") or 1
+    retried = f" x{attempts}" if attempts > 1 else ""
+    timings = step.get("timings") or {}
+    if not timings:
+        return f"{duration:.2f}{retried}"
+    phases = "/".join(f"{timings.get(phase, 0):.2f}" for phase in PHASES)
+    return f"{duration:.2f} ({phases}){retried}"
+
 # TOC Entry Helper
 class TOCEntry(Flowable):
     def __init__(self, text, level, style):
@@ -246,13 +261,14 @@ def generate_pdf_report(output_path: str, snapshot: dict):
     flow.append(total_table)
     flow.append(Spacer(1,12))
 
-    summary_rows = [["Case - ID","Steps","Status"]]
+    summary_rows = [["Case - ID","Steps","Status",f"Time s ({'/'.join(PHASES)})"]]
     for c in cases:
         name = f"{c['title']} - {c['case_id']} - {c['scenario_type']}"
         steps_title = "\n".join(f"{s['step_id']}. {s['title']}" for s in c["steps"])
         steps_status = "\n".join(f"{s['step_id']}. {s['status']}" for s in c["steps"])
-        summary_rows.append([name,steps_title,steps_status])
-    sum_table = Table(summary_rows, colWidths=[240,180,120])
+        steps_time = "\n".join(f"{s['step_id']}. {_format_step_time(s)}" for s in c["steps"])
+        summary_rows.append([name,steps_title,steps_status,steps_time])
+    sum_table = Table(summary_rows, colWidths=[170,140,80,150])
     sum_table.setStyle(TableStyle([("GRID",(0,0),(-1,-1),0.25,colors.grey),("BACKGROUND",(0,0),(-1,0),colors.HexColor("#F5F5F5")),("VALIGN",(0,0),(-1,-1),"TOP")]))
     flow.append(sum_table)
     flow.append(PageBreak())
@@ -282,6 +298,9 @@ def generate_pdf_report(output_path: str, snapshot: dict):
                     step_flow.append(Image(s["image"], width=w, height=h))
                 except:
                     step_flow.append(Paragraph("[Gambar gagal dimuat]", styles["Small"]))
+            else:
+                # screenshot di-skip oleh CapturePolicy (mis. mode on-failure / every-nth)
+                step_flow.append(Paragraph("[Tidak ada screenshot untuk step ini]", styles["Small"]))
             if s.get("description"):
                 step_flow.append(Paragraph(s["description"], styles["Normal"]))        
 
@@ -2,6 +2,17 @@ import os, json
 from datetime import datetime
 from reports.pdf_report import generate_pdf_report
 from core.result_tracker import ResultTracker
+from reports.result_merge import merge_run
+from core.config_registry import ConfigRegistry
+from core.history_store import HistoryStore
+
+STATUS_MAP = {
+    0: "ALL PASSED",
+    1: "FAILED",
+    2: "INTERRUPTED",
+    3: "INTERNAL ERROR",
+    4: "USAGE ERROR"
+}
 
 
 def normalize_path(path: str) -> str:
@@ -9,18 +20,14 @@ def normalize_path(path: str) -> str:
 
 
 def collect_results(exitstatus: int = None, run_root: str = None):
-    """Dipanggil di setiap worker: simpan snapshot lokal (snapshot_PID.json)."""
+    """
+    Simpan snapshot penuh tracker proses ini (snapshot_PID.json).
+    Tidak lagi dipanggil per test: hasil per worker sekarang lewat event log (events_PID_TOKEN.jsonl).
+    """
     tracker = ResultTracker()
     snapshot = tracker.get_snapshot()
 
-    status_map = {
-        0: "ALL PASSED",
-        1: "FAILED",
-        2: "INTERRUPTED",
-        3: "INTERNAL ERROR",
-        4: "USAGE ERROR"
-    }
-    snapshot["meta"]["exitstatus"] = status_map.get(exitstatus, "UNKNOWN")
+    snapshot["meta"]["exitstatus"] = STATUS_MAP.get(exitstatus, "UNKNOWN")
 
     if run_root:
         worker_file = os.path.join(run_root, f"snapshot_{os.getpid()}.json")
@@ -39,37 +46,40 @@ def collect_results(exitstatus: int = None, run_root: str = None):
 
 
 def merge_worker_snapshots(run_root):
-    """Master menggabungkan semua snapshot worker, hitung ulang totals."""
-    merged = {"cases": [], "meta": {}, "totals": {"passed": 0, "failed": 0, "skipped": 0}}
-
-    for f in os.listdir(run_root):
-        if f.startswith("snapshot_") and f.endswith(".json"):
-            worker_path = os.path.join(run_root, f)
-            try:
-                with open(worker_path, "r", encoding="utf-8") as fp:
-                    data = json.load(fp)
-                    merged["cases"].extend(data.get("cases", []))
-                    merged["meta"].update(data.get("meta", {}))
-                    print(f"[DEBUG] Merged snapshot file: {worker_path}")
-            except Exception as e:
-                print(f"[WARN] Gagal baca snapshot {worker_path}: {e}")
-
-    # === hitung ulang totals dari semua cases ===
-    for case in merged["cases"]:
-        for step in case.get("steps", []):
-            status = step.get("status", "").lower()
-            if status == "passed":
-                merged["totals"]["passed"] += 1
-            elif status == "failed":
-                merged["totals"]["failed"] += 1
-            elif status == "skipped":
-                merged["totals"]["skipped"] += 1
-
+    """
+    Master menggabungkan hasil semua worker (events_*.jsonl + snapshot_*.json lama).
+    Streaming: cases urut CaseID, dibaca dari disk saat di-iterate; case yang di-retry
+    di worker lain cuma diambil attempt terakhir yang lengkap. Lihat reports/result_merge.py.
+    """
+    merged = merge_run(run_root)
+    print(f"[DEBUG] Merge selesai: {len(merged['cases'])} case, totals={merged['totals']}")
     return merged
 
 
-def generate_report(exitstatus: int = None, run_root: str = None):
-    """Dipanggil sekali oleh master untuk merge dan generate PDF."""
+def record_history(snapshot, run_root: str = None, feature: str = None, exitstatus: int = None):
+    """
+    Simpan hasil run ke HistoryStore (SQLite) kalau GlobalData.History.Enabled.
+    Dengan run_root case/step sudah dicatat tracker tiap worker (HistoryRecorder), di sini
+    cuma baris runs (totals, exitstatus). Tanpa run_root semua case ditulis dari snapshot.
+    """
+    try:
+        store = HistoryStore.from_config(ConfigRegistry.global_data())
+        if store is None:
+            return
+        run_id, started_at = HistoryStore.run_id_of(run_root)
+        exitstatus = STATUS_MAP.get(exitstatus, "UNKNOWN")
+        with store:
+            if run_root:
+                store.finish_run(run_id, snapshot.get("totals", {}), feature=feature,
+                                 exitstatus=exitstatus, started_at=started_at)
+            else:
+                store.record_run(run_id, snapshot, feature=feature, exitstatus=exitstatus, started_at=started_at)
+    except Exception as e:
+        print(f"[WARN] Gagal simpan history run: {e}")
+
+
+def generate_report(exitstatus: int = None, run_root: str = None, feature: str = None):
+    """Dipanggil sekali oleh master untuk merge, simpan history dan generate PDF."""
     if run_root and os.path.isdir(run_root):
         snapshot = merge_worker_snapshots(run_root)
     else:
@@ -79,6 +89,8 @@ def generate_report(exitstatus: int = None, run_root: str = None):
         print("[WARN] Snapshot kosong, PDF tidak dibuat.")
         return
 
+    record_history(snapshot, run_root, feature, exitstatus)
+
     output_dir = os.path.join("reports", "pdf")
     os.makedirs(output_dir, exist_ok=True)
     output_pdf = os.path.join(output_dir, f"report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf")
@@ -0,0 +1,200 @@
+# reports/result_merge.py
+import json
+import os
+import re
+
+from core.event_log import EventLog
+
+STATUS_KEYS = ("passed", "failed", "skipped", "warning", "done", "total")
+
+
+def natural_key(value):
+    """'TC2' < 'TC10', step 2 < step 10. Tuple (0, int) / (1, str) supaya selalu bisa dibandingkan."""
+    return tuple(
+        (0, int(part)) if part.isdigit() else (1, part.lower())
+        for part in re.split(r"(\d+)", str(value)) if part
+    )
+
+
+class _Attempt:
+    """1 percobaan case (case_start .. case_end) di 1 file event; step belum dibaca."""
+    __slots__ = ("case_id", "path", "offset", "ts", "complete", "status", "counts", "case")
+
+    def __init__(self, case_id, path=None, offset=0, ts=0.0, case=None):
+        self.case_id = case_id
+        self.path = path
+        self.offset = offset
+        self.ts = ts
+        self.complete = False
+        self.status = "incomplete"
+        self.counts = dict.fromkeys(("passed", "failed", "skipped", "other"), 0)
+        self.case = case   # hanya untuk snapshot_*.json lama (sudah di memori)
+
+    def count(self, status):
+        """1 step masuk tepat 1 bucket: passed / failed / skipped / other (warning dkk)."""
+        status = (status or "").lower()
+        self.counts[status if status in ("passed", "failed", "skipped") else "other"] += 1
+
+
+class MergedCases:
+    """
+    Daftar case hasil merge yang dibaca ulang dari disk setiap kali di-iterate
+    (PDF generator meng-iterate beberapa kali). Yang disimpan di memori cuma index offset,
+    jadi run dengan 100k+ step tetap aman.
+    """
+
+    def __init__(self, attempts):
+        self._attempts = attempts   # sudah urut CaseID
+
+    def __len__(self):
+        return len(self._attempts)
+
+    def __bool__(self):
+        return bool(self._attempts)
+
+    def __iter__(self):
+        handles = {}
+        try:
+            for attempt in self._attempts:
+                if attempt.case is not None:
+                    yield attempt.case
+                    continue
+                f = handles.get(attempt.path)
+                if f is None:
+                    f = handles[attempt.path] = open(attempt.path, "rb")
+                yield self._read_case(f, attempt)
+        finally:
+            for f in handles.values():
+                f.close()
+
+    @staticmethod
+    def _read_case(f, attempt):
+        f.seek(attempt.offset)
+        case = None
+        for raw in f:
+            try:
+                event = json.loads(raw)
+            except ValueError:
+                break   # baris terpotong di akhir file (worker crash)
+            kind = event.get("ev")
+            if kind == "case_start":
+                if case is not None:
+                    break   # case berikutnya, attempt ini tidak punya case_end
+                case = {
+                    "case_id": event.get("case_id"),
+                    "title": event.get("title"),
+                    "scenario_type": event.get("scenario_type"),
+                    "status": "incomplete",
+                    "steps": []
+                }
+            elif kind == "step" and event.get("case_id") == attempt.case_id:
+                case["steps"].append(event.get("step") or {})
+            elif kind == "case_end" and event.get("case_id") == attempt.case_id:
+                case["status"] = event.get("status") or "passed"
+                case["duration"] = event.get("duration")
+                break
+        # sort stabil: step dengan step_id sama tetap urut log
+        case["steps"].sort(key=lambda s: natural_key(s.get("step_id", "")))
+        return case
+
+
+def _index_events(path, attempts, meta):
+    """
+    1 pass baca file event: catat offset tiap case_start + hitung status step per attempt.
+    Isi step tidak disimpan.
+    """
+    current = {}
+    offset = 0
+    with open(path, "rb") as f:
+        for raw in f:
+            line_offset, offset = offset, offset + len(raw)
+            try:
+                event = json.loads(raw)
+            except ValueError:
+                continue
+            kind = event.get("ev")
+            case_id = event.get("case_id")
+            if kind == "case_start":
+                current[case_id] = _Attempt(case_id, path, line_offset, event.get("ts") or 0.0)
+                attempts.append(current[case_id])
+            elif kind == "step" and case_id in current:
+                current[case_id].count((event.get("step") or {}).get("status"))
+            elif kind == "case_end" and case_id in current:
+                attempt = current.pop(case_id)
+                attempt.complete = True
+                attempt.status = event.get("status") or "passed"
+            elif kind == "meta":
+                meta.update(event.get("meta") or {})
+
+
+def _index_snapshot(path, attempts, meta):
+    """snapshot_*.json format lama: dibaca penuh (hanya untuk kompatibilitas)."""
+    with open(path, "r", encoding="utf-8") as fp:
+        data = json.load(fp)
+    meta.update(data.get("meta", {}))
+    ts = os.path.getmtime(path)
+    for case in data.get("cases", []):
+        attempt = _Attempt(case.get("case_id"), ts=ts, case=case)
+        attempt.complete = True
+        attempt.status = case.get("status") or "passed"
+        for step in case.get("steps", []):
+            attempt.count(step.get("status"))
+        attempts.append(attempt)
+
+
+def _pick(attempts):
+    """Case yang dijalankan ulang di worker lain: ambil attempt lengkap yang paling akhir."""
+    best = {}
+    for attempt in attempts:
+        current = best.get(attempt.case_id)
+        if current is None or (attempt.complete, attempt.ts) >= (current.complete, current.ts):
+            best[attempt.case_id] = attempt
+    return sorted(best.values(), key=lambda a: natural_key(a.case_id))
+
+
+def _index_run(run_root):
+    attempts, meta = [], {}
+    for name in sorted(os.listdir(run_root)):
+        path = os.path.join(run_root, name)
+        try:
+            if name.startswith(EventLog.PREFIX) and name.endswith(EventLog.SUFFIX):
+                _index_events(path, attempts, meta)
+            elif name.startswith("snapshot_") and name.endswith(".json"):
+                _index_snapshot(path, attempts, meta)
+            else:
+                continue
+            print(f"[DEBUG] Index hasil worker: {path}")
+        except Exception as e:
+            print(f"[WARN] Gagal baca hasil worker {path}: {e}")
+    return attempts, meta
+
+
+def case_statuses(run_root):
+    """{case_id: status} attempt terpilih per case di run_root ("incomplete" kalau tanpa case_end)."""
+    attempts, _ = _index_run(run_root)
+    return {str(attempt.case_id): attempt.status for attempt in _pick(attempts)}
+
+
+def merge_run(run_root):
+    """
+    Merge streaming semua events_*.jsonl (+ snapshot_*.json lama) di run_root.
+    Return {meta, cases: MergedCases (urut CaseID, step urut step_id), totals}.
+    """
+    attempts, meta = _index_run(run_root)
+    chosen = _pick(attempts)
+    # totals 1 pass dari hitungan index, step tidak dibaca ulang (semantik sama dengan ResultTracker)
+    totals = dict.fromkeys(STATUS_KEYS, 0)
+    for attempt in chosen:
+        counts = attempt.counts
+        steps = sum(counts.values())
+        totals["passed"] += counts["passed"]
+        totals["failed"] += counts["failed"]
+        totals["skipped"] += counts["skipped"]
+        totals["warning"] += counts["other"]
+        totals["done"] += steps
+        totals["total"] += steps
+
+    dropped = len(attempts) - len(chosen)
+    if dropped:
+        print(f"[DEBUG] {dropped} attempt duplikat (case di-retry) dibuang")
+    return {"meta": meta, "cases": MergedCases(chosen), "totals": totals}
@@ -0,0 +1,68 @@
+# tests/test_capture_policy.py
+import pytest
+
+from core.capture_policy import CapturePolicy
+
+
+def _decisions(policy, actions):
+    return [policy.decide(action, idx) for idx, action in enumerate(actions, start=1)]
+
+
+def test_default_every_step():
+    policy = CapturePolicy.resolve({})
+    assert policy.mode == "every-step"
+    assert _decisions(policy, ["navigate", "click", "type"]) == [True, True, True]
+    assert policy.on_failure
+
+
+def test_never_juga_tanpa_capture_gagal():
+    policy = CapturePolicy("never")
+    assert _decisions(policy, ["navigate", "click"]) == [False, False]
+    assert not policy.on_failure
+
+
+def test_on_failure_step_passed_tidak_di_capture():
+    policy = CapturePolicy("on_failure")   # underscore diterima
+    assert _decisions(policy, ["navigate", "click"]) == [False, False]
+    assert policy.on_failure
+
+
+def test_every_nth_ikut_nomor_step():
+    policy = CapturePolicy("every-nth", every_n=3)
+    assert _decisions(policy, ["click"] * 7) == [False, False, True, False, False, True, False]
+
+
+def test_on_navigation_navigate_selalu_lainnya_cek_url():
+    policy = CapturePolicy("On-Navigation")
+    assert _decisions(policy, ["navigate", "click"]) == [True, CapturePolicy.CHECK_NAVIGATION]
+
+
+def test_prioritas_step_case_global():
+    globaldata = {"Screenshot": {"Mode": "every-nth", "EveryN": 5, "Scope": "region", "Padding": 16}}
+    case_policy = CapturePolicy.resolve(globaldata, {"Screenshot": "on-failure"})
+    assert (case_policy.mode, case_policy.every_n, case_policy.scope) == ("on-failure", 5, "region")
+
+    step_policy = CapturePolicy.resolve(globaldata, {"Screenshot": "on-failure"},
+                                        {"Screenshot": {"Mode": "every-nth", "EveryN": 2}})
+    assert (step_policy.mode, step_policy.every_n, step_policy.padding) == ("every-nth", 2, 16)
+    assert step_policy.decide("click", 4) is True
+
+
+def test_config_kosong_pakai_base():
+    base = CapturePolicy("never")
+    assert CapturePolicy.from_config("", base) is base
+    assert CapturePolicy.from_config(None, base) is base
+
+
+@pytest.mark.parametrize("config, message", [
+    ("sometimes", "mode tidak dikenal"),
+    ({"Scope": "window"}, "scope tidak dikenal"),
+])
+def test_config_tidak_valid(config, message):
+    with pytest.raises(ValueError, match=message):
+        CapturePolicy.from_config(config)
+
+
+def test_every_n_dan_padding_minimal():
+    policy = CapturePolicy("every-nth", every_n=0, padding=-4)
+    assert (policy.every_n, policy.padding) == (1, 0)
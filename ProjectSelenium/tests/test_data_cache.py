@@ -0,0 +1,128 @@
+# tests/test_data_cache.py
+import os
+import pickle
+
+import pytest
+
+from core.data_cache import DataCache
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(DataCache, "CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(DataCache, "enabled", True)
+    return DataCache
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / "testcases.csv"
+    path.write_text("CaseID,Action\nTC001,navigate\n")
+    return path
+
+
+class Parser:
+    """Parser palsu: hitung berapa kali file sumber benar-benar di-parse."""
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, path):
+        self.calls += 1
+        with open(path) as f:
+            return {"raw": f.read()}
+
+
+def _bump_mtime(path):
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10 ** 9))
+
+
+def test_parse_sekali_lalu_hit(cache, source):
+    parser = Parser()
+    first = cache.load(str(source), "testcases", parser)
+    assert cache.load(str(source), "testcases", parser) == first
+    assert parser.calls == 1
+
+
+def test_kind_beda_cache_beda(cache, source):
+    parser = Parser()
+    cache.load(str(source), "testcases", parser)
+    cache.load(str(source), "locators", parser)
+    assert parser.calls == 2
+
+
+def test_size_berubah_parse_ulang(cache, source):
+    parser = Parser()
+    cache.load(str(source), "testcases", parser)
+    source.write_text("CaseID,Action\nTC001,navigate\nTC002,click\n")
+    assert cache.load(str(source), "testcases", parser)["raw"].endswith("TC002,click\n")
+    assert parser.calls == 2
+
+
+def test_touch_isi_sama_tetap_hit(cache, source):
+    parser = Parser()
+    cache.load(str(source), "testcases", parser)
+    _bump_mtime(source)
+    cache.load(str(source), "testcases", parser)
+    assert parser.calls == 1
+    # stat baru disimpan: lookup berikutnya tidak perlu hash ulang
+    with open(cache._cache_path(str(source), "testcases"), "rb") as f:
+        assert pickle.load(f)["stat"][0] == os.stat(source).st_mtime_ns
+
+
+def test_mtime_berubah_isi_beda_size_sama(cache, source):
+    parser = Parser()
+    cache.load(str(source), "testcases", parser)
+    source.write_text("CaseID,Action\nTC009,navigate\n")
+    _bump_mtime(source)
+    assert "TC009" in cache.load(str(source), "testcases", parser)["raw"]
+    assert parser.calls == 2
+
+
+def test_version_beda_cache_diabaikan(cache, source, monkeypatch):
+    parser = Parser()
+    cache.load(str(source), "testcases", parser)
+    monkeypatch.setattr(DataCache, "VERSION", DataCache.VERSION + 1)
+    assert cache.lookup(str(source), "testcases") is None
+    cache.load(str(source), "testcases", parser)
+    assert parser.calls == 2
+
+
+def test_file_cache_rusak_dianggap_miss(cache, source):
+    parser = Parser()
+    cache.load(str(source), "testcases", parser)
+    with open(cache._cache_path(str(source), "testcases"), "wb") as f:
+        f.write(b"bukan pickle")
+    cache.load(str(source), "testcases", parser)
+    assert parser.calls == 2
+
+
+def test_disabled_selalu_parse(cache, source, monkeypatch):
+    monkeypatch.setattr(DataCache, "enabled", False)
+    parser = Parser()
+    cache.load(str(source), "testcases", parser)
+    cache.load(str(source), "testcases", parser)
+    assert parser.calls == 2
+    assert not os.path.isdir(DataCache.CACHE_DIR)
+
+
+def test_tulis_atomic_tanpa_sisa_tmp(cache, source):
+    cache.load(str(source), "testcases", Parser())
+    assert [f for f in os.listdir(cache.CACHE_DIR) if not f.endswith(".pkl")] == []
+
+
+def test_replace_gagal_cache_lama_utuh(cache, source, monkeypatch):
+    cache.load(str(source), "testcases", Parser())
+    cache_path = cache._cache_path(str(source), "testcases")
+    with open(cache_path, "rb") as f:
+        before = f.read()
+
+    def fail_replace(src, dst):
+        raise OSError("disk penuh")
+
+    monkeypatch.setattr(os, "replace", fail_replace)
+    source.write_text("CaseID,Action\nTC002,click\n")
+    assert cache.load(str(source), "testcases", Parser())["raw"].startswith("CaseID")   # test tetap jalan
+    with open(cache_path, "rb") as f:
+        assert f.read() == before
+    assert os.listdir(cache.CACHE_DIR) == [os.path.basename(cache_path)]
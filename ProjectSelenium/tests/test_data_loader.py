@@ -0,0 +1,41 @@
+# tests/test_data_loader.py
+import pytest
+
+from core.data_cache import DataCache
+from core.data_loader import DataLoader
+from core.preflight import Preflight
+
+# baris TC001 terpisah oleh TC002 (CaseID tidak berurutan di file)
+TESTCASES = """CaseID,CaseTitle,ScenarioType,Run,StepTitle,Action,Locator,TestData
+TC001,Login,positive,true,Buka,navigate,,https://example.com
+TC001,Login,positive,true,Refresh,navigate,,https://example.com/home
+TC002,Logout,positive,true,Buka,navigate,,https://example.com
+TC001,Login,positive,true,Terbang,terbang,,
+"""
+
+
+@pytest.fixture
+def folder(tmp_path, monkeypatch):
+    monkeypatch.setattr(DataCache, "enabled", False)
+    (tmp_path / "testcases.csv").write_text(TESTCASES, encoding="utf-8")
+    (tmp_path / "locators.csv").write_text("LocatorName,LocatorType,LocatorValue\n", encoding="utf-8")
+    return str(tmp_path)
+
+
+def test_load_testcases_gabung_caseid_terpisah(folder):
+    cases = DataLoader.load_testcases(folder)["test_cases"]
+    assert [c["CaseID"] for c in cases] == ["TC001", "TC002"]
+    assert [s["StepID"] for s in cases[0]["TestSteps"]] == ["1", "2", "3"]
+
+
+def test_iter_testcases_caseid_terpisah_jadi_potongan_sendiri(folder):
+    cases = list(DataLoader.iter_testcases(folder))
+    assert [c["CaseID"] for c in cases] == ["TC001", "TC002", "TC001"]
+    assert [s["StepID"] for s in cases[2]["TestSteps"]] == ["1"]
+
+
+def test_preflight_pakai_aturan_merge_collection(folder):
+    report = Preflight.validate_feature(folder)
+    assert list(report) == ["TC001"]
+    # step terbang = step ke-3 TC001 setelah digabung, bukan step 1 potongan kedua
+    assert [step_id for step_id, _ in report["TC001"]] == [3]
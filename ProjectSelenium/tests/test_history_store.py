@@ -0,0 +1,97 @@
+# tests/test_history_store.py
+import pytest
+
+from core.history_store import HistoryRecorder, HistoryStore
+from core.result_tracker import ResultTracker
+from core.run_info import RunInfo
+
+RUN_ID = "run_20260101_080000"
+
+
+@pytest.fixture
+def run_root(tmp_path):
+    root = tmp_path / RUN_ID
+    root.mkdir()
+    RunInfo.write(str(root), feature="login")
+    return str(root)
+
+
+@pytest.fixture
+def globaldata(tmp_path):
+    return {"History": {"Enabled": True, "Path": str(tmp_path / "history.sqlite")}}
+
+
+@pytest.fixture
+def tracker():
+    tracker = ResultTracker()
+    tracker.reset()
+    yield tracker
+    tracker.close_history()
+    tracker.reset()
+
+
+def _run_case(tracker, case_id, statuses):
+    tracker.start_test_case(case_id, f"Case {case_id}", "positive")
+    for step_id, status in enumerate(statuses, start=1):
+        tracker.log_step(case_id, step_id, f"Step {step_id}", "", "", status, duration=0.1)
+    tracker.end_test_case(case_id)
+
+
+def _rows(path, sql):
+    with HistoryStore(path) as store:
+        return [tuple(row) for row in store.conn.execute(sql)]
+
+
+def test_history_tidak_aktif_tanpa_recorder(run_root):
+    assert HistoryRecorder.for_run({"History": {"Enabled": False}}, run_root) is None
+
+
+def test_case_dicatat_tracker_per_batch(tracker, run_root, globaldata, monkeypatch):
+    monkeypatch.setattr(HistoryRecorder, "FLUSH_SECONDS", 3600)
+    recorder = HistoryRecorder.for_run(globaldata, run_root)
+    tracker.attach_history(recorder)
+    path = recorder.store.path
+
+    _run_case(tracker, "TC1", ["passed", "passed"])
+    assert _rows(path, "SELECT case_id FROM cases") == []   # masih di buffer
+
+    monkeypatch.setattr(HistoryStore, "BATCH_SIZE", 3)
+    _run_case(tracker, "TC2", ["passed"])
+    assert _rows(path, "SELECT case_id, status FROM cases ORDER BY case_id") == [
+        ("TC1", "passed"), ("TC2", "passed")]
+    assert _rows(path, "SELECT run_id, feature, started_at, total FROM runs") == [
+        (RUN_ID, "login", "2026-01-01T08:00:00", None)]
+
+
+def test_rerun_mengganti_step_lama_dan_case_lain_tetap(tracker, run_root, globaldata):
+    recorder = HistoryRecorder.for_run(globaldata, run_root)
+    tracker.attach_history(recorder)
+    path = recorder.store.path
+    _run_case(tracker, "TC1", ["passed", "failed", "passed"])
+    _run_case(tracker, "TC2", ["passed"])
+    tracker.close_history()
+
+    # --rerun_failed di folder run yang sama: proses baru, cuma TC1 yang jalan ulang
+    tracker.attach_history(HistoryRecorder.for_run(globaldata, run_root))
+    _run_case(tracker, "TC1", ["passed"])
+    tracker.close_history()
+
+    assert _rows(path, "SELECT case_id, status FROM cases ORDER BY case_id") == [
+        ("TC1", "passed"), ("TC2", "passed")]
+    assert _rows(path, "SELECT case_id, seq FROM steps ORDER BY case_id, seq") == [("TC1", 1), ("TC2", 1)]
+
+
+def test_finish_run_cuma_update_baris_runs(tracker, run_root, globaldata):
+    recorder = HistoryRecorder.for_run(globaldata, run_root)
+    tracker.attach_history(recorder)
+    path = recorder.store.path
+    _run_case(tracker, "TC1", ["passed", "failed"])
+    tracker.close_history()
+
+    with HistoryStore(path) as store:
+        store.finish_run(RUN_ID, {"passed": 1, "failed": 1, "total": 2}, feature="login", exitstatus="FAILED")
+
+    assert _rows(path, "SELECT feature, started_at, exitstatus, passed, failed, total FROM runs") == [
+        ("login", "2026-01-01T08:00:00", "FAILED", 1, 1, 2)]
+    assert _rows(path, "SELECT case_id, status FROM cases") == [("TC1", "failed")]
+    assert _rows(path, "SELECT COUNT(*) FROM steps") == [(2,)]
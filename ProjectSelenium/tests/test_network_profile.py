@@ -0,0 +1,254 @@
+# tests/test_network_profile.py
+import re
+
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+from benchmarks.heavy_site import HeavySite
+from core import driver_factory
+from core.driver_factory import DriverFactory, DriverPool
+from core.network_profile import NetworkProfile, RESOURCE_PATTERNS
+
+BLOCK = {"Patterns": ["*/analytics/*", "*/ads/*"], "ResourceTypes": ["image", "font"]}
+_ASSET = re.compile(r'(?:src="|url\()([^")]+)')
+
+
+def _cdp_match(pattern, url):
+    """Semantik Network.setBlockedURLs: cuma * yang wildcard, karakter lain (termasuk ?) literal."""
+    return re.fullmatch(".*".join(map(re.escape, pattern.split("*"))), url) is not None
+
+
+class CdpDriver:
+    """WebDriver palsu (chromium): catat semua execute_cdp_cmd, cukup untuk DriverFactory + DriverPool."""
+    def __init__(self, fail_on=None, **kwargs):
+        self.cdp = []
+        self.fail_on = fail_on
+        self.quit_called = False
+        self.window_handles = ["main"]
+        self.switch_to = self
+
+    def execute_cdp_cmd(self, cmd, params):
+        if cmd == self.fail_on:
+            raise WebDriverException(f"{cmd} gagal")
+        self.cdp.append((cmd, params))
+        return {}
+
+    def commands(self, name):
+        return [params for cmd, params in self.cdp if cmd == name]
+
+    def implicitly_wait(self, timeout):
+        pass
+
+    def window(self, handle):
+        pass
+
+    def execute_script(self, script, *args):
+        pass
+
+    def delete_all_cookies(self):
+        pass
+
+    def get(self, url):
+        pass
+
+    def quit(self):
+        self.quit_called = True
+
+
+class Chrome:
+    """Pengganti webdriver.Chrome: catat driver yang dibuat, fail_on = perintah CDP yang dibuat gagal."""
+    def __init__(self):
+        self.created = []
+        self.fail_on = None
+
+    def __call__(self, service=None, options=None):
+        driver = CdpDriver(fail_on=self.fail_on)
+        self.created.append(driver)
+        return driver
+
+
+@pytest.fixture
+def chrome(monkeypatch):
+    """DriverFactory.create tanpa browser asli."""
+    fake = Chrome()
+    monkeypatch.setattr(driver_factory.webdriver, "Chrome", fake)
+    monkeypatch.setattr(driver_factory.DriverResolver, "resolve", staticmethod(lambda browser, globaldata: "chromedriver"))
+    return fake
+
+
+def _globaldata(network):
+    return {"Browser": "chrome", "Headless": True, "Timeout": 1, "Network": network}
+
+
+# -------------------- from_config --------------------
+def test_default_tanpa_network_tidak_aktif():
+    profile = NetworkProfile.from_config({})
+    assert profile.blocked_urls == ()
+    assert profile.conditions is None
+    assert not profile.active
+
+
+def test_resource_types_jadi_pola_ekstensi():
+    profile = NetworkProfile.from_config({"Network": {"Block": BLOCK}})
+    assert profile.blocked_urls[:2] == ("*/analytics/*", "*/ads/*")
+    assert set(RESOURCE_PATTERNS["image"] + RESOURCE_PATTERNS["font"]) <= set(profile.blocked_urls)
+    assert profile.active
+
+
+@pytest.mark.parametrize("url", [
+    "https://cdn.test/img/logo.png",
+    "https://cdn.test/img/logo.png?v=3",
+    "https://cdn.test/fonts/heavy.woff2?family=x#iefix",
+    "https://cdn.test/static/app.js#x",
+    "https://cdn.test/static/app.js?v=1.2.3",
+])
+def test_resource_types_blok_url_versioned(url):
+    profile = NetworkProfile.from_config({"Network": {"Block": {"ResourceTypes": ["image", "font", "script"]}}})
+    assert any(_cdp_match(pattern, url) for pattern in profile.blocked_urls)
+
+
+@pytest.mark.parametrize("url", [
+    "https://cdn.test/api/data.json",
+    "https://cdn.test/img/logo.pngx",
+    "https://cdn.test/page?file=app.jsx",
+])
+def test_resource_types_tidak_blok_ekstensi_mirip(url):
+    profile = NetworkProfile.from_config({"Network": {"Block": {"ResourceTypes": ["image", "script"]}}})
+    assert not any(_cdp_match(pattern, url) for pattern in profile.blocked_urls)
+
+
+def test_pola_dobel_cuma_sekali():
+    profile = NetworkProfile.from_config({"Network": {"Block": {"Patterns": ["*.png"], "ResourceTypes": ["Image"]}}})
+    assert profile.blocked_urls.count("*.png") == 1
+
+
+def test_resource_type_tidak_dikenal():
+    with pytest.raises(ValueError, match="ResourceType tidak dikenal"):
+        NetworkProfile.from_config({"Network": {"Block": {"ResourceTypes": ["video"]}}})
+
+
+def test_profile_tidak_dikenal():
+    with pytest.raises(ValueError, match="profile tidak dikenal"):
+        NetworkProfile.from_config({"Network": {"Profile": "5g"}})
+
+
+def test_throttle_preset_kbit_ke_byte():
+    conditions = NetworkProfile.from_config({"Network": {"Profile": "Slow-3G"}}).conditions
+    assert conditions == {"offline": False, "latency": 400.0,
+                          "downloadThroughput": 400 * 1024 // 8, "uploadThroughput": 400 * 1024 // 8}
+
+
+def test_offline_tanpa_batas_throughput():
+    conditions = NetworkProfile.from_config({"Network": {"Profile": "offline"}}).conditions
+    assert conditions["offline"] is True
+    assert conditions["downloadThroughput"] == conditions["uploadThroughput"] == -1
+
+
+def test_profile_custom_override_preset():
+    globaldata = {"Network": {"Profile": "4G", "Profiles": {"4g": {"Latency": 80, "Download": 2000}}}}
+    conditions = NetworkProfile.from_config(globaldata).conditions
+    assert conditions["latency"] == 80.0
+    assert conditions["downloadThroughput"] == 2000 * 1024 // 8
+    assert conditions["uploadThroughput"] == -1
+
+
+def test_apply_browser_tanpa_cdp_dilewati():
+    profile = NetworkProfile.from_config({"Network": {"Block": BLOCK}})
+    assert profile.apply(object()) is False
+
+
+# -------------------- apply: perintah CDP ke browser --------------------
+def test_apply_kirim_cdp_berurutan():
+    profile = NetworkProfile.from_config({"Network": {"Block": BLOCK, "Profile": "fast-3g"}})
+    driver = CdpDriver()
+    assert profile.apply(driver) is True
+    assert driver.cdp == [
+        ("Network.enable", {}),
+        ("Network.setBlockedURLs", {"urls": ["*/analytics/*", "*/ads/*"]
+                                    + list(RESOURCE_PATTERNS["image"] + RESOURCE_PATTERNS["font"])}),
+        ("Network.emulateNetworkConditions", {"offline": False, "latency": 150.0,
+                                              "downloadThroughput": 1600 * 1024 // 8,
+                                              "uploadThroughput": 750 * 1024 // 8}),
+    ]
+
+
+def test_apply_block_saja_tanpa_throttle():
+    driver = CdpDriver()
+    NetworkProfile.from_config({"Network": {"Block": {"Patterns": ["*/ads/*"]}}}).apply(driver)
+    assert [cmd for cmd, _ in driver.cdp] == ["Network.enable", "Network.setBlockedURLs"]
+    assert driver.commands("Network.setBlockedURLs") == [{"urls": ["*/ads/*"]}]
+
+
+def test_apply_throttle_saja_tanpa_blocklist():
+    driver = CdpDriver()
+    NetworkProfile.from_config({"Network": {"Profile": "offline"}}).apply(driver)
+    assert [cmd for cmd, _ in driver.cdp] == ["Network.enable", "Network.emulateNetworkConditions"]
+    assert driver.commands("Network.emulateNetworkConditions")[0]["offline"] is True
+
+
+def test_apply_tidak_aktif_tanpa_cdp():
+    driver = CdpDriver()
+    assert NetworkProfile.from_config({}).apply(driver) is True
+    assert driver.cdp == []
+
+
+def test_pola_cocok_dengan_asset_heavy_site_versioned():
+    profile = NetworkProfile.from_config({"Network": {"Block": BLOCK}})
+    with HeavySite(images=3, asset_delay=0) as site:
+        urls = [site.url.rstrip("/") + src for src in _ASSET.findall(site.page().decode())]
+    assert len(urls) == 6   # 3 gambar + font + analytics + ads
+    for url in urls:
+        assert any(_cdp_match(pattern, url + "?v=3") for pattern in profile.blocked_urls), url
+    assert not any(_cdp_match(pattern, site.url) for pattern in profile.blocked_urls)
+
+
+# -------------------- DriverFactory / DriverPool --------------------
+def test_create_apply_sekali_per_driver(chrome):
+    globaldata = _globaldata({"Block": BLOCK, "Profile": "slow-3g"})
+    first, second = DriverFactory.create(globaldata), DriverFactory.create(globaldata)
+    assert chrome.created == [first, second]
+    for driver in chrome.created:
+        assert [cmd for cmd, _ in driver.cdp] == \
+            ["Network.enable", "Network.setBlockedURLs", "Network.emulateNetworkConditions"]
+
+
+def test_driver_pool_reuse_tidak_apply_ulang(chrome):
+    pool = DriverPool(lambda: DriverFactory.create(_globaldata({"Block": BLOCK})), max_uses=5)
+    driver = pool.acquire()
+    pool.release(driver)
+    assert pool.acquire() is driver
+    assert len(chrome.created) == 1
+    assert len(driver.commands("Network.setBlockedURLs")) == 1
+    assert len(driver.commands("Network.enable")) == 1
+
+
+def test_create_network_tidak_valid_sebelum_browser_dibuat(chrome):
+    with pytest.raises(ValueError, match="profile tidak dikenal"):
+        DriverFactory.create(_globaldata({"Profile": "5g"}))
+    assert chrome.created == []
+
+
+def test_create_apply_gagal_browser_di_quit(chrome):
+    chrome.fail_on = "Network.setBlockedURLs"
+    with pytest.raises(WebDriverException):
+        DriverFactory.create(_globaldata({"Block": BLOCK}))
+    assert [driver.quit_called for driver in chrome.created] == [True]
+
+
+def test_blocklist_di_browser_asli():
+    from core.config_registry import ConfigRegistry
+    from core.driver_factory import DriverFactory
+
+    globaldata = dict(ConfigRegistry.global_data(), Headless=True, Network={"Block": BLOCK})
+    try:
+        driver = DriverFactory.create(globaldata)
+    except Exception as e:
+        pytest.skip(f"browser tidak bisa dibuat: {str(e).splitlines()[0]}")
+    try:
+        with HeavySite(images=3, asset_delay=0) as site:
+            driver.get(site.url)
+            hits = dict(site.hits)
+    finally:
+        driver.quit()
+    assert "/" in hits
+    assert not [path for path in hits if path.startswith(("/img/", "/fonts/", "/analytics/", "/ads/"))]
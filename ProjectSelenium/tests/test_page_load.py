@@ -0,0 +1,98 @@
+# tests/test_page_load.py
+import pytest
+from selenium.webdriver.common.by import By
+
+from core.page_load import PageReady
+
+
+class Driver:
+    """Driver palsu: readyState, elemen yang ada di DOM, dan hasil script bisa diatur."""
+    def __init__(self, state="complete", elements=(), script_result=True):
+        self.state = state
+        self.elements = set(elements)
+        self.script_result = script_result
+        self.scripts = []
+
+    def execute_script(self, script):
+        if script == "return document.readyState":
+            return self.state
+        self.scripts.append(script)
+        return self.script_result
+
+    def find_elements(self, by, value):
+        return ["elem"] if (by, value) in self.elements else []
+
+
+# -------------------- Script --------------------
+@pytest.mark.parametrize("script, expected", [
+    ("window.appReady === true", "return (window.appReady === true);"),
+    ("window.appReady === true;", "return (window.appReady === true);"),
+    ("document.title === 'a;b'", "return (document.title === 'a;b');"),
+    ("window.returned", "return (window.returned);"),
+    ("return window.appReady", "return window.appReady"),
+    ("var app = window.app; return app && app.ready;", "var app = window.app; return app && app.ready;"),
+])
+def test_script_dibungkus_hanya_kalau_ekspresi(script, expected):
+    assert PageReady(script=script).script == expected
+
+
+@pytest.mark.parametrize("script", ["var a = window.app; a.ready", "window.a &&\nwindow.b"])
+def test_script_statement_tanpa_return_ditolak(script):
+    with pytest.raises(ValueError, match="tidak ada return"):
+        PageReady(script=script)
+
+
+# -------------------- config --------------------
+def test_state_tidak_dikenal():
+    with pytest.raises(ValueError, match="Ready state tidak dikenal"):
+        PageReady("loaded")
+
+
+def test_strategy_default_dan_tidak_dikenal():
+    assert PageReady.strategy({}) == "normal"
+    assert PageReady.strategy({"PageLoad": {"Strategy": "Eager"}}) == "eager"
+    with pytest.raises(ValueError, match="PageLoad.Strategy tidak dikenal"):
+        PageReady.strategy({"PageLoad": {"Strategy": "lazy"}})
+
+
+def test_resolve_tanpa_config_tidak_aktif():
+    assert not PageReady.resolve({}).active
+
+
+def test_strategy_none_minimal_interactive():
+    assert PageReady.resolve({"PageLoad": {"Strategy": "none"}}).state == "interactive"
+
+
+def test_step_ready_override_global():
+    globaldata = {"PageLoad": {"State": "interactive", "Element": "{global.LoginLink}", "Script": "window.ok"}}
+    ready = PageReady.resolve(globaldata, {"Ready": "complete"})
+    assert (ready.state, ready.element, ready.script) == ("complete", "{global.LoginLink}", "return (window.ok);")
+
+    ready = PageReady.resolve(globaldata, {"Ready": {"Script": "window.done"}})
+    assert (ready.state, ready.script) == ("interactive", "return (window.done);")
+
+
+def test_ready_tipe_tidak_valid():
+    with pytest.raises(ValueError, match="Ready tidak valid"):
+        PageReady.resolve({}, {"Ready": ["complete"]})
+
+
+# -------------------- kondisi --------------------
+def test_state_minimal():
+    ready = PageReady("interactive")
+    assert not ready(Driver(state="loading"))
+    assert ready(Driver(state="interactive"))
+    assert ready(Driver(state="complete"))
+
+
+def test_element_dan_script_harus_terpenuhi():
+    ready = PageReady("complete", (By.ID, "app"), "window.ok")
+    assert not ready(Driver(elements=[]))
+    assert not ready(Driver(elements=[(By.ID, "app")], script_result=False))
+    driver = Driver(elements=[(By.ID, "app")])
+    assert ready(driver)
+    assert driver.scripts == ["return (window.ok);"]
+
+
+def test_describe():
+    assert PageReady("complete", (By.ID, "app")).describe() == "state>=complete, element ('id', 'app')"
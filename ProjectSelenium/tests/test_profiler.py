@@ -0,0 +1,30 @@
+# tests/test_profiler.py
+import os
+
+from core.profiler import SessionProfiler
+
+
+def _dump(run_root, session, samples):
+    profiler = SessionProfiler("sample", session=session)
+    profiler._samples.update(samples)
+    return profiler.dump(run_root)
+
+
+def test_nama_file_per_session(tmp_path):
+    first = _dump(str(tmp_path), "aaaa1111", {"main;run": 1})
+    second = _dump(str(tmp_path), "bbbb2222", {"main;run": 1})   # pid sama, session beda
+    assert first != second
+    assert os.path.basename(first) == f"profile_aaaa1111_{os.getpid()}.collapsed"
+    assert os.path.isfile(first) and os.path.isfile(second)
+
+
+def test_merge_cuma_file_session_ini(tmp_path):
+    _dump(str(tmp_path), "oldrun00", {"main;lama": 1000})   # session sebelumnya di run_* yang sama
+    current = _dump(str(tmp_path), "newrun00", {"main;baru": 3})
+    SessionProfiler.merge(str(tmp_path), [current, current], top=5)
+    merged = (tmp_path / "profile_merged.collapsed").read_text(encoding="utf-8")
+    assert merged == "main;baru 3\n"
+
+
+def test_session_default_acak():
+    assert SessionProfiler().session != SessionProfiler().session
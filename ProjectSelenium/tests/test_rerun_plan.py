@@ -0,0 +1,76 @@
+# tests/test_rerun_plan.py
+import json
+
+import pytest
+
+from core.case_scheduler import case_id_of
+from core.rerun_plan import RerunPlan
+
+
+def _nodeid(case_id):
+    """Node id persis seperti buatan pytest: non-ASCII di-escape ('é' -> '\\xe9')."""
+    return f"launcher.py::test_feature[{case_id.encode('unicode_escape').decode('ascii')}]"
+
+
+class Item:
+    def __init__(self, case_id):
+        self.nodeid = _nodeid(case_id)
+
+
+def _events(run_root, *cases):
+    """events_*.jsonl minimal: (case_id, status), status None = tanpa case_end."""
+    with open(run_root / "events_1_abcd1234.jsonl", "w", encoding="utf-8") as f:
+        for ts, (case_id, status) in enumerate(cases, start=1):
+            f.write(json.dumps({"ev": "case_start", "ts": ts, "case_id": case_id, "attempt": 1}) + "\n")
+            if status:
+                f.write(json.dumps({"ev": "case_end", "ts": ts, "case_id": case_id, "status": status}) + "\n")
+
+
+# -------------------- case_id_of --------------------
+@pytest.mark.parametrize("case_id", ["TC001", "TC001#2", "Daftar-é", "登録-01", "TC[1]", "a\\b"])
+def test_case_id_of_kembali_ke_case_id_asli(case_id):
+    assert case_id_of(_nodeid(case_id)) == case_id
+
+
+def test_case_id_of_escaping_pytest_dimatikan():
+    assert case_id_of("launcher.py::test_feature[Daftar-é]") == "Daftar-é"
+
+
+@pytest.mark.parametrize("nodeid", ["launcher.py::test_feature", "tests/test_x.py::test_y"])
+def test_case_id_of_tanpa_param(nodeid):
+    assert case_id_of(nodeid) is None
+
+
+@pytest.mark.parametrize("case_id", ["Daftar-é", "登録-01#2"], ids=str)
+def test_case_id_of_node_id_asli_pytest(request, case_id):
+    # node id test ini sendiri sudah di-escape pytest
+    assert "\\" in request.node.nodeid
+    assert case_id_of(request.node.nodeid) == case_id
+
+
+# -------------------- RerunPlan --------------------
+def test_select_pisah_berdasarkan_case_id():
+    plan = RerunPlan("run", "resume", {"TC001", "TC001#2", "Daftar-é"})
+    items = [Item(c) for c in ("TC001", "TC001#2", "TC001#3", "Daftar-é", "Daftar-è")]
+    selected, deselected = plan.select(items, case_id_of)
+    assert [case_id_of(i.nodeid) for i in selected] == ["TC001#3", "Daftar-è"]
+    assert [case_id_of(i.nodeid) for i in deselected] == ["TC001", "TC001#2", "Daftar-é"]
+
+
+def test_build_resume_cuma_ulang_yang_belum_selesai(tmp_path):
+    _events(tmp_path, ("TC001", "passed"), ("TC001#2", "failed"), ("Daftar-é", None))
+    plan = RerunPlan.build(str(tmp_path), "resume")
+    assert plan.done == {"TC001", "TC001#2"}
+
+
+def test_build_rerun_failed_ikut_ulang_yang_gagal(tmp_path):
+    _events(tmp_path, ("TC001", "passed"), ("TC001#2", "failed"), ("Daftar-é", None))
+    plan = RerunPlan.build(str(tmp_path), "rerun-failed")
+    assert plan.done == {"TC001"}
+    selected, _ = plan.select([Item("TC001"), Item("TC001#2"), Item("Daftar-é"), Item("TC009")], case_id_of)
+    assert [case_id_of(i.nodeid) for i in selected] == ["TC001#2", "Daftar-é", "TC009"]
+
+
+def test_build_mode_tidak_dikenal(tmp_path):
+    with pytest.raises(ValueError, match="Mode rerun tidak dikenal"):
+        RerunPlan.build(str(tmp_path), "all")
@@ -0,0 +1,121 @@
+# tests/test_result_merge.py
+import json
+
+from reports.result_merge import case_statuses, merge_run, natural_key
+
+
+def _step(step_id, status):
+    return {"step_id": step_id, "title": f"step {step_id}", "status": status}
+
+
+class Events:
+    """Tulis events_<pid>_<token>.jsonl seperti EventLog, ts diatur manual supaya urutan attempt pasti."""
+    def __init__(self, run_root, name):
+        self.path = run_root / f"events_{name}.jsonl"
+        self.ts = 0.0
+
+    def emit(self, ev, ts=None, **fields):
+        fields.update(ev=ev, ts=ts if ts is not None else self.ts)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(fields, ensure_ascii=False) + "\n")
+
+    def case(self, case_id, ts, steps, status=None, end=True):
+        self.emit("case_start", ts, case_id=case_id, attempt=1, title=f"Case {case_id}", scenario_type="Positive")
+        for step in steps:
+            self.emit("step", ts, case_id=case_id, step=step)
+        if end:
+            self.emit("case_end", ts, case_id=case_id, status=status or "passed", duration=0.1)
+
+
+def _cases(merged):
+    return {case["case_id"]: case for case in merged["cases"]}
+
+
+def test_natural_key():
+    assert sorted(["TC10", "TC2", "tc1", "TC2#2"], key=natural_key) == ["tc1", "TC2", "TC2#2", "TC10"]
+    assert sorted([10, "2", 1], key=natural_key) == [1, "2", 10]
+
+
+def test_attempt_lengkap_terakhir_menang(tmp_path):
+    Events(tmp_path, "1_a").case("TC1", 1.0, [_step(1, "failed")], "failed")
+    Events(tmp_path, "2_b").case("TC1", 2.0, [_step(1, "passed")], "passed")
+    merged = merge_run(str(tmp_path))
+    assert _cases(merged)["TC1"]["status"] == "passed"
+    assert merged["totals"]["failed"] == 0
+
+
+def test_attempt_tidak_lengkap_kalah_dari_yang_lengkap(tmp_path):
+    Events(tmp_path, "1_a").case("TC1", 1.0, [_step(1, "passed")], "passed")
+    Events(tmp_path, "2_b").case("TC1", 5.0, [_step(1, "failed")], end=False)   # worker crash
+    assert case_statuses(str(tmp_path)) == {"TC1": "passed"}
+
+
+def test_case_tanpa_case_end_incomplete(tmp_path):
+    Events(tmp_path, "1_a").case("TC1", 1.0, [_step(1, "passed")], end=False)
+    merged = merge_run(str(tmp_path))
+    assert _cases(merged)["TC1"]["status"] == "incomplete"
+    assert case_statuses(str(tmp_path)) == {"TC1": "incomplete"}
+
+
+def test_attempt_ulang_di_file_yang_sama(tmp_path):
+    events = Events(tmp_path, "1_a")
+    events.case("TC1", 1.0, [_step(1, "failed")], "failed")
+    events.case("TC1", 2.0, [_step(1, "passed"), _step(2, "passed")], "passed")
+    merged = merge_run(str(tmp_path))
+    assert [s["status"] for s in _cases(merged)["TC1"]["steps"]] == ["passed", "passed"]
+    assert merged["totals"]["total"] == 2
+
+
+def test_urutan_case_dan_step_natural(tmp_path):
+    events = Events(tmp_path, "1_a")
+    events.case("TC10", 1.0, [_step(1, "passed")])
+    events.case("TC2", 1.0, [_step(10, "passed"), _step(2, "passed"), _step(1, "passed")])
+    Events(tmp_path, "2_b").case("TC1", 1.0, [_step(1, "passed")])
+    cases = list(merge_run(str(tmp_path))["cases"])
+    assert [c["case_id"] for c in cases] == ["TC1", "TC2", "TC10"]
+    assert [s["step_id"] for s in cases[1]["steps"]] == [1, 2, 10]
+
+
+def test_cases_bisa_di_iterate_berulang(tmp_path):
+    Events(tmp_path, "1_a").case("TC1", 1.0, [_step(1, "passed")])
+    cases = merge_run(str(tmp_path))["cases"]
+    assert len(cases) == 1
+    assert list(cases) == list(cases)
+
+
+def test_totals_bucket_tidak_dobel(tmp_path):
+    Events(tmp_path, "1_a").case("TC1", 1.0, [
+        _step(1, "passed"), _step(2, "failed"), _step(3, "skipped"), _step(4, "warning"), _step(5, "passed"),
+    ], "failed")
+    assert merge_run(str(tmp_path))["totals"] == {
+        "passed": 2, "failed": 1, "skipped": 1, "warning": 1, "done": 5, "total": 5,
+    }
+
+
+def test_totals_hanya_dari_attempt_terpilih(tmp_path):
+    Events(tmp_path, "1_a").case("TC1", 1.0, [_step(1, "failed"), _step(2, "failed")], "failed")
+    Events(tmp_path, "2_b").case("TC1", 2.0, [_step(1, "passed")], "passed")
+    Events(tmp_path, "2_b").case("TC2", 2.0, [_step(1, "passed")], "passed")
+    totals = merge_run(str(tmp_path))["totals"]
+    assert (totals["passed"], totals["failed"], totals["total"]) == (2, 0, 2)
+
+
+def test_baris_terpotong_dilewati(tmp_path):
+    events = Events(tmp_path, "1_a")
+    events.case("TC1", 1.0, [_step(1, "passed")])
+    with open(events.path, "a", encoding="utf-8") as f:
+        f.write('{"ev": "case_start", "case_id": "TC2"')   # worker mati di tengah write
+    merged = merge_run(str(tmp_path))
+    assert [c["case_id"] for c in merged["cases"]] == ["TC1"]
+
+
+def test_meta_dan_snapshot_lama(tmp_path):
+    Events(tmp_path, "1_a").emit("meta", meta={"project_name": "Demo"})
+    (tmp_path / "snapshot_old.json").write_text(json.dumps({
+        "meta": {"author": "qa"},
+        "cases": [{"case_id": "TC3", "status": "passed", "steps": [_step(1, "passed")]}],
+    }))
+    merged = merge_run(str(tmp_path))
+    assert merged["meta"] == {"project_name": "Demo", "author": "qa"}
+    assert [c["case_id"] for c in merged["cases"]] == ["TC3"]
+    assert merged["totals"]["passed"] == 1
@@ -0,0 +1,79 @@
+# tests/test_retry_policy.py
+import pytest
+from selenium.common.exceptions import (ElementClickInterceptedException, NoSuchElementException,
+                                        StaleElementReferenceException, TimeoutException)
+
+from core.retry_policy import DEFAULT_EXCEPTIONS, RetryPolicy
+
+GLOBALDATA = {"Retry": {
+    "MaxAttempts": 2, "Backoff": 0.5, "Multiplier": 2, "MaxBackoff": 1.5,
+    "Actions": {"click": {"MaxAttempts": 3, "Exceptions": ["intercepted"]}},
+}}
+
+
+def test_default_tanpa_retry():
+    policy = RetryPolicy.resolve({}, "click", {"Action": "click"})
+    assert policy.max_attempts == 1
+    assert policy.exceptions == DEFAULT_EXCEPTIONS
+    assert not policy.should_retry(StaleElementReferenceException(), 1)
+
+
+def test_global_dipakai_action_lain():
+    policy = RetryPolicy.resolve(GLOBALDATA, "type", {"Action": "type"})
+    assert (policy.max_attempts, policy.backoff) == (2, 0.5)
+    assert policy.should_retry(StaleElementReferenceException(), 1)
+    assert not policy.should_retry(StaleElementReferenceException(), 2)
+
+
+def test_action_override_global():
+    policy = RetryPolicy.resolve(GLOBALDATA, "click")
+    assert policy.max_attempts == 3
+    assert policy.backoff == 0.5   # field yang tidak di-override tetap dari global
+    assert policy.should_retry(ElementClickInterceptedException(), 2)
+    assert not policy.should_retry(StaleElementReferenceException(), 1)
+
+
+def test_step_int_cuma_max_attempts():
+    policy = RetryPolicy.resolve(GLOBALDATA, "click", {"Retry": 5})
+    assert policy.max_attempts == 5
+    assert policy.exceptions == ("intercepted",)
+
+
+def test_step_dict_override_semua_level():
+    step = {"Retry": {"Exceptions": "timeout", "Backoff": 0}}
+    policy = RetryPolicy.resolve(GLOBALDATA, "click", step)
+    assert policy.max_attempts == 3
+    assert policy.should_retry(TimeoutException(), 1)
+    assert not policy.should_retry(ElementClickInterceptedException(), 1)
+    assert policy.delay(1) == 0
+
+
+def test_nama_class_selenium_lengkap():
+    policy = RetryPolicy.from_config({"MaxAttempts": 2, "Exceptions": ["NoSuchElementException"]})
+    assert policy.should_retry(NoSuchElementException(), 1)
+
+
+def test_assertion_error_tidak_pernah_retry():
+    policy = RetryPolicy.resolve(GLOBALDATA, "assert", {"Retry": 3})
+    assert not policy.should_retry(AssertionError("beda"), 1)
+    assert not policy.should_retry(ValueError("data"), 1)
+
+
+def test_backoff_exponential_dengan_batas():
+    policy = RetryPolicy.resolve(GLOBALDATA, "type")
+    assert [policy.delay(n) for n in (1, 2, 3, 4)] == [0.5, 1.0, 1.5, 1.5]
+
+
+@pytest.mark.parametrize("config, message", [
+    ({"MaxAttempts": "dua"}, "Retry tidak valid"),
+    ({"Exceptions": ["flaky"]}, "exception tidak dikenal"),
+    (True, "Retry tidak valid"),
+    ([3], "Retry tidak valid"),
+])
+def test_config_tidak_valid(config, message):
+    with pytest.raises(ValueError, match=message):
+        RetryPolicy.resolve({}, "click", {"Retry": config})
+
+
+def test_max_attempts_minimal_satu():
+    assert RetryPolicy.from_config({"MaxAttempts": 0}).max_attempts == 1
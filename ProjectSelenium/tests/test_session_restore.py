@@ -0,0 +1,57 @@
+# tests/test_session_restore.py
+import pytest
+
+from core import generic_keywords
+from core.config_registry import ConfigRegistry
+from core.generic_keywords import GenericKeywords
+from core.session_store import SessionState, SessionStore
+
+SESSION = {"TTL": 1800, "Check": "{global.LogoutLink}",
+           "Logins": {"default": {"Title": "Login", "TestSteps": []}}}
+
+
+@pytest.fixture
+def keywords(monkeypatch):
+    """GenericKeywords tanpa browser: inject, Check, langkah login dan capture dicatat saja."""
+    calls = []
+    monkeypatch.setattr(ConfigRegistry, "global_data", classmethod(lambda cls: {"Session": SESSION}))
+    monkeypatch.setattr(SessionStore, "inject", staticmethod(lambda driver, state: calls.append("inject")))
+    monkeypatch.setattr(SessionStore, "capture", staticmethod(lambda driver: SessionState("http://app", [], {}, {})))
+    monkeypatch.setattr(GenericKeywords, "_run_login_steps", lambda self, case, timeout: calls.append("login"))
+    monkeypatch.setattr(GenericKeywords, "capture", lambda self, *args, **kwargs: "captured")
+    monkeypatch.setattr(generic_keywords, "ResultTracker", lambda: None)
+    SessionStore().invalidate()
+    kw = GenericKeywords(driver=None)
+    kw.calls = calls
+    kw.check_result = True
+    monkeypatch.setattr(kw, "_session_valid", lambda check, timeout: kw.check_result)
+    yield kw
+    SessionStore().invalidate()
+
+
+def test_restore_tanpa_state_gagal_tanpa_login(keywords):
+    with pytest.raises(ValueError, match="jalankan login_once 'default' dulu"):
+        keywords.restore_session("", 1)
+    assert keywords.calls == []
+
+
+def test_restore_pakai_state_login_once(keywords):
+    keywords.login_once("", 1)
+    assert keywords.restore_session("default", 1) == "captured"
+    assert keywords.calls == ["login", "inject"]
+
+
+def test_restore_check_hilang_gagal_dan_invalidate(keywords):
+    keywords.login_once("", 1)
+    keywords.check_result = False
+    with pytest.raises(AssertionError, match="tidak valid setelah restore"):
+        keywords.restore_session("", 1)
+    assert keywords.calls == ["login", "inject"]   # tidak fallback login
+    assert SessionStore().get("default") is None
+
+
+def test_restore_state_kadaluarsa_gagal(keywords):
+    keywords.login_once("", 1)
+    SessionStore().get("default").created -= 3600
+    with pytest.raises(ValueError, match="belum ada / kadaluarsa"):
+        keywords.restore_session("", 1)
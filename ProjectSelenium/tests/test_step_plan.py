@@ -0,0 +1,118 @@
+# tests/test_step_plan.py
+import pickle
+
+from selenium.webdriver.common.by import By
+
+import core.generic_keywords  # noqa: F401  (registrasi @keyword ke KEYWORDS)
+from core.step_plan import compile_testcase, render_template, resolve_locator
+
+GLOBALDATA = {"DefaultEmail": "a1@email.com", "Domain": "shop.test"}
+GLOBAL_LOCATORS = {
+    "LoginLink": {"LocatorType": "XPATH", "LocatorValue": "//a[@href='/login']"},
+    "EmailInput": {"LocatorType": "css", "LocatorValue": "input[data-domain='{global.Domain}']"},
+    "MenuItem": {"LocatorType": "link_text", "LocatorValue": "{value}"},
+}
+LOCATORS = {"locators": {
+    "LoginLink": {"LocatorType": "id", "LocatorValue": "login-local"},
+    "Broken": {"LocatorType": "shadow", "LocatorValue": "x"},
+}}
+
+
+def _case(*steps):
+    return {"CaseID": "TC001", "Title": "Login", "ScenarioType": "Positive", "TestSteps": list(steps)}
+
+
+def _compile(*steps, locators=LOCATORS):
+    return compile_testcase(_case(*steps), locators, GLOBALDATA, GLOBAL_LOCATORS)
+
+
+# -------------------- resolve_locator --------------------
+def test_locator_lokal_menang_dari_global():
+    assert resolve_locator("LoginLink", LOCATORS["locators"], GLOBALDATA, GLOBAL_LOCATORS) == \
+        ((By.ID, "login-local"), None)
+
+
+def test_global_ref_selalu_ke_global_locators():
+    assert resolve_locator("{global.LoginLink}", LOCATORS["locators"], GLOBALDATA, GLOBAL_LOCATORS) == \
+        ((By.XPATH, "//a[@href='/login']"), None)
+
+
+def test_global_ref_di_locator_value_diganti_globaldata():
+    locator, error = resolve_locator("EmailInput", {}, GLOBALDATA, GLOBAL_LOCATORS)
+    assert locator == (By.CSS_SELECTOR, "input[data-domain='shop.test']")
+    assert error is None
+
+
+def test_value_placeholder_pakai_test_data():
+    assert resolve_locator("MenuItem", {}, GLOBALDATA, GLOBAL_LOCATORS, "Products")[0] == (By.LINK_TEXT, "Products")
+
+
+def test_global_ref_tidak_ada():
+    locator, error = resolve_locator("{global.Nope}", {}, GLOBALDATA, GLOBAL_LOCATORS)
+    assert locator is None
+    assert "'Nope' tidak ditemukan di GlobalLocators" in error
+
+
+def test_nama_locator_tidak_ada():
+    locator, error = resolve_locator("Missing", {}, GLOBALDATA, GLOBAL_LOCATORS)
+    assert locator is None
+    assert "'Missing' tidak ditemukan" in error
+
+
+def test_locator_type_tidak_dikenal():
+    locator, error = resolve_locator("Broken", LOCATORS["locators"], GLOBALDATA, GLOBAL_LOCATORS)
+    assert locator is None
+    assert "LocatorType 'shadow' tidak dikenal" in error
+
+
+def test_locator_literal_dict_lama():
+    name = "{'LocatorType': 'name', 'LocatorValue': 'email'}"
+    assert resolve_locator(name, {}, GLOBALDATA, GLOBAL_LOCATORS)[0] == (By.NAME, "email")
+
+
+def test_render_template_global_tidak_ada_dibiarkan():
+    assert render_template("{global.DefaultEmail}/{global.Nope}", GLOBALDATA) == "a1@email.com/{global.Nope}"
+
+
+# -------------------- compile_testcase --------------------
+def test_compile_step_valid():
+    plan = _compile(
+        {"Title": "Buka login", "Action": "Click", "Locator": "{global.LoginLink}"},
+        {"Title": "Isi email", "Action": "type", "Locator": "EmailInput", "TestData": "{global.DefaultEmail}"},
+    )
+    assert plan.errors == []
+    click, typing = plan.steps
+    assert (click.method, click.args) == ("click", ((By.XPATH, "//a[@href='/login']"),))
+    assert typing.args == ((By.CSS_SELECTOR, "input[data-domain='shop.test']"), "a1@email.com")
+
+
+def test_compile_action_tidak_dikenal_tidak_raise():
+    plan = _compile(
+        {"Title": "ok", "Action": "click", "Locator": "LoginLink"},
+        {"Title": "salah", "Action": "tap", "Locator": "LoginLink"},
+    )
+    assert plan.errors == [(2, "[ERROR] Unknown action or missing locator: tap")]
+    assert plan.steps[0].error is None
+
+
+def test_compile_locator_hilang():
+    plan = _compile({"Title": "klik", "Action": "click", "Locator": "Missing"})
+    assert plan.steps[0].error == \
+        "Locator 'Missing' tidak ditemukan di locators lokal maupun GlobalLocators"
+
+
+def test_compile_locator_kosong():
+    plan = _compile({"Title": "klik", "Action": "click"})
+    assert plan.steps[0].error == "[ERROR] Unknown action or missing locator: click"
+
+
+def test_compile_drag_drop_target_kosong():
+    plan = _compile({"Title": "drag", "Action": "drag_drop", "Locator": "LoginLink"})
+    assert plan.steps[0].error == "[ERROR] Target locator kosong untuk action: drag_drop"
+
+
+def test_plan_bisa_di_pickle():
+    plan = _compile({"Title": "klik", "Action": "click", "Locator": "LoginLink"})
+    copy = pickle.loads(pickle.dumps(plan))
+    assert copy.steps[0].args == plan.steps[0].args
+    assert copy.case_id == "TC001"